@@ -1,5 +1,7 @@
 ﻿from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+
+from .backends import forget_cached_users
 from .models import User
 
 
@@ -89,18 +91,24 @@ class UserAdmin(BaseUserAdmin):
     def can_edit_content_label(self, obj):
         return "Да" if obj.can_edit_content else "Нет"
 
+    def _update_users(self, queryset, **values):
+        # QuerySet.update() sends no post_save, so drop the cached sessions' users here.
+        user_ids = list(queryset.values_list("pk", flat=True))
+        queryset.update(**values)
+        forget_cached_users(user_ids)
+
     @admin.action(description="Сделать выбранных сотрудниками staff")
     def make_staff(self, request, queryset):
-        queryset.update(is_staff=True)
+        self._update_users(queryset, is_staff=True)
 
     @admin.action(description="Снять staff у выбранных")
     def reset_staff_rights(self, request, queryset):
-        queryset.update(is_staff=False)
+        self._update_users(queryset, is_staff=False)
 
     @admin.action(description="Сделать преподавателями")
     def make_teacher(self, request, queryset):
-        queryset.update(role="teacher")
+        self._update_users(queryset, role="teacher")
 
     @admin.action(description="Назначить роль admin")
     def make_admin_role(self, request, queryset):
-        queryset.update(role="admin")
+        self._update_users(queryset, role="admin")
@@ -1,5 +1,33 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db.models import Case, Q, Value, When
+
+from .models import lower_equals
+
+
+def user_cache_key(user_id) -> str:
+    return f"auth_user:{user_id}"
+
+
+def forget_cached_users(user_ids) -> None:
+    """Drop cached users; called on save/delete and after bulk updates."""
+    cache.delete_many([user_cache_key(user_id) for user_id in user_ids])
+
+
+def find_user_by_identifier(identifier: str):
+    """
+    User whose email or username equals ``identifier`` ignoring case, in one
+    indexed query. An email match wins over a username match, as before.
+    """
+    email_match = lower_equals("email", identifier)
+    return (
+        get_user_model()
+        .objects.filter(Q(email_match) | Q(lower_equals("username", identifier)))
+        .order_by(Case(When(email_match, then=Value(0)), default=Value(1)), "id")
+        .first()
+    )
 
 
 class EmailOrUsernameBackend(ModelBackend):
@@ -10,13 +38,24 @@ class EmailOrUsernameBackend(ModelBackend):
         if isinstance(identifier, str):
             identifier = identifier.strip()
 
-        user_model = get_user_model()
-        user = (
-            user_model.objects.filter(email__iexact=identifier).order_by("id").first()
-            or user_model.objects.filter(username__iexact=identifier).order_by("id").first()
-        )
+        user = find_user_by_identifier(identifier)
         if not user:
             return None
         if user.check_password(password) and self.user_can_authenticate(user):
             return user
         return None
+
+    def get_user(self, user_id):
+        # AuthenticationMiddleware resolves the session's user on every request;
+        # serve it from the cache instead of a SELECT each time. Settings turn
+        # this off (timeout 0) unless the cache is shared by all workers.
+        timeout = settings.AUTH_USER_CACHE_TIMEOUT
+        if timeout <= 0:
+            return super().get_user(user_id)
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(user_id)
+            if user is not None:
+                cache.set(key, user, timeout)
+        return user
@@ -4,6 +4,8 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import AuthenticationForm, PasswordResetForm, UserCreationForm
 from django.core.exceptions import ValidationError
 
+from .models import lower_equals
+
 User = get_user_model()
 
 
@@ -58,7 +60,7 @@ class SignupForm(UserCreationForm):
         if not username:
             return username
 
-        existing = User.objects.filter(username__iexact=username).first()
+        existing = User.objects.filter(lower_equals("username", username)).first()
         if existing:
             if existing.is_active:
                 raise ValidationError("Пользователь с таким именем уже существует.")
@@ -70,7 +72,7 @@ class SignupForm(UserCreationForm):
         if not email:
             raise ValidationError("Введите email.")
 
-        existing = User.objects.filter(email__iexact=email).first()
+        existing = User.objects.filter(lower_equals("email", email)).first()
         if existing:
             if existing.is_active:
                 raise ValidationError("Пользователь с таким email уже существует.")
@@ -89,14 +91,9 @@ class LoginForm(AuthenticationForm):
         username_or_email = (self.cleaned_data.get("username") or "").strip()
         password = self.cleaned_data.get("password")
 
-        lookup_username = username_or_email
-        if username_or_email and "@" in username_or_email:
-            user = User.objects.filter(email__iexact=username_or_email).first()
-            if user:
-                lookup_username = user.username
-
-        self.cleaned_data["username"] = lookup_username
-        user = authenticate(self.request, username=lookup_username, password=password)
+        # EmailOrUsernameBackend resolves emails and usernames in one query.
+        self.cleaned_data["username"] = username_or_email
+        user = authenticate(self.request, username=username_or_email, password=password)
         if user is None:
             raise ValidationError(
                 self.error_messages["invalid_login"],
@@ -136,7 +133,7 @@ class PasswordResetIdentifierForm(PasswordResetForm):
             return identifier
 
         user = (
-            User.objects.filter(username__iexact=identifier, is_active=True)
+            User.objects.filter(lower_equals("username", identifier), is_active=True)
             .exclude(email="")
             .first()
         )
@@ -0,0 +1,96 @@
+import random
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q
+
+from accounts.backends import find_user_by_identifier
+from accounts.models import lower_equals
+
+User = get_user_model()
+
+
+def _legacy_lookup(identifier: str):
+    # The lookup EmailOrUsernameBackend used before the Lower() indexes.
+    return (
+        User.objects.filter(email__iexact=identifier).order_by("id").first()
+        or User.objects.filter(username__iexact=identifier).order_by("id").first()
+    )
+
+
+def _timings_ms(lookup, identifiers) -> list[float]:
+    timings = []
+    for identifier in identifiers:
+        started = time.perf_counter()
+        lookup(identifier)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure login lookup latency against a large user table. Users are created "
+        "inside a transaction that is rolled back; nothing is kept."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=50_000)
+        parser.add_argument("--lookups", type=int, default=300)
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument("--seed", type=int, default=46)
+
+    def handle(self, *args, **options):
+        total = max(1, options["users"])
+        rng = random.Random(options["seed"])
+        with transaction.atomic():
+            self._seed(total, options["batch_size"])
+            with connection.cursor() as cursor:
+                # Fresh statistics so the planner sees the real table size.
+                cursor.execute(f"ANALYZE {connection.ops.quote_name(User._meta.db_table)}")
+
+            identifiers = []
+            for _ in range(max(1, options["lookups"])):
+                index = rng.randrange(total)
+                # Mixed case and a mix of emails, usernames and unknown logins.
+                identifiers.append(
+                    rng.choice(
+                        [f"BENCH.USER{index}@EXAMPLE.KZ", f"Bench_User_{index}", f"missing_{index}@example.kz"]
+                    )
+                )
+
+            self._report("iexact (before)", _timings_ms(_legacy_lookup, identifiers))
+            self._report("Lower() index", _timings_ms(find_user_by_identifier, identifiers))
+            self.stdout.write("Query plan:")
+            self.stdout.write(self._plan(identifiers[0]))
+            transaction.set_rollback(True)
+
+    def _seed(self, total: int, batch_size: int) -> None:
+        password = make_password("benchmark-password")
+        started = time.perf_counter()
+        for start in range(0, total, batch_size):
+            User.objects.bulk_create(
+                User(
+                    username=f"bench_user_{index}",
+                    email=f"bench.user{index}@example.kz",
+                    password=password,
+                    role=User.Role.TEACHER,
+                )
+                for index in range(start, min(start + batch_size, total))
+            )
+        self.stdout.write(f"Seeded {total} users in {time.perf_counter() - started:.1f} s (rolled back at the end).")
+
+    def _plan(self, identifier: str) -> str:
+        queryset = User.objects.filter(Q(lower_equals("email", identifier)) | Q(lower_equals("username", identifier)))
+        return queryset.explain()
+
+    def _report(self, label: str, timings: list[float]) -> None:
+        ordered = sorted(timings)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        self.stdout.write(
+            f"{label:<16} mean {statistics.mean(timings):7.3f} ms   p95 {p95:7.3f} ms   "
+            f"max {ordered[-1]:7.3f} ms   ({len(timings)} lookups)"
+        )
@@ -1,8 +1,9 @@
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import RegexValidator
 from django.db import models
-from django.db.models import Q
+from django.db.models import Q, Value
 from django.db.models.functions import Lower
+from django.db.models.lookups import Exact
 from django.utils.translation import gettext_lazy as _
 
 
@@ -16,6 +17,15 @@ username_validator = RegexValidator(
 )
 
 
+def lower_equals(field: str, value: str) -> Exact:
+    """
+    Case-insensitive ``field == value`` as ``LOWER(field) = LOWER(value)``, which
+    can use the ``Lower(field)`` indexes below; ``iexact`` compiles to
+    ``UPPER()``/``LIKE`` and scans the table.
+    """
+    return Exact(Lower(field), Lower(Value(value)))
+
+
 class User(AbstractUser):
     username = models.CharField(
         _("username"),
@@ -112,3 +122,7 @@ class User(AbstractUser):
                 condition=~Q(email=""),
             ),
         ]
+        indexes = [
+            models.Index(Lower("username"), name="user_username_lower_idx"),
+            models.Index(Lower("email"), name="user_email_lower_idx"),
+        ]
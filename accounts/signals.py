@@ -0,0 +1,14 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .backends import forget_cached_users
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User, dispatch_uid="auth_user_cache_saved")
+@receiver(post_delete, sender=User, dispatch_uid="auth_user_cache_deleted")
+def user_changed(sender, instance, **kwargs):
+    # Password, role and is_active changes must reach the next request at once.
+    forget_cached_users([instance.pk])
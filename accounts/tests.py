@@ -1,7 +1,13 @@
+from django.contrib.admin.sites import site
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+from accounts.admin import UserAdmin
+from accounts.backends import find_user_by_identifier, user_cache_key
 from accounts.forms import PasswordResetIdentifierForm, SignupForm
 
 
@@ -89,3 +95,86 @@ class PasswordResetRouteTests(TestCase):
         )
 
         self.assertEqual(url, "/accounts/reset/abc123/set-password/")
+
+
+# A single test process, so locmem behaves like the shared cache these settings need.
+@override_settings(
+    AUTH_USER_CACHE_TIMEOUT=300,
+    SESSION_ENGINE="django.contrib.sessions.backends.cached_db",
+)
+class CachedSessionUserTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="cached_user", password="pass1234", role="teacher")
+        self.client.force_login(self.user)
+        self.client.get(reverse("workflow_guide"))
+
+    def test_logged_in_page_reads_neither_session_nor_user_table(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("workflow_guide"))
+
+        self.assertEqual(response.status_code, 200)
+        # Only the sidebar notifications remain.
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertIn('FROM "core_notification"', ctx.captured_queries[0]["sql"])
+
+    def test_saved_user_is_reloaded(self):
+        self.user.role = "dean"
+        self.user.save()
+
+        response = self.client.get(reverse("workflow_guide"))
+
+        self.assertEqual(response.wsgi_request.user.role, "dean")
+
+    def test_admin_bulk_action_drops_cached_users(self):
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertTrue(self.client.get(reverse("workflow_guide")).wsgi_request.user.is_authenticated)
+
+        UserAdmin(User, site)._update_users(User.objects.filter(pk=self.user.pk), role="admin")
+
+        self.assertFalse(self.client.get(reverse("workflow_guide")).wsgi_request.user.is_authenticated)
+
+
+class UncachedSessionUserTests(TestCase):
+    def test_user_is_read_from_the_table_when_caching_is_off(self):
+        cache.clear()
+        user = User.objects.create_user(username="plain_user", password="pass1234", role="teacher")
+        self.client.force_login(user)
+
+        with override_settings(AUTH_USER_CACHE_TIMEOUT=0):
+            self.client.get(reverse("workflow_guide"))
+            User.objects.filter(pk=user.pk).update(role="dean")
+            response = self.client.get(reverse("workflow_guide"))
+
+        self.assertIsNone(cache.get(user_cache_key(user.pk)))
+        self.assertEqual(response.wsgi_request.user.role, "dean")
+
+
+class IdentifierLookupTests(TestCase):
+    def setUp(self):
+        self.by_email = User.objects.create_user(
+            username="aigerim", email="Login.Case@Example.kz", password="pass1234", role="teacher"
+        )
+        self.by_username = User.objects.create_user(
+            username="login.case@example.kz", email="other@example.kz", password="pass1234", role="teacher"
+        )
+
+    def test_lookup_is_one_lower_query_and_prefers_email(self):
+        with CaptureQueriesContext(connection) as ctx:
+            user = find_user_by_identifier("LOGIN.CASE@EXAMPLE.KZ")
+
+        self.assertEqual(user, self.by_email)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertIn("LOWER(", ctx.captured_queries[0]["sql"])
+        self.assertNotIn("LIKE", ctx.captured_queries[0]["sql"])
+        self.assertEqual(find_user_by_identifier("AIGERIM"), self.by_email)
+        self.assertIsNone(find_user_by_identifier("nobody"))
+
+    def test_login_with_email_in_any_case(self):
+        response = self.client.post(
+            reverse("login"),
+            {"username": "login.case@EXAMPLE.kz", "password": "pass1234"},
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(int(self.client.session["_auth_user_id"]), self.by_email.pk)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AiCheckerConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'ai_checker'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -1,12 +1,16 @@
+import hashlib
 import os
 import re
 import threading
 from pathlib import Path
 
+from core.cache import get_or_build
+
 # ИСПРАВЛЕНИЕ: Импортируем новые функции из services
 from .llm import generate_text, get_model_name
 from .services import build_syllabus_text_from_db, extract_text_from_file
 
+GUIDELINES_NAMESPACE = "guidelines"
 _GUIDELINES = None
 _GUIDELINES_LOCK = threading.Lock()
 _ENV_LOADED = False
@@ -433,7 +437,49 @@ def _trim_guidelines(text: str, limit: int = _GUIDELINES_LIMIT) -> str:
     return cleaned[:limit]
 
 
+def _guideline_paths() -> tuple[Path, Path]:
+    root = Path(__file__).resolve().parents[1]
+    txt_path = Path(os.getenv("SYLLABUS_GUIDELINES_PATH", root / "docs" / "syllabus_guidelines.txt"))
+    pdf_path = Path(os.getenv("SYLLABUS_GUIDELINES_PDF", root / "Sillabus it sturtup.pdf"))
+    return txt_path, pdf_path
+
+
+def _guidelines_cache_key(txt_path: Path, pdf_path: Path) -> str:
+    # Paths, modification times and limits: editing a source file changes the key.
+    parts = [str(_GUIDELINES_LIMIT), str(_PDF_GUIDELINES_LIMIT), str(_PDF_GUIDELINES_PAGES)]
+    for path in (txt_path, pdf_path):
+        try:
+            stamp = path.stat().st_mtime_ns
+        except OSError:
+            stamp = 0
+        parts.append(f"{path}:{stamp}")
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:16]
+
+
+def _read_guidelines(txt_path: Path, pdf_path: Path) -> str:
+    guidelines = ""
+    if txt_path.exists():
+        guidelines = _load_guidelines_from_txt(txt_path)
+
+    pdf_excerpt = ""
+    if pdf_path.exists():
+        pdf_excerpt = _extract_guidelines_from_pdf(pdf_path)
+
+    if not guidelines and pdf_excerpt:
+        guidelines = pdf_excerpt
+    elif guidelines and pdf_excerpt:
+        guidelines = f"{guidelines}\n\nКраткий фрагмент из PDF:\n{pdf_excerpt}"
+
+    if not guidelines:
+        return _DEFAULT_GUIDELINES
+    return _trim_guidelines(guidelines)
+
+
 def load_guidelines() -> str:
+    """
+    Guidelines text for prompts. Kept per process and in the shared cache, so
+    the PDF excerpt is parsed once per deploy (``warm_caches``), not per process.
+    """
     global _GUIDELINES
     if _GUIDELINES is not None:
         return _GUIDELINES
@@ -442,29 +488,13 @@ def load_guidelines() -> str:
         if _GUIDELINES is not None:
             return _GUIDELINES
 
-        root = Path(__file__).resolve().parents[1]
-        txt_path = Path(os.getenv("SYLLABUS_GUIDELINES_PATH", root / "docs" / "syllabus_guidelines.txt"))
-        pdf_path = Path(os.getenv("SYLLABUS_GUIDELINES_PDF", root / "Sillabus it sturtup.pdf"))
-
-        guidelines = ""
-        if txt_path.exists():
-            guidelines = _load_guidelines_from_txt(txt_path)
-
-        pdf_excerpt = ""
-        if pdf_path.exists():
-            pdf_excerpt = _extract_guidelines_from_pdf(pdf_path)
-
-        if not guidelines and pdf_excerpt:
-            guidelines = pdf_excerpt
-        elif guidelines and pdf_excerpt:
-            guidelines = f"{guidelines}\n\nКраткий фрагмент из PDF:\n{pdf_excerpt}"
-
-        if not guidelines:
-            guidelines = _DEFAULT_GUIDELINES
-        else:
-            guidelines = _trim_guidelines(guidelines)
-
-        _GUIDELINES = guidelines
+        txt_path, pdf_path = _guideline_paths()
+        _GUIDELINES = get_or_build(
+            GUIDELINES_NAMESPACE,
+            _guidelines_cache_key(txt_path, pdf_path),
+            lambda: _read_guidelines(txt_path, pdf_path),
+            timeout=None,
+        )
         return _GUIDELINES
 
 
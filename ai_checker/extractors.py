@@ -0,0 +1,101 @@
+"""
+Lazy access to the optional text extraction libraries.
+
+markitdown and pypdf cost about half a second and tens of megabytes to import,
+and only the AI worker parses files. They are imported on first use; the web
+tier uses the availability checks and feedback helpers here, which import
+nothing heavy (``find_spec`` locates a package without executing it).
+"""
+
+import html
+import importlib.util
+from functools import cache
+
+_EXTRACTION_FAILURE_FEEDBACK: dict[str, str] = {}
+
+
+@cache
+def is_installed(module_name: str) -> bool:
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+@cache
+def markitdown_class():
+    """``markitdown.MarkItDown`` or ``None`` when the package is missing."""
+    try:
+        # Better extraction quality for DOCX/PDF when available.
+        from markitdown import MarkItDown
+    except ImportError:
+        return None
+    return MarkItDown
+
+
+@cache
+def pypdf_module():
+    """The ``pypdf`` module or ``None`` when it is missing."""
+    try:
+        # Fallback extractor for PDF.
+        import pypdf
+    except ImportError:
+        return None
+    return pypdf
+
+
+def _extractor_dependency_status() -> tuple[dict[str, bool], list[str]]:
+    available = {
+        "markitdown": is_installed("markitdown"),
+        "pypdf": is_installed("pypdf"),
+    }
+    missing = [name for name, ok in available.items() if not ok]
+    return available, missing
+
+
+def _cache_extraction_feedback(file_path: str, feedback: str | None) -> None:
+    if not file_path:
+        return
+    if feedback:
+        _EXTRACTION_FAILURE_FEEDBACK[file_path] = feedback
+    else:
+        _EXTRACTION_FAILURE_FEEDBACK.pop(file_path, None)
+
+
+def _cached_extraction_feedback(file_path: str) -> str | None:
+    return _EXTRACTION_FAILURE_FEEDBACK.get(file_path or "")
+
+
+def _extract_dependency_state(ok: bool) -> str:
+    return "✅ установлена" if ok else "❌ не установлена"
+
+
+def _missing_extractor_feedback(file_path: str) -> str | None:
+    lower_path = (file_path or "").lower()
+    cached_feedback = _cached_extraction_feedback(file_path)
+    if cached_feedback:
+        return cached_feedback
+
+    if lower_path.endswith(".pdf"):
+        _deps, missing = _extractor_dependency_status()
+        if missing:
+            missing_text = ", ".join(missing)
+            return (
+                "<h3>Ошибка AI-проверки</h3>"
+                "<p>Не хватает библиотек для чтения PDF.</p>"
+                f"<p>Отсутствуют: <code>{html.escape(missing_text)}</code>.</p>"
+                "<p>Установите их: <code>pip install -r requirements-ai.txt</code> и перезапустите "
+                "<code>run_worker</code>, затем повторно отправьте файл на AI-проверку.</p>"
+                "<p>Проверка установленных библиотек внутри текущего окружения:</p>"
+                f"<ul><li>markitdown: {_extract_dependency_state(_deps['markitdown'])}</li>"
+                f"<li>pypdf: {_extract_dependency_state(_deps['pypdf'])}</li></ul>"
+            )
+
+    if lower_path.endswith(".doc"):
+        return (
+            "<h3>Ошибка AI-проверки</h3>"
+            "<p>Формат <code>.doc</code> поддерживается неустойчиво.</p>"
+            "<p>Сохраните документ в <code>.docx</code> или PDF и повторите проверку.</p>"
+        )
+
+    return None
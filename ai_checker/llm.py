@@ -1,31 +1,23 @@
 import os
 import threading
 import logging
+import time
 from pathlib import Path
+from urllib.parse import urlsplit
+
+from core.metrics import LLM_REQUEST_DURATION, LLM_REQUEST_ERRORS
 
 # Configure module logger.
 logger = logging.getLogger(__name__)
 
-try:
-    import httpx
-except Exception as exc:  # pragma: no cover - optional dependency
-    httpx = None
-    _HTTPX_IMPORT_ERROR = exc
-else:
-    _HTTPX_IMPORT_ERROR = None
-
 try:
     from dotenv import load_dotenv
 except Exception:  # pragma: no cover - optional dependency
     load_dotenv = None
 
-try:
-    from llama_cpp import Llama
-except Exception as exc:  # pragma: no cover - import-time error surfaced on use
-    Llama = None
-    _LLAMA_IMPORT_ERROR = exc
-else:
-    _LLAMA_IMPORT_ERROR = None
+# httpx and llama_cpp are imported on first use: web processes import this
+# module through ai_checker.services but never call the model.
+_LLAMA_IMPORT_ERROR = None
 
 _LLM = None
 _INIT_LOCK = threading.Lock()
@@ -33,6 +25,24 @@ _RUN_LOCK = threading.Lock()
 _ENV_LOADED = False
 
 
+def _httpx():
+    try:
+        import httpx
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    return httpx
+
+
+def _llama_class():
+    global _LLAMA_IMPORT_ERROR
+    try:
+        from llama_cpp import Llama
+    except Exception as exc:  # pragma: no cover - import error surfaced on use
+        _LLAMA_IMPORT_ERROR = exc
+        return None
+    return Llama
+
+
 def _ensure_env_loaded() -> None:
     global _ENV_LOADED
     if _ENV_LOADED:
@@ -84,6 +94,15 @@ def _use_remote() -> bool:
     return _remote_config() is not None
 
 
+def _provider_label() -> str:
+    """Metrics label of the remote provider: LLM_PROVIDER, or the API host in auto mode."""
+    provider = os.getenv("LLM_PROVIDER", "auto").strip().lower()
+    if provider not in {"", "auto", "remote", "api"}:
+        return provider
+    config = _remote_config() or {}
+    return urlsplit(config.get("api_url", "")).hostname or "remote"
+
+
 def _split_prompt(prompt: str) -> tuple[str, str]:
     """Split prompt to system/user sections for API payload."""
     if "<|im_start|>system" not in prompt:
@@ -109,6 +128,7 @@ def _generate_remote_text(
     temperature: float,
     top_p: float,
 ) -> str:
+    httpx = _httpx()
     if httpx is None:
         raise RuntimeError(
             "Remote LLM mode requires httpx. Install it from requirements-ai.txt."
@@ -206,7 +226,8 @@ def warmup_llm() -> str:
     return get_model_name()
 
 
-def get_llm() -> "Llama":
+def get_llm():
+    Llama = _llama_class()
     if Llama is None:
         raise RuntimeError(
             "llama-cpp-python is not installed or failed to import: "
@@ -267,22 +288,34 @@ def generate_text(
     """
     # 1. Try remote API first when enabled.
     if _use_remote():
+        provider = _provider_label()
+        started = time.perf_counter()
         try:
             return _generate_remote_text(prompt, max_tokens, temperature, top_p)
         except Exception as e:
             # If remote fails, rethrow. No local fallback is executed unless
             # provider is configured to allow it.
             logger.error(f"Remote generation failed: {e}")
+            LLM_REQUEST_ERRORS.inc(provider=provider)
             raise e
+        finally:
+            LLM_REQUEST_DURATION.observe(time.perf_counter() - started, provider=provider)
 
     # 2. Fallback to local model when remote is disabled.
-    llm = get_llm()
-    with _RUN_LOCK:
-        output = llm(
-            prompt,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            top_p=top_p,
-            stop=["<|im_end|>"],
-        )
+    started = time.perf_counter()
+    try:
+        llm = get_llm()
+        with _RUN_LOCK:
+            output = llm(
+                prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+                stop=["<|im_end|>"],
+            )
+    except Exception:
+        LLM_REQUEST_ERRORS.inc(provider="local")
+        raise
+    finally:
+        LLM_REQUEST_DURATION.observe(time.perf_counter() - started, provider="local")
     return output["choices"][0]["text"].strip()
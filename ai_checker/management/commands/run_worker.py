@@ -16,10 +16,13 @@ except ImportError:
 from django.core.management.base import BaseCommand
 from django.db import connection
 from django.db.utils import OperationalError, ProgrammingError
+from django.utils import timezone
 
 from ai_checker.llm import warmup_llm
 from ai_checker.services import run_ai_check
+from core.metrics import WORKER_JOB_WAIT
 from syllabi.models import Syllabus
+from syllabi.pdf_jobs import claim_next_job, process_job, requeue_stale_jobs
 from workflow.services import change_status_system
 
 
@@ -40,7 +43,7 @@ WORKER_VERBOSE = _env_bool("AI_WORKER_VERBOSE", True)
 
 
 class Command(BaseCommand):
-    help = "Run background AI syllabus checks."
+    help = "Run background AI syllabus checks and queued PDF renders."
 
     def _acquire_worker_lock(self):
         WORKER_LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -98,6 +101,85 @@ class Command(BaseCommand):
             )
         )
 
+    def _process_pdf_job(self) -> bool:
+        try:
+            job = claim_next_job()
+        except (OperationalError, ProgrammingError):
+            return False
+        if job is None:
+            return False
+
+        if process_job(job):
+            self.stdout.write(self.style.SUCCESS(f"Syllabus {job.syllabus_id}: PDF rendered."))
+        else:
+            self.stdout.write(self.style.ERROR(f"Syllabus {job.syllabus_id}: PDF render failed: {job.error}"))
+        return True
+
+    def _next_ai_check(self):
+        return Syllabus.objects.filter(status=Syllabus.Status.AI_CHECK).order_by("updated_at").first()
+
+    def _process_ai_check(self, syllabus):
+        """Check one queued syllabus and move it to dean review or back to correction."""
+        # updated_at is the submission time: the status change to ai_check saved it.
+        WORKER_JOB_WAIT.observe(
+            max(0.0, (timezone.now() - syllabus.updated_at).total_seconds()),
+            queue="ai_check",
+        )
+        self.stdout.write(
+            self.style.WARNING(
+                f"Found syllabus ID {syllabus.id}. Starting AI check..."
+            )
+        )
+
+        try:
+            result_record = run_ai_check(syllabus)
+            raw_data = result_record.raw_result or {}
+            is_approved = raw_data.get("approved", False)
+
+            if is_approved:
+                change_status_system(
+                    syllabus,
+                    Syllabus.Status.REVIEW_DEAN,
+                    comment="Automatic AI review passed.",
+                    ai_feedback=syllabus.ai_feedback,
+                )
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Syllabus {syllabus.id}: passed and sent to dean review."
+                    )
+                )
+            else:
+                change_status_system(
+                    syllabus,
+                    Syllabus.Status.CORRECTION,
+                    comment="Returned after automatic AI review.",
+                    ai_feedback=syllabus.ai_feedback,
+                )
+                self.stdout.write(
+                    self.style.ERROR(
+                        f"Syllabus {syllabus.id}: issues found, returned for correction."
+                    )
+                )
+
+        except Exception as exc:
+            self.stdout.write(
+                self.style.ERROR(
+                    f"Error while processing syllabus {syllabus.id}: {exc}"
+                )
+            )
+            failure_feedback = f"Critical AI review error: {exc}"
+            try:
+                change_status_system(
+                    syllabus,
+                    Syllabus.Status.CORRECTION,
+                    comment="Automatic AI review failed with a critical error.",
+                    ai_feedback=failure_feedback,
+                )
+            except Exception:
+                syllabus.status = Syllabus.Status.CORRECTION
+                syllabus.ai_feedback = failure_feedback
+                syllabus.save(update_fields=["status", "ai_feedback"])
+
     def handle(self, *args, **options):
         lock_handle = self._acquire_worker_lock()
         if lock_handle is None:
@@ -127,6 +209,13 @@ class Command(BaseCommand):
 
         missing_table_reported = False
 
+        try:
+            stale_jobs = requeue_stale_jobs()
+            if stale_jobs:
+                self.stdout.write(self.style.WARNING(f"Requeued {stale_jobs} interrupted PDF render job(s)."))
+        except (OperationalError, ProgrammingError):
+            pass
+
         try:
             while True:
                 if not self._syllabus_table_ready():
@@ -139,11 +228,7 @@ class Command(BaseCommand):
                 missing_table_reported = False
 
                 try:
-                    syllabus = (
-                        Syllabus.objects.filter(status=Syllabus.Status.AI_CHECK)
-                        .order_by("updated_at")
-                        .first()
-                    )
+                    syllabus = self._next_ai_check()
                 except (OperationalError, ProgrammingError) as exc:
                     error_text = str(exc).lower()
                     if (
@@ -158,63 +243,12 @@ class Command(BaseCommand):
                     raise
 
                 if not syllabus:
-                    time.sleep(IDLE_SLEEP_SECONDS)
+                    # AI checks first; PDF renders use the idle time between them.
+                    if not self._process_pdf_job():
+                        time.sleep(IDLE_SLEEP_SECONDS)
                     continue
 
-                self.stdout.write(
-                    self.style.WARNING(
-                        f"Found syllabus ID {syllabus.id}. Starting AI check..."
-                    )
-                )
-
-                try:
-                    result_record = run_ai_check(syllabus)
-                    raw_data = result_record.raw_result or {}
-                    is_approved = raw_data.get("approved", False)
-
-                    if is_approved:
-                        change_status_system(
-                            syllabus,
-                            Syllabus.Status.REVIEW_DEAN,
-                            comment="Automatic AI review passed.",
-                            ai_feedback=syllabus.ai_feedback,
-                        )
-                        self.stdout.write(
-                            self.style.SUCCESS(
-                                f"Syllabus {syllabus.id}: passed and sent to dean review."
-                            )
-                        )
-                    else:
-                        change_status_system(
-                            syllabus,
-                            Syllabus.Status.CORRECTION,
-                            comment="Returned after automatic AI review.",
-                            ai_feedback=syllabus.ai_feedback,
-                        )
-                        self.stdout.write(
-                            self.style.ERROR(
-                                f"Syllabus {syllabus.id}: issues found, returned for correction."
-                            )
-                        )
-
-                except Exception as exc:
-                    self.stdout.write(
-                        self.style.ERROR(
-                            f"Error while processing syllabus {syllabus.id}: {exc}"
-                        )
-                    )
-                    failure_feedback = f"Critical AI review error: {exc}"
-                    try:
-                        change_status_system(
-                            syllabus,
-                            Syllabus.Status.CORRECTION,
-                            comment="Automatic AI review failed with a critical error.",
-                            ai_feedback=failure_feedback,
-                        )
-                    except Exception:
-                        syllabus.status = Syllabus.Status.CORRECTION
-                        syllabus.ai_feedback = failure_feedback
-                        syllabus.save(update_fields=["status", "ai_feedback"])
+                self._process_ai_check(syllabus)
 
         except KeyboardInterrupt:
             self.stdout.write(self.style.SUCCESS("\nWorker stopped."))
@@ -8,26 +8,23 @@ import zipfile
 from datetime import date
 from xml.etree import ElementTree
 
-try:
-    # Better extraction quality for DOCX/PDF when available.
-    from markitdown import MarkItDown
-except ImportError:
-    MarkItDown = None
-
-try:
-    # Fallback extractor for PDF.
-    import pypdf
-except ImportError:
-    pypdf = None
-
+from core.cache import get_or_build
+from core.metrics import AI_CHECK_DURATION, TEXT_EXTRACTION_DURATION
 from syllabi.models import Syllabus
 
+from .extractors import (
+    _cache_extraction_feedback,
+    _missing_extractor_feedback,
+    markitdown_class,
+    pypdf_module,
+)
 from .llm import generate_text, get_model_name
 from .models import AiCheckResult
 
 logger = logging.getLogger(__name__)
-_EXTRACTION_FAILURE_FEEDBACK: dict[str, str] = {}
 DEFAULT_STUDY_WEEKS = 12
+SYLLABUS_TEXT_NAMESPACE = "syllabus_text"
+SYLLABUS_TEXT_CACHE_SECONDS = 3600
 
 
 def _env_int(name: str, default: int, min_value: int = 1) -> int:
@@ -279,28 +276,6 @@ def _contains_any(text: str, markers: tuple[str, ...]) -> bool:
     return any(marker in text for marker in markers)
 
 
-def _extractor_dependency_status() -> tuple[dict[str, bool], list[str]]:
-    available = {
-        "markitdown": MarkItDown is not None,
-        "pypdf": pypdf is not None,
-    }
-    missing = [name for name, ok in available.items() if not ok]
-    return available, missing
-
-
-def _cache_extraction_feedback(file_path: str, feedback: str | None) -> None:
-    if not file_path:
-        return
-    if feedback:
-        _EXTRACTION_FAILURE_FEEDBACK[file_path] = feedback
-    else:
-        _EXTRACTION_FAILURE_FEEDBACK.pop(file_path, None)
-
-
-def _cached_extraction_feedback(file_path: str) -> str | None:
-    return _EXTRACTION_FAILURE_FEEDBACK.get(file_path or "")
-
-
 def _feedback_for_markitdown_exception(file_path: str, exc: Exception) -> str | None:
     lower_path = (file_path or "").lower()
     message = str(exc or "")
@@ -681,41 +656,6 @@ def _build_formal_markdown_result(source_text: str, expected_weeks: int = DEFAUL
     }
 
 
-def _missing_extractor_feedback(file_path: str) -> str | None:
-    lower_path = (file_path or "").lower()
-    cached_feedback = _cached_extraction_feedback(file_path)
-    if cached_feedback:
-        return cached_feedback
-
-    if lower_path.endswith(".pdf"):
-        _deps, missing = _extractor_dependency_status()
-        if missing:
-            missing_text = ", ".join(missing)
-            return (
-                "<h3>Ошибка AI-проверки</h3>"
-                "<p>Не хватает библиотек для чтения PDF.</p>"
-                f"<p>Отсутствуют: <code>{html.escape(missing_text)}</code>.</p>"
-                "<p>Установите их: <code>pip install -r requirements-ai.txt</code> и перезапустите "
-                "<code>run_worker</code>, затем повторно отправьте файл на AI-проверку.</p>"
-                "<p>Проверка установленных библиотек внутри текущего окружения:</p>"
-                f"<ul><li>markitdown: {_extract_dependency_state(_deps['markitdown'])}</li>"
-                f"<li>pypdf: {_extract_dependency_state(_deps['pypdf'])}</li></ul>"
-            )
-
-    if lower_path.endswith(".doc"):
-        return (
-            "<h3>Ошибка AI-проверки</h3>"
-            "<p>Формат <code>.doc</code> поддерживается неустойчиво.</p>"
-            "<p>Сохраните документ в <code>.docx</code> или PDF и повторите проверку.</p>"
-        )
-
-    return None
-
-
-def _extract_dependency_state(ok: bool) -> str:
-    return "✅ установлена" if ok else "❌ не установлена"
-
-
 def _humanize_runtime_error(exc: Exception) -> str:
     message = str(exc or "").strip()
     plain = message.lower()
@@ -771,10 +711,20 @@ def _humanize_runtime_error_legacy(exc: Exception) -> str:
     return f"<h3>AI Check Error</h3><p>{body}</p>"
 
 
+def _file_type(file_path: str) -> str:
+    suffix = os.path.splitext(file_path)[1].lower().lstrip(".")
+    return suffix if suffix in {"pdf", "docx", "doc"} else "other"
+
+
 def extract_text_from_file(file_path: str) -> str:
     """Extract text from file with a fast path for PDF."""
     if not os.path.exists(file_path):
         return ""
+    with TEXT_EXTRACTION_DURATION.time(file_type=_file_type(file_path)):
+        return _extract_text_from_file(file_path)
+
+
+def _extract_text_from_file(file_path: str) -> str:
 
     _cache_extraction_feedback(file_path, None)
 
@@ -782,6 +732,7 @@ def extract_text_from_file(file_path: str) -> str:
     is_pdf = lower_path.endswith(".pdf")
     is_docx = lower_path.endswith(".docx")
     pypdf_tried = False
+    pypdf = pypdf_module() if is_pdf else None
 
     if is_docx:
         text = _extract_text_from_docx(file_path)
@@ -807,6 +758,7 @@ def extract_text_from_file(file_path: str) -> str:
         except Exception as exc:
             logger.warning("pypdf extract error (fast path): %s", exc)
 
+    MarkItDown = markitdown_class()
     if MarkItDown:
         try:
             md = MarkItDown()
@@ -839,7 +791,7 @@ def extract_text_from_file(file_path: str) -> str:
     return ""
 
 
-def build_syllabus_text_from_db(syllabus: Syllabus) -> str:
+def _render_syllabus_text(syllabus: Syllabus) -> str:
     parts = [
         f"Syllabus: {syllabus.course.code}",
         f"Semester: {syllabus.semester}",
@@ -867,8 +819,11 @@ def build_syllabus_text_from_db(syllabus: Syllabus) -> str:
     if policy_text:
         parts.append(f"\nCourse policy:\n{policy_text}")
 
-    topics = syllabus.syllabus_topics.filter(is_included=True).order_by("week_number")
-    if topics.exists():
+    # st.syllabus is filled in by the related manager, st.topic by select_related.
+    topics = list(
+        syllabus.syllabus_topics.filter(is_included=True).select_related("topic").order_by("week_number")
+    )
+    if topics:
         parts.append("\nTopics:")
         for st in topics:
             topic_line = f"Week {st.week_number}: {st.get_title()}"
@@ -895,6 +850,23 @@ def build_syllabus_text_from_db(syllabus: Syllabus) -> str:
     return "\n".join(parts)
 
 
+def build_syllabus_text_from_db(syllabus: Syllabus) -> str:
+    """
+    Plain-text dump of a constructor syllabus for the AI prompts.
+    Built in at most two queries (course, topics) and memoized per
+    (syllabus id, updated_at); catalog edits bump the namespace.
+    """
+    if syllabus.pk is None or syllabus.updated_at is None:
+        return _render_syllabus_text(syllabus)
+    key = f"{syllabus.pk}:{syllabus.updated_at.timestamp()}"
+    return get_or_build(
+        SYLLABUS_TEXT_NAMESPACE,
+        key,
+        lambda: _render_syllabus_text(syllabus),
+        timeout=SYLLABUS_TEXT_CACHE_SECONDS,
+    )
+
+
 def _build_optimized_prompt(syllabus_text: str) -> str:
     """
     Fast prompt with softer blocking logic.
@@ -1141,7 +1113,22 @@ def _apply_lenient_guardrail(result_data: dict, source_text: str) -> dict:
     return patched
 
 
+# Decision path of a check result, by the model name it was saved with.
+_CHECK_PATHS = {"none": "empty", "rules-fast-v1": "fast_rules", "markitdown-rules-v2": "formal"}
+
+
 def run_ai_check(syllabus: Syllabus) -> AiCheckResult:
+    started_at = time.perf_counter()
+    try:
+        result = _run_ai_check(syllabus)
+    except Exception:
+        AI_CHECK_DURATION.observe(time.perf_counter() - started_at, path="error")
+        raise
+    AI_CHECK_DURATION.observe(time.perf_counter() - started_at, path=_CHECK_PATHS.get(result.model_name, "llm"))
+    return result
+
+
+def _run_ai_check(syllabus: Syllabus) -> AiCheckResult:
     logger.info("AI check started for syllabus id=%s", syllabus.id)
     started_at = time.perf_counter()
 
@@ -0,0 +1,19 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from catalog.models import Course, Topic
+from core.cache import bump_namespace
+from .services import SYLLABUS_TEXT_NAMESPACE
+
+
+@receiver(post_save, sender=Course, dispatch_uid="syllabus_text_course_saved")
+def course_saved(sender, instance, created, **kwargs):
+    # Course and topic titles are part of the memoized syllabus text.
+    if not created:
+        bump_namespace(SYLLABUS_TEXT_NAMESPACE)
+
+
+@receiver(post_save, sender=Topic, dispatch_uid="syllabus_text_topic_saved")
+@receiver(post_delete, sender=Topic, dispatch_uid="syllabus_text_topic_deleted")
+def topic_changed(sender, instance, **kwargs):
+    bump_namespace(SYLLABUS_TEXT_NAMESPACE)
@@ -1,13 +1,24 @@
+import os
+import subprocess
+import sys
+import tempfile
+from unittest.mock import patch
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.test import SimpleTestCase, TestCase
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
 
-from catalog.models import Course
-from syllabi.models import Syllabus
+from catalog.models import Course, Topic
+from syllabi.models import Syllabus, SyllabusTopic
+from syllabi.services import save_syllabus_topics
 
+from ai_checker.extractors import _missing_extractor_feedback
 from ai_checker.services import _apply_lenient_guardrail, _build_representative_excerpt
 from ai_checker.services import _detect_non_syllabus_document
 from ai_checker.services import _quick_structure_decision
-from ai_checker.services import run_ai_check
+from ai_checker.services import build_syllabus_text_from_db, run_ai_check
 
 
 class AiCheckGuardrailTests(SimpleTestCase):
@@ -140,3 +151,135 @@ class AiCheckPersistenceTests(TestCase):
         syllabus.refresh_from_db()
 
         self.assertIn("Ошибка", syllabus.ai_feedback)
+
+
+class EmptyExtractionTests(TestCase):
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        override = override_settings(MEDIA_ROOT=media.name)
+        override.enable()
+        self.addCleanup(override.disable)
+        user = get_user_model().objects.create_user(username="empty_file_user", password="pass1234", role="teacher")
+        course = Course.objects.create(owner=user, code="EMPTY-101", available_languages="ru")
+        self.syllabus = Syllabus.objects.create(
+            course=course,
+            creator=user,
+            semester="Fall 2025",
+            academic_year="2025-2026",
+            pdf_file=SimpleUploadedFile("scan.pdf", b"%PDF-1.4\n%%EOF\n"),
+        )
+
+    @patch("ai_checker.services.extract_text_from_file", return_value="")
+    def test_missing_extractors_are_named_in_feedback(self, _extract):
+        missing = ({"markitdown": False, "pypdf": True}, ["markitdown"])
+        with patch("ai_checker.extractors._extractor_dependency_status", return_value=missing):
+            result = run_ai_check(self.syllabus)
+
+        self.assertEqual(result.model_name, "none")
+        self.assertIn("Не хватает библиотек для чтения PDF", self.syllabus.ai_feedback)
+        self.assertIn("markitdown", self.syllabus.ai_feedback)
+
+    @patch("ai_checker.services.extract_text_from_file", return_value="")
+    def test_unreadable_file_gets_generic_feedback(self, _extract):
+        with patch("ai_checker.extractors._extractor_dependency_status", return_value=({}, [])):
+            run_ai_check(self.syllabus)
+
+        self.assertIn("Не удалось извлечь текст", self.syllabus.ai_feedback)
+
+
+class SyllabusTextBuilderTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username="text_user", password="pass1234", role="teacher")
+        self.course = Course.objects.create(owner=self.user, code="TXT-101", title_ru="Курс", available_languages="ru")
+        self.topics = [
+            Topic.objects.create(course=self.course, order_index=index, title_ru=f"Тема {index}")
+            for index in range(1, 16)
+        ]
+        self.syllabus = Syllabus.objects.create(
+            course=self.course,
+            creator=self.user,
+            semester="Fall 2025",
+            academic_year="2025-2026",
+            course_goal="Цель",
+        )
+        SyllabusTopic.objects.bulk_create(
+            SyllabusTopic(syllabus=self.syllabus, topic=topic, week_number=index)
+            for index, topic in enumerate(self.topics, start=1)
+        )
+
+    def test_text_is_built_in_two_queries_and_memoized(self):
+        syllabus = Syllabus.objects.get(pk=self.syllabus.pk)
+
+        # course + topics with their catalog rows, independent of the topic count
+        with self.assertNumQueries(2):
+            text = build_syllabus_text_from_db(syllabus)
+        reloaded = Syllabus.objects.select_related("course").get(pk=syllabus.pk)
+        with self.assertNumQueries(0):
+            again = build_syllabus_text_from_db(reloaded)
+
+        self.assertEqual(text, again)
+        self.assertIn("Week 15: Тема 15 | Hours: 2", text)
+
+    def test_topic_and_catalog_edits_refresh_the_text(self):
+        build_syllabus_text_from_db(self.syllabus)
+        save_syllabus_topics(
+            self.syllabus,
+            {self.topics[0].pk: {"week_number": 1, "is_included": True, "custom_title": "Новая тема"}},
+        )
+        syllabus = Syllabus.objects.get(pk=self.syllabus.pk)
+        self.assertIn("Week 1: Новая тема", build_syllabus_text_from_db(syllabus))
+        self.assertNotIn("Тема 2", build_syllabus_text_from_db(syllabus))
+
+        self.course.title_ru = "Переименованный курс"
+        self.course.save()
+        self.assertIn("Переименованный курс", build_syllabus_text_from_db(Syllabus.objects.get(pk=self.syllabus.pk)))
+
+
+class ExtractorImportTests(SimpleTestCase):
+    HEAVY_MODULES = ("markitdown", "pypdf", "httpx", "llama_cpp")
+    # Cumulative import time of ai_checker.services, in microseconds; about 0.4 s
+    # when markitdown and pypdf were imported at module level.
+    SERVICES_IMPORT_BUDGET_US = 150_000
+
+    def _web_import_profile(self) -> tuple[set[str], dict[str, int]]:
+        script = (
+            "import django; django.setup(); "
+            "from django.urls import get_resolver; get_resolver().url_patterns"
+        )
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": "config.settings"}
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", script],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        self.assertEqual(completed.returncode, 0, completed.stderr[-2000:])
+
+        modules, cumulative = set(), {}
+        for line in completed.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _self_us, total_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+            if total_us.isdigit():
+                modules.add(name)
+                cumulative[name] = int(total_us)
+        return modules, cumulative
+
+    def test_web_process_does_not_import_extractors_or_llm_runtime(self):
+        modules, cumulative = self._web_import_profile()
+
+        self.assertIn("ai_checker.services", modules)
+        loaded = {name.split(".")[0] for name in modules} & set(self.HEAVY_MODULES)
+        self.assertEqual(loaded, set())
+        self.assertLess(cumulative["ai_checker.services"], self.SERVICES_IMPORT_BUDGET_US)
+
+    def test_missing_extractor_feedback_uses_installed_check(self):
+        with patch("ai_checker.extractors.is_installed", return_value=False):
+            feedback = _missing_extractor_feedback("syllabus.pdf")
+
+        self.assertIn("markitdown", feedback)
+        self.assertIsNone(_missing_extractor_feedback("syllabus.docx"))
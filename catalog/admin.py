@@ -1,4 +1,10 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.core.exceptions import PermissionDenied
+from django.shortcuts import render
+from django.urls import path
+
+from .forms import CatalogImportForm
+from .importers import ImportFormatError, import_catalog, read_rows
 from .models import Course, Topic, TopicLiterature, TopicQuestion
 
 class TopicLiteratureInline(admin.TabularInline):
@@ -14,6 +20,44 @@ class CourseAdmin(admin.ModelAdmin):
     list_display = ("code", "title_ru", "owner", "is_shared")
     list_filter = ("is_shared",)
     search_fields = ("code", "title_ru", "title_en")
+    change_list_template = "admin/catalog/course/change_list.html"
+
+    def get_urls(self):
+        urls = [
+            path(
+                "import/",
+                self.admin_site.admin_view(self.import_view),
+                name="catalog_course_import",
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def import_view(self, request):
+        """Upload a CSV/XLSX/JSON course bank and show the per-row report."""
+        if not self.has_add_permission(request):
+            raise PermissionDenied
+        report = None
+        if request.method == "POST":
+            form = CatalogImportForm(request.POST, request.FILES)
+            if form.is_valid():
+                uploaded = form.cleaned_data["file"]
+                try:
+                    report = import_catalog(read_rows(uploaded.file, uploaded.name), form.cleaned_data["owner"])
+                except ImportFormatError as exc:
+                    form.add_error("file", str(exc))
+                else:
+                    level = messages.WARNING if report.errors else messages.SUCCESS
+                    self.message_user(request, report.summary(), level)
+        else:
+            form = CatalogImportForm()
+        context = {
+            **self.admin_site.each_context(request),
+            "opts": self.model._meta,
+            "title": "Импорт курсов и тем",
+            "form": form,
+            "report": report,
+        }
+        return render(request, "admin/catalog/course/import.html", context)
 
 @admin.register(Topic)
 class TopicAdmin(admin.ModelAdmin):
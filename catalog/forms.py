@@ -1,6 +1,8 @@
 from django import forms
+from django.contrib.auth import get_user_model
 from django.forms import inlineformset_factory
 
+from .importers import SUPPORTED_EXTENSIONS
 from .models import Course, Topic, TopicLiterature, TopicQuestion
 
 
@@ -203,3 +205,18 @@ TopicQuestionFormSet = inlineformset_factory(
     extra=1,
     can_delete=True,
 )
+
+
+class CatalogImportForm(forms.Form):
+    file = forms.FileField(label="Файл", help_text="CSV, XLSX или JSON; одна строка — одна тема курса.")
+    owner = forms.ModelChoiceField(label="Владелец курсов", queryset=None)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["owner"].queryset = get_user_model().objects.order_by("username")
+
+    def clean_file(self):
+        uploaded = self.cleaned_data["file"]
+        if not uploaded.name.lower().endswith(SUPPORTED_EXTENSIONS):
+            raise forms.ValidationError(f"Допустимы файлы: {', '.join(SUPPORTED_EXTENSIONS)}.")
+        return uploaded
@@ -0,0 +1,524 @@
+"""
+Bulk import of courses and topic banks from CSV, XLSX or JSON.
+
+One row describes one topic of a course; rows without ``order_index`` only
+upsert the course itself. Rows are read lazily, validated and written in
+chunks: each chunk is one transaction with a handful of bulk queries, so a
+file with thousands of topics takes seconds. Invalid rows are reported with
+their line number and skipped; the rest of the file is still imported.
+
+Columns (header names are case-insensitive, empty cells leave existing values
+untouched):
+
+* ``course_code`` (required), ``course_title_ru|kz|en``,
+  ``course_description_ru|kz|en``, ``available_languages``, ``is_shared``;
+* ``order_index``, ``title_ru|kz|en``, ``description_ru|kz|en``,
+  ``default_hours``, ``week_type``, ``is_active``;
+* ``literature`` — one entry per line, ``title | author | year | main/additional``;
+* ``questions_ru|kz|en`` — one question per line, lines matched by position.
+
+A non-empty ``literature`` or ``questions_*`` cell replaces that topic's list.
+Courses are matched by (owner, code), topics by (course, order_index).
+"""
+
+import csv
+import io
+import json
+import posixpath
+import xml.etree.ElementTree as ET
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from django.db import DatabaseError, transaction
+
+from core.cache import bump_namespace
+from core.search import index_courses, index_syllabi
+from syllabi.pdf_cache import invalidate_course_pdfs
+from .models import Course, Topic, TopicLiterature, TopicQuestion
+from .services import invalidate_shared_courses
+
+IMPORT_CHUNK_SIZE = 500
+SUPPORTED_EXTENSIONS = (".csv", ".xlsx", ".json")
+
+COURSE_COLUMNS = {
+    "course_title_ru": "title_ru",
+    "course_title_kz": "title_kz",
+    "course_title_en": "title_en",
+    "course_description_ru": "description_ru",
+    "course_description_kz": "description_kz",
+    "course_description_en": "description_en",
+    "available_languages": "available_languages",
+}
+TOPIC_TEXT_COLUMNS = (
+    "title_ru",
+    "title_kz",
+    "title_en",
+    "description_ru",
+    "description_kz",
+    "description_en",
+)
+QUESTION_COLUMNS = ("questions_ru", "questions_kz", "questions_en")
+TRUE_VALUES = {"1", "true", "yes", "y", "да", "+"}
+FALSE_VALUES = {"0", "false", "no", "n", "нет", "-"}
+
+_XLSX_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_XLSX_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_XLSX_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+class ImportFormatError(ValueError):
+    """The file as a whole cannot be read."""
+
+
+class RowError(ValueError):
+    """A single row is invalid; it is reported and skipped."""
+
+
+@dataclass
+class ImportRow:
+    line: int
+    course_code: str
+    course: dict
+    topic: dict | None = None
+    literature: list | None = None
+    questions: list | None = None
+
+
+@dataclass
+class ImportReport:
+    rows: int = 0
+    courses_created: int = 0
+    courses_updated: int = 0
+    topics_created: int = 0
+    topics_updated: int = 0
+    literature: int = 0
+    questions: int = 0
+    errors: list = field(default_factory=list)
+
+    def add_error(self, line: int, message: str) -> None:
+        self.errors.append((line, message))
+
+    def summary(self) -> str:
+        return (
+            f"Строк: {self.rows}. Курсы: создано {self.courses_created}, обновлено {self.courses_updated}. "
+            f"Темы: создано {self.topics_created}, обновлено {self.topics_updated}. "
+            f"Литература: {self.literature}, вопросы: {self.questions}. Ошибок: {len(self.errors)}."
+        )
+
+
+# ---------------------------------------------------------------- readers
+
+
+def read_rows(fileobj, filename: str):
+    """Yield ``(line number, {column: value})`` from a CSV, XLSX or JSON file."""
+    extension = Path(filename or "").suffix.lower()
+    if extension == ".csv":
+        return _read_csv(fileobj)
+    if extension == ".xlsx":
+        return _read_xlsx(fileobj)
+    if extension == ".json":
+        return _read_json(fileobj)
+    raise ImportFormatError(f"Неподдерживаемый формат файла. Допустимы: {', '.join(SUPPORTED_EXTENSIONS)}.")
+
+
+def _normalize_header(values) -> list[str]:
+    return [str(value or "").strip().lower() for value in values]
+
+
+def _read_csv(fileobj):
+    text = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+    sample = text.read(4096)
+    text.seek(0)
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    reader = csv.reader(text, dialect)
+    header = None
+    for values in reader:
+        if header is None:
+            header = _normalize_header(values)
+            continue
+        if any(value.strip() for value in values):
+            yield reader.line_num, dict(zip(header, values))
+
+
+def _read_json(fileobj):
+    try:
+        data = json.load(fileobj)
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ImportFormatError(f"Некорректный JSON: {exc}") from exc
+    if isinstance(data, dict):
+        data = data.get("rows", [])
+    if not isinstance(data, list):
+        raise ImportFormatError("JSON должен содержать список строк.")
+    for index, item in enumerate(data, start=1):
+        if not isinstance(item, dict):
+            yield index, {"__error__": "Элемент должен быть объектом."}
+            continue
+        yield index, {str(key).strip().lower(): value for key, value in item.items()}
+
+
+def _xlsx_first_sheet(archive: zipfile.ZipFile) -> str:
+    workbook = ET.fromstring(archive.read("xl/workbook.xml"))
+    sheet = workbook.find(f"{_XLSX_NS}sheets/{_XLSX_NS}sheet")
+    if sheet is None:
+        raise ImportFormatError("В книге нет листов.")
+    rel_id = sheet.get(f"{_XLSX_REL_NS}id")
+    rels = ET.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    for rel in rels.iter(f"{_XLSX_PKG_REL_NS}Relationship"):
+        if rel.get("Id") == rel_id:
+            target = rel.get("Target", "")
+            return target.lstrip("/") if target.startswith("/") else posixpath.normpath(f"xl/{target}")
+    raise ImportFormatError("Не найден первый лист книги.")
+
+
+def _xlsx_shared_strings(archive: zipfile.ZipFile) -> list[str]:
+    try:
+        handle = archive.open("xl/sharedStrings.xml")
+    except KeyError:
+        return []
+    strings = []
+    with handle:
+        for _event, elem in ET.iterparse(handle):
+            if elem.tag == f"{_XLSX_NS}si":
+                strings.append("".join(text.text or "" for text in elem.iter(f"{_XLSX_NS}t")))
+                elem.clear()
+    return strings
+
+
+def _xlsx_column_index(reference: str) -> int:
+    index = 0
+    for char in reference:
+        if not char.isalpha():
+            break
+        index = index * 26 + (ord(char.upper()) - ord("A") + 1)
+    return index - 1
+
+
+def _xlsx_cell_value(cell, shared: list[str]) -> str:
+    kind = cell.get("t")
+    if kind == "inlineStr":
+        return "".join(text.text or "" for text in cell.iter(f"{_XLSX_NS}t"))
+    value = cell.findtext(f"{_XLSX_NS}v") or ""
+    if kind == "s" and value:
+        return shared[int(value)]
+    return value
+
+
+def _read_xlsx(fileobj):
+    # Streamed with iterparse so large sheets are never fully loaded in memory.
+    try:
+        archive = zipfile.ZipFile(fileobj)
+    except zipfile.BadZipFile as exc:
+        raise ImportFormatError("Файл XLSX повреждён.") from exc
+    with archive:
+        shared = _xlsx_shared_strings(archive)
+        header = None
+        with archive.open(_xlsx_first_sheet(archive)) as handle:
+            for _event, elem in ET.iterparse(handle):
+                if elem.tag != f"{_XLSX_NS}row":
+                    continue
+                values: dict[int, str] = {}
+                for position, cell in enumerate(elem.iter(f"{_XLSX_NS}c")):
+                    reference = cell.get("r")
+                    column = _xlsx_column_index(reference) if reference else position
+                    values[column] = _xlsx_cell_value(cell, shared)
+                line = int(elem.get("r") or 0)
+                elem.clear()
+                if not values:
+                    continue
+                row = [values.get(index, "") for index in range(max(values) + 1)]
+                if header is None:
+                    header = _normalize_header(row)
+                    continue
+                if any(str(value).strip() for value in row):
+                    yield line, dict(zip(header, row))
+
+
+# ---------------------------------------------------------------- validation
+
+
+def _text(raw: dict, column: str, max_length: int | None = None) -> str | None:
+    value = raw.get(column)
+    if value is None:
+        return None
+    value = str(value).strip()
+    if not value:
+        return None
+    if max_length and len(value) > max_length:
+        raise RowError(f"{column}: не более {max_length} символов.")
+    return value
+
+
+def _int(raw: dict, column: str, minimum: int = 0) -> int | None:
+    value = _text(raw, column)
+    if value is None:
+        return None
+    try:
+        number = float(value.replace(",", "."))
+    except ValueError:
+        raise RowError(f"{column}: ожидается целое число, получено «{value}».") from None
+    if number != int(number) or number < minimum:
+        raise RowError(f"{column}: ожидается целое число не меньше {minimum}.")
+    return int(number)
+
+
+def _bool(raw: dict, column: str) -> bool | None:
+    value = raw.get(column)
+    if isinstance(value, bool):
+        return value
+    value = _text(raw, column)
+    if value is None:
+        return None
+    if value.lower() in TRUE_VALUES:
+        return True
+    if value.lower() in FALSE_VALUES:
+        return False
+    raise RowError(f"{column}: ожидается да/нет, получено «{value}».")
+
+
+def _lines(value) -> list:
+    if isinstance(value, list):
+        return value
+    return [line.strip() for line in str(value or "").splitlines() if line.strip()]
+
+
+def _literature_entry(entry) -> TopicLiterature:
+    if isinstance(entry, dict):
+        parts = [entry.get(key) or "" for key in ("title", "author", "year", "lit_type")]
+    else:
+        parts = [part.strip() for part in str(entry).split("|")]
+    title, author, year, lit_type = (list(parts) + ["", "", "", ""])[:4]
+    title, author, year = str(title).strip(), str(author).strip(), str(year).strip()
+    lit_type = str(lit_type).strip().lower() or TopicLiterature.LitType.MAIN
+    if not title:
+        raise RowError("literature: у источника не указано название.")
+    if len(title) > 255 or len(author) > 255 or len(year) > 10:
+        raise RowError(f"literature: слишком длинное значение в «{title[:40]}».")
+    if lit_type not in TopicLiterature.LitType.values:
+        raise RowError(f"literature: тип «{lit_type}» не поддерживается (main/additional).")
+    return TopicLiterature(title=title, author=author, year=year, lit_type=lit_type)
+
+
+def parse_row(line: int, raw: dict) -> ImportRow:
+    if "__error__" in raw:
+        raise RowError(raw["__error__"])
+    code = _text(raw, "course_code", 50)
+    if not code:
+        raise RowError("course_code: обязательное поле.")
+
+    course = {}
+    for column, field_name in COURSE_COLUMNS.items():
+        value = _text(raw, column, 50 if field_name == "available_languages" else None)
+        if value is not None:
+            if field_name.startswith("title_") and len(value) > 255:
+                raise RowError(f"{column}: не более 255 символов.")
+            course[field_name] = value
+    is_shared = _bool(raw, "is_shared")
+    if is_shared is not None:
+        course["is_shared"] = is_shared
+
+    row = ImportRow(line=line, course_code=code, course=course)
+    order_index = _int(raw, "order_index", minimum=1)
+    if order_index is None:
+        return row
+
+    topic = {"order_index": order_index}
+    for column in TOPIC_TEXT_COLUMNS:
+        value = _text(raw, column, 255 if column.startswith("title_") else None)
+        if value is not None:
+            topic[column] = value
+    default_hours = _int(raw, "default_hours")
+    if default_hours is not None:
+        topic["default_hours"] = default_hours
+    week_type = _text(raw, "week_type")
+    if week_type is not None:
+        if week_type.lower() not in Topic.WeekType.values:
+            raise RowError(f"week_type: «{week_type}» не поддерживается (lecture/practice/lab).")
+        topic["week_type"] = week_type.lower()
+    is_active = _bool(raw, "is_active")
+    if is_active is not None:
+        topic["is_active"] = is_active
+    row.topic = topic
+
+    if _lines(raw.get("literature")):
+        row.literature = [_literature_entry(entry) for entry in _lines(raw.get("literature"))]
+    question_lines = {column: _lines(raw.get(column)) for column in QUESTION_COLUMNS}
+    if any(question_lines.values()):
+        count = max(len(lines) for lines in question_lines.values())
+        row.questions = [
+            TopicQuestion(
+                **{
+                    f"question_{column[-2:]}": str(lines[index]).strip() if index < len(lines) else ""
+                    for column, lines in question_lines.items()
+                }
+            )
+            for index in range(count)
+        ]
+    return row
+
+
+# ---------------------------------------------------------------- writing
+
+
+def import_catalog(raw_rows, owner, chunk_size: int = IMPORT_CHUNK_SIZE) -> ImportReport:
+    """Validate and upsert ``raw_rows`` (from ``read_rows``) for ``owner``."""
+    report = ImportReport()
+    chunk: list[ImportRow] = []
+    for line, raw in raw_rows:
+        report.rows += 1
+        try:
+            chunk.append(parse_row(line, raw))
+        except RowError as exc:
+            report.add_error(line, str(exc))
+            continue
+        if len(chunk) >= chunk_size:
+            _write_chunk(chunk, owner, report)
+            chunk = []
+    if chunk:
+        _write_chunk(chunk, owner, report)
+    return report
+
+
+def _apply(instance, values: dict) -> set[str]:
+    changed = set()
+    for name, value in values.items():
+        if getattr(instance, name) != value:
+            setattr(instance, name, value)
+            changed.add(name)
+    return changed
+
+
+def _write_chunk(rows: list[ImportRow], owner, report: ImportReport) -> None:
+    try:
+        with transaction.atomic():
+            results = [_upsert_chunk(rows, owner)]
+    except DatabaseError:
+        # One bad row rolls back the whole chunk: write it again row by row, each
+        # in its own savepoint, so only the failing lines are reported.
+        results = []
+        for row in rows:
+            try:
+                with transaction.atomic():
+                    results.append(_upsert_chunk([row], owner))
+            except DatabaseError as exc:
+                report.add_error(row.line, f"Ошибка записи: {exc}")
+        if not results:
+            return
+
+    touched = {"courses": set(), "updated": set(), "pdf": set()}
+    for counts, row_touched in results:
+        for name, value in counts.items():
+            setattr(report, name, getattr(report, name) + value)
+        for name, ids in row_touched.items():
+            touched[name].update(ids)
+    # Bulk writes send no signals: refresh the search index and cached PDFs here.
+    index_courses(touched["courses"])
+    invalidate_shared_courses()
+    if touched["updated"]:
+        from syllabi.models import Syllabus
+
+        index_syllabi(Syllabus.objects.filter(course_id__in=touched["updated"]).values_list("pk", flat=True))
+    for course_id in sorted(touched["pdf"]):
+        invalidate_course_pdfs(course_id)
+    if touched["pdf"]:
+        # Course and topic titles are part of the memoized AI syllabus text.
+        from ai_checker.services import SYLLABUS_TEXT_NAMESPACE
+
+        bump_namespace(SYLLABUS_TEXT_NAMESPACE)
+
+
+def _upsert_chunk(rows: list[ImportRow], owner):
+    courses: dict[str, Course] = {}
+    for course in Course.objects.filter(owner=owner, code__in={row.course_code for row in rows}).order_by("pk"):
+        courses.setdefault(course.code, course)
+    existing_course_ids = {course.pk for course in courses.values()}
+
+    new_courses: list[Course] = []
+    dirty_courses: dict[int, Course] = {}
+    course_fields: set[str] = set()
+    for row in rows:
+        course = courses.get(row.course_code)
+        if course is None:
+            course = Course(owner=owner, code=row.course_code, available_languages="ru")
+            courses[row.course_code] = course
+            new_courses.append(course)
+        changed = _apply(course, row.course)
+        if changed and course.pk:
+            dirty_courses[course.pk] = course
+            course_fields |= changed
+    Course.objects.bulk_create(new_courses)
+    if dirty_courses:
+        Course.objects.bulk_update(list(dirty_courses.values()), sorted(course_fields))
+
+    topic_rows = [row for row in rows if row.topic]
+    topics: dict[tuple[int, int], Topic] = {}
+    if topic_rows:
+        existing_topics = Topic.objects.filter(
+            course_id__in={courses[row.course_code].pk for row in topic_rows},
+            order_index__in={row.topic["order_index"] for row in topic_rows},
+        ).order_by("pk")
+        for topic in existing_topics:
+            topics.setdefault((topic.course_id, topic.order_index), topic)
+
+    new_topics: list[Topic] = []
+    dirty_topics: dict[int, Topic] = {}
+    topic_fields: set[str] = set()
+    replaced_literature: dict[tuple, list] = {}
+    replaced_questions: dict[tuple, list] = {}
+    for row in topic_rows:
+        course = courses[row.course_code]
+        key = (course.pk, row.topic["order_index"])
+        topic = topics.get(key)
+        if topic is None:
+            topic = Topic(course=course)
+            topics[key] = topic
+            new_topics.append(topic)
+        changed = _apply(topic, row.topic)
+        if changed and topic.pk:
+            dirty_topics[topic.pk] = topic
+            topic_fields |= changed
+        if row.literature is not None:
+            replaced_literature[key] = row.literature
+        if row.questions is not None:
+            replaced_questions[key] = row.questions
+    Topic.objects.bulk_create(new_topics)
+    if dirty_topics:
+        Topic.objects.bulk_update(list(dirty_topics.values()), sorted(topic_fields))
+
+    literature = _replace_children(TopicLiterature, topics, replaced_literature)
+    questions = _replace_children(TopicQuestion, topics, replaced_questions)
+
+    changed_courses = {topic.course_id for topic in dirty_topics.values()}
+    changed_courses |= {topics[key].course_id for key in (*replaced_literature, *replaced_questions)}
+    changed_courses |= set(dirty_courses)
+    counts = {
+        "courses_created": len(new_courses),
+        "courses_updated": len(dirty_courses),
+        "topics_created": len(new_topics),
+        "topics_updated": len(dirty_topics),
+        "literature": literature,
+        "questions": questions,
+    }
+    touched = {
+        "courses": [course.pk for course in new_courses] + list(dirty_courses),
+        "updated": list(dirty_courses),
+        "pdf": sorted(changed_courses & existing_course_ids),
+    }
+    return counts, touched
+
+
+def _replace_children(model, topics: dict, replacements: dict) -> int:
+    if not replacements:
+        return 0
+    topic_ids = [topics[key].pk for key in replacements]
+    model.objects.filter(topic_id__in=topic_ids).delete()
+    children = []
+    for key, items in replacements.items():
+        for item in items:
+            item.topic_id = topics[key].pk
+            children.append(item)
+    model.objects.bulk_create(children)
+    return len(children)
@@ -0,0 +1,35 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from catalog.importers import IMPORT_CHUNK_SIZE, ImportFormatError, import_catalog, read_rows
+
+
+class Command(BaseCommand):
+    help = "Import courses and topic banks (with literature and questions) from CSV, XLSX or JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import (.csv, .xlsx or .json).")
+        parser.add_argument("--owner", required=True, help="Username that will own the imported courses.")
+        parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        try:
+            owner = User.objects.get(username=options["owner"])
+        except User.DoesNotExist as exc:
+            raise CommandError(f"User {options['owner']!r} not found.") from exc
+
+        try:
+            with open(options["path"], "rb") as handle:
+                report = import_catalog(
+                    read_rows(handle, options["path"]),
+                    owner,
+                    chunk_size=max(1, options["chunk_size"]),
+                )
+        except (OSError, ImportFormatError) as exc:
+            raise CommandError(str(exc)) from exc
+
+        for line, message in report.errors:
+            self.stderr.write(f"line {line}: {message}")
+        style = self.style.WARNING if report.errors else self.style.SUCCESS
+        self.stdout.write(style(report.summary()))
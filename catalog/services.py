@@ -1,4 +1,15 @@
-from catalog.models import Course
+from django.conf import settings
+from django.db import transaction
+from django.http import HttpRequest
+
+from catalog.models import Course, TopicLiterature, TopicQuestion
+from core.cache import bump_namespace, get_or_build
+from core.cloning import bulk_clone, copy_field_values
+from core.pagination import keyset_paginate
+
+SHARED_COURSES_NAMESPACE = "shared_courses"
+SHARED_COURSES_TIMEOUT = 600
+SHARED_COURSE_LIST_ORDERING = ("owner__last_name", "owner__first_name", "code", "id")
 
 
 DEFAULT_COURSES = [
@@ -71,3 +82,56 @@ def ensure_default_courses(user) -> list[Course]:
             )
         )
     return created
+
+
+def build_fork_code(user, source_code: str) -> str:
+    """First free ``<code>_copy`` / ``<code>_copy_N`` among the user's courses, in one query."""
+    base_code = f"{source_code}_copy"
+    taken = set(
+        Course.objects.filter(owner=user, code__startswith=base_code).values_list("code", flat=True)
+    )
+    candidate = base_code
+    suffix = 2
+    while candidate in taken:
+        candidate = f"{base_code}_{suffix}"
+        suffix += 1
+    return candidate
+
+
+@transaction.atomic
+def clone_course(source: Course, owner, code: str, is_shared: bool = False) -> Course:
+    """
+    Deep-copy ``source`` with its topics, literature and questions.
+    The tree is read in three queries and written with one bulk insert per level.
+    """
+    topics = list(source.topics.order_by("order_index", "pk"))
+    literature = list(TopicLiterature.objects.filter(topic__course=source).order_by("pk"))
+    questions = list(TopicQuestion.objects.filter(topic__course=source).order_by("pk"))
+
+    # A plain save keeps the course's post_save handlers (search index).
+    values = copy_field_values(source)
+    values.update(owner_id=owner.pk, code=code, is_shared=is_shared)
+    new_course = Course.objects.create(**values)
+
+    topic_map = bulk_clone(topics, overrides={"course_id": new_course.pk})
+    bulk_clone(literature, remap={"topic_id": topic_map})
+    bulk_clone(questions, remap={"topic_id": topic_map})
+    return new_course
+
+
+def invalidate_shared_courses() -> None:
+    bump_namespace(SHARED_COURSES_NAMESPACE)
+
+
+def shared_courses_queryset():
+    return Course.objects.filter(is_shared=True).select_related("owner")
+
+
+def first_shared_courses_page():
+    """First page of the shared course list without search or paging parameters, cached."""
+    return get_or_build(
+        SHARED_COURSES_NAMESPACE,
+        f"first_page:{settings.LIST_PAGE_SIZE}",
+        lambda: keyset_paginate(HttpRequest(), shared_courses_queryset(), SHARED_COURSE_LIST_ORDERING),
+        SHARED_COURSES_TIMEOUT,
+    )
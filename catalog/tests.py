@@ -1,8 +1,24 @@
+import io
+import json
+import tempfile
+import zipfile
+from pathlib import Path
+from unittest import mock
+
 from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import DatabaseError, connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+from ai_checker.services import SYLLABUS_TEXT_NAMESPACE
+from catalog import importers
+from catalog.importers import import_catalog, read_rows
 from catalog.models import Course, Topic, TopicLiterature, TopicQuestion
+from catalog.services import build_fork_code, clone_course
+from core.cache import namespace_version
 
 
 User = get_user_model()
@@ -135,3 +151,212 @@ class CatalogViewTests(TestCase):
         self.assertEqual(forked.topics.count(), 1)
         self.assertEqual(forked.topics.first().literature.count(), 1)
         self.assertEqual(forked.topics.first().questions.count(), 1)
+
+    def test_clone_course_copies_tree_with_bulk_inserts(self):
+        owner = self._create_user("catalog_clone_source")
+        fork_user = self._create_user("catalog_clone_target")
+        source = Course.objects.create(owner=owner, code="CS105", available_languages="ru", is_shared=True)
+        for index in range(5):
+            topic = Topic.objects.create(course=source, order_index=index + 1, title_ru=f"Тема {index}")
+            TopicLiterature.objects.bulk_create(
+                TopicLiterature(topic=topic, title=f"Книга {index}-{n}", lit_type="main") for n in range(2)
+            )
+            TopicQuestion.objects.bulk_create(
+                TopicQuestion(topic=topic, question_ru=f"Вопрос {index}-{n}") for n in range(2)
+            )
+
+        with self.assertNumQueries(11):
+            clone = clone_course(source, fork_user, "CS105_copy")
+
+        self.assertEqual(clone.owner, fork_user)
+        self.assertFalse(clone.is_shared)
+        self.assertEqual(
+            list(clone.topics.order_by("order_index").values_list("title_ru", flat=True)),
+            [f"Тема {index}" for index in range(5)],
+        )
+        self.assertEqual(TopicLiterature.objects.filter(topic__course=clone).count(), 10)
+        self.assertEqual(TopicQuestion.objects.filter(topic__course=clone).count(), 10)
+        self.assertEqual(TopicLiterature.objects.filter(topic__course=source).count(), 10)
+
+    def test_fork_code_skips_taken_suffixes_in_one_query(self):
+        teacher = self._create_user("catalog_fork_codes")
+        for code in ("CS106_copy", "CS106_copy_2", "CS106_copy_4"):
+            Course.objects.create(owner=teacher, code=code, available_languages="ru")
+
+        with self.assertNumQueries(1):
+            code = build_fork_code(teacher, "CS106")
+
+        self.assertEqual(code, "CS106_copy_3")
+
+    def test_shared_courses_list_is_paginated_by_cursor(self):
+        teacher = self._create_user("teacher_pages")
+        for index in range(3):
+            Course.objects.create(owner=teacher, code=f"SH{index}", is_shared=True, available_languages="ru")
+        self.client.force_login(teacher)
+
+        first = self.client.get(reverse("shared_courses_list"), {"page_size": "2"})
+        second = self.client.get(reverse("shared_courses_list") + first.context["page"].next_url)
+
+        self.assertEqual([course.code for course in first.context["courses"]], ["SH0", "SH1"])
+        self.assertEqual([course.code for course in second.context["courses"]], ["SH2"])
+        self.assertFalse(second.context["page"].has_next)
+
+
+def _xlsx_bytes(rows) -> bytes:
+    """Minimal single-sheet workbook with inline strings."""
+    def cell(ref, value):
+        return f'<c r="{ref}" t="inlineStr"><is><t>{value}</t></is></c>'
+
+    sheet_rows = "".join(
+        f'<row r="{line}">'
+        + "".join(cell(f"{chr(ord('A') + col)}{line}", value) for col, value in enumerate(values))
+        + "</row>"
+        for line, values in enumerate(rows, start=1)
+    )
+    main = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+    rel = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(
+            "xl/workbook.xml",
+            f'<workbook xmlns="{main}" xmlns:r="{rel}"><sheets><sheet name="S" sheetId="1" r:id="rId1"/></sheets></workbook>',
+        )
+        archive.writestr(
+            "xl/_rels/workbook.xml.rels",
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Target="worksheets/sheet1.xml"/></Relationships>',
+        )
+        archive.writestr("xl/worksheets/sheet1.xml", f'<worksheet xmlns="{main}"><sheetData>{sheet_rows}</sheetData></worksheet>')
+    return buffer.getvalue()
+
+
+class CatalogImportTests(TestCase):
+    CSV = (
+        "course_code;course_title_ru;order_index;title_ru;default_hours;week_type;literature;questions_ru\n"
+        'IMP101;Импорт;1;Введение;4;lecture;"Книга | Автор | 2024 | main\nСтатья | | | additional";"Вопрос 1\nВопрос 2"\n'
+        "IMP101;;2;Практика;2;practice;;\n"
+        "IMP101;;x;Ошибка;;;;\n"
+        "IMP102;Второй курс;;;;;;\n"
+    )
+
+    def setUp(self):
+        self.owner = User.objects.create_user(username="import_owner", password="pass1234", role="teacher")
+
+    def _import(self, content: str, name: str = "bank.csv"):
+        return import_catalog(read_rows(io.BytesIO(content.encode("utf-8")), name), self.owner)
+
+    def test_csv_import_creates_tree_and_reports_bad_rows(self):
+        report = self._import(self.CSV)
+
+        self.assertEqual(report.rows, 4)
+        self.assertEqual((report.courses_created, report.topics_created), (2, 2))
+        # Errors point at the physical file line; row 2 spans three lines.
+        self.assertEqual(report.errors, [(6, "order_index: ожидается целое число, получено «x».")])
+        course = Course.objects.get(owner=self.owner, code="IMP101")
+        intro = course.topics.get(order_index=1)
+        self.assertEqual((intro.title_ru, intro.default_hours), ("Введение", 4))
+        self.assertEqual(
+            list(intro.literature.order_by("pk").values_list("title", "author", "year", "lit_type")),
+            [("Книга", "Автор", "2024", "main"), ("Статья", "", "", "additional")],
+        )
+        self.assertEqual(intro.questions.count(), 2)
+        self.assertTrue(Course.objects.filter(owner=self.owner, code="IMP102", title_ru="Второй курс").exists())
+
+    def test_reimport_upserts_without_duplicates(self):
+        self._import(self.CSV)
+        report = self._import(
+            "course_code,order_index,title_ru,literature\n"
+            "IMP101,1,Введение (ред.),Новая книга\n"
+            "IMP101,3,Новая тема,\n"
+        )
+
+        self.assertEqual((report.topics_created, report.topics_updated), (1, 1))
+        course = Course.objects.get(owner=self.owner, code="IMP101")
+        self.assertEqual(course.title_ru, "Импорт")
+        self.assertEqual(course.topics.count(), 3)
+        intro = course.topics.get(order_index=1)
+        self.assertEqual(intro.title_ru, "Введение (ред.)")
+        self.assertEqual(list(intro.literature.values_list("title", flat=True)), ["Новая книга"])
+        self.assertEqual(intro.questions.count(), 2)
+
+    def test_reimport_refreshes_memoized_syllabus_text(self):
+        self._import(self.CSV)
+        version = namespace_version(SYLLABUS_TEXT_NAMESPACE)
+
+        self._import("course_code,order_index,title_ru\nIMP101,1,Введение (ред.)\n")
+
+        self.assertNotEqual(namespace_version(SYLLABUS_TEXT_NAMESPACE), version)
+
+    def test_failed_chunk_is_retried_row_by_row(self):
+        real_upsert = importers._upsert_chunk
+
+        def upsert(rows, owner):
+            if any(row.topic.get("title_ru") == "Сбой" for row in rows):
+                raise DatabaseError("constraint failed")
+            return real_upsert(rows, owner)
+
+        content = "course_code,order_index,title_ru\nROW1,1,Первая\nROW1,2,Сбой\nROW1,3,Третья\n"
+        with mock.patch("catalog.importers._upsert_chunk", side_effect=upsert):
+            report = self._import(content)
+
+        self.assertEqual(report.errors, [(3, "Ошибка записи: constraint failed")])
+        self.assertEqual(report.topics_created, 2)
+        course = Course.objects.get(owner=self.owner, code="ROW1")
+        self.assertEqual(sorted(course.topics.values_list("order_index", flat=True)), [1, 3])
+
+    def test_import_writes_in_bulk(self):
+        rows = ["course_code,order_index,title_ru,literature,questions_ru"]
+        rows += [f"BULK1,{index},Тема {index},Книга {index},Вопрос {index}" for index in range(1, 301)]
+
+        with CaptureQueriesContext(connection) as queries:
+            report = self._import("\n".join(rows) + "\n")
+
+        # A fixed number of bulk statements per chunk, not per row (SQLite splits large inserts).
+        self.assertLessEqual(len(queries), 20)
+        self.assertEqual(report.topics_created, 300)
+        self.assertEqual(TopicLiterature.objects.filter(topic__course__code="BULK1").count(), 300)
+
+    def test_json_and_xlsx_use_the_same_columns(self):
+        payload = json.dumps(
+            [
+                {
+                    "course_code": "JS101",
+                    "order_index": 1,
+                    "title_ru": "JSON",
+                    "literature": [{"title": "Книга", "lit_type": "additional"}],
+                    "questions_ru": ["Вопрос"],
+                }
+            ]
+        )
+        self._import(payload, "bank.json")
+        workbook = _xlsx_bytes([["course_code", "order_index", "title_ru"], ["XL101", "1", "Excel"]])
+        import_catalog(read_rows(io.BytesIO(workbook), "bank.xlsx"), self.owner)
+
+        self.assertEqual(TopicLiterature.objects.get(topic__course__code="JS101").lit_type, "additional")
+        self.assertEqual(TopicQuestion.objects.get(topic__course__code="JS101").question_ru, "Вопрос")
+        self.assertEqual(Topic.objects.get(course__code="XL101").title_ru, "Excel")
+
+    def test_command_imports_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bank.csv"
+            path.write_text(self.CSV, encoding="utf-8")
+            out, err = io.StringIO(), io.StringIO()
+            call_command("import_catalog", str(path), owner="import_owner", stdout=out, stderr=err)
+
+        self.assertIn("Ошибок: 1", out.getvalue())
+        self.assertIn("line 6:", err.getvalue())
+        self.assertEqual(Topic.objects.filter(course__owner=self.owner).count(), 2)
+
+    def test_admin_upload_imports_file(self):
+        admin_user = User.objects.create_superuser(username="import_admin", password="pass1234", email="a@example.com")
+        self.client.force_login(admin_user)
+        upload = SimpleUploadedFile("bank.csv", self.CSV.encode("utf-8"), content_type="text/csv")
+
+        response = self.client.post(
+            reverse("admin:catalog_course_import"),
+            {"file": upload, "owner": self.owner.pk},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "order_index: ожидается целое число")
+        self.assertEqual(Course.objects.filter(owner=self.owner).count(), 2)
@@ -2,32 +2,34 @@
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import Prefetch
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views.decorators.http import require_POST
 
 from accounts.decorators import content_editor_required
+from core.models import SearchEntry
+from core.pagination import keyset_paginate
+from core.search import search_object_ids
 from .forms import CourseForm, TopicForm, TopicLiteratureFormSet, TopicQuestionFormSet
-from .models import Course, Topic, TopicLiterature, TopicQuestion
+from .models import Course, Topic
+from .services import (
+    SHARED_COURSE_LIST_ORDERING,
+    build_fork_code,
+    clone_course,
+    first_shared_courses_page,
+    shared_courses_queryset,
+)
 
-
-def _build_fork_code(user, source_code: str) -> str:
-    base_code = f"{source_code}_copy"
-    candidate = base_code
-    suffix = 2
-
-    while Course.objects.filter(owner=user, code=candidate).exists():
-        candidate = f"{base_code}_{suffix}"
-        suffix += 1
-
-    return candidate
+# Course has no timestamps, so lists keep their natural order with id as the tiebreaker.
+COURSE_LIST_ORDERING = ("code", "id")
 
 
 @login_required
 @content_editor_required
 def courses_list(request):
     courses = Course.objects.filter(owner=request.user)
-    return render(request, "catalog/courses_list.html", {"courses": courses})
+    page = keyset_paginate(request, courses, COURSE_LIST_ORDERING)
+    return render(request, "catalog/courses_list.html", {"courses": page.object_list, "page": page})
 
 
 @login_required
@@ -63,7 +65,9 @@ def course_edit(request, pk):
 @login_required
 def course_detail(request, pk):
     course = get_object_or_404(
-        Course.objects.prefetch_related("topics__literature", "topics__questions"),
+        Course.objects.prefetch_related(
+            Prefetch("topics", queryset=Topic.objects.order_by("order_index").prefetch_related("literature", "questions"))
+        ),
         pk=pk,
     )
     if (
@@ -74,7 +78,8 @@ def course_detail(request, pk):
         and not request.user.is_superuser
     ):
         raise PermissionDenied("Доступ к этому курсу запрещен.")
-    topics = course.topics.order_by("order_index")
+    # order_by() on the related manager would drop the prefetch and query per topic.
+    topics = course.topics.all()
     return render(request, "catalog/course_detail.html", {"course": course, "topics": topics})
 
 
@@ -151,24 +156,17 @@ def shared_courses_list(request):
         raise PermissionDenied("У вас нет доступа к общим шаблонам курсов.")
 
     query = (request.GET.get("q") or "").strip()
-    courses = Course.objects.filter(is_shared=True).select_related("owner")
-
-    if query:
-        courses = courses.filter(
-            Q(code__icontains=query)
-            | Q(title_ru__icontains=query)
-            | Q(title_kz__icontains=query)
-            | Q(title_en__icontains=query)
-            | Q(owner__username__icontains=query)
-            | Q(owner__first_name__icontains=query)
-            | Q(owner__last_name__icontains=query)
-        )
-
-    courses = courses.order_by("owner__last_name", "owner__first_name", "code")
+    if not request.GET:
+        page = first_shared_courses_page()
+    else:
+        courses = shared_courses_queryset()
+        if query:
+            courses = courses.filter(pk__in=search_object_ids(SearchEntry.Kind.COURSE, query))
+        page = keyset_paginate(request, courses, SHARED_COURSE_LIST_ORDERING)
     return render(
         request,
         "catalog/shared_courses_list.html",
-        {"courses": courses, "search_query": query},
+        {"courses": page.object_list, "page": page, "search_query": query},
     )
 
 
@@ -182,50 +180,7 @@ def course_fork(request, pk):
 
     source = get_object_or_404(Course, pk=pk, is_shared=True)
 
-    new_course = Course.objects.create(
-        owner=request.user,
-        code=_build_fork_code(request.user, source.code),
-        title_ru=source.title_ru,
-        title_kz=source.title_kz,
-        title_en=source.title_en,
-        description_ru=source.description_ru,
-        description_kz=source.description_kz,
-        description_en=source.description_en,
-        available_languages=source.available_languages,
-        is_shared=False,
-    )
-
-    for topic in source.topics.all().order_by("order_index"):
-        new_topic = Topic.objects.create(
-            course=new_course,
-            order_index=topic.order_index,
-            title_ru=topic.title_ru,
-            title_kz=topic.title_kz,
-            title_en=topic.title_en,
-            description_ru=topic.description_ru,
-            description_kz=topic.description_kz,
-            description_en=topic.description_en,
-            default_hours=topic.default_hours,
-            week_type=topic.week_type,
-            is_active=topic.is_active,
-        )
-
-        for lit in topic.literature.all():
-            TopicLiterature.objects.create(
-                topic=new_topic,
-                title=lit.title,
-                author=lit.author,
-                year=lit.year,
-                lit_type=lit.lit_type,
-            )
-
-        for q in topic.questions.all():
-            TopicQuestion.objects.create(
-                topic=new_topic,
-                question_ru=q.question_ru,
-                question_kz=q.question_kz,
-                question_en=q.question_en,
-            )
+    new_course = clone_course(source, request.user, build_fork_code(request.user, source.code))
 
     source_title = source.display_title or source.code
     messages.success(
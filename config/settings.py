@@ -141,6 +141,10 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    # Request latency for /metrics; inactive when METRICS_ENABLED is off.
+    "core.metrics.MetricsMiddleware",
+    # Inactive unless REQUEST_PROFILING is set.
+    "core.profiling.RequestProfilingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -155,11 +159,19 @@ ROOT_URLCONF = "config.urls"
 
 # Шаблоны
 
+_TEMPLATE_LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+# Compiled templates are kept in memory for the life of the process. runserver's
+# autoreloader resets the cache when a template changes; DJANGO_TEMPLATE_CACHE=0
+# re-reads templates on every render.
+TEMPLATE_CACHE_ENABLED = _env_bool("DJANGO_TEMPLATE_CACHE", True)
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [BASE_DIR / "templates"],
-        "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
                 "django.template.context_processors.debug",
@@ -168,11 +180,24 @@ TEMPLATES = [
                 "django.contrib.messages.context_processors.messages",
                 "django.template.context_processors.static",
                 "core.context_processors.sidebar_notifications",
+                "core.context_processors.fragment_cache",
             ],
+            "loaders": (
+                [("django.template.loaders.cached.Loader", _TEMPLATE_LOADERS)]
+                if TEMPLATE_CACHE_ENABLED
+                else _TEMPLATE_LOADERS
+            ),
         },
     },
 ]
 
+# {% cache %} fragments (navigation, workflow guide, announcements). The release
+# part of the key keeps a shared cache from serving markup of a previous deploy.
+FRAGMENT_CACHE_TIMEOUT = _env_int("FRAGMENT_CACHE_TIMEOUT", 600)
+FRAGMENT_CACHE_RELEASE = (
+    os.getenv("FRAGMENT_CACHE_RELEASE", "").strip() or os.getenv("RENDER_GIT_COMMIT", "")[:12] or "1"
+)
+
 WSGI_APPLICATION = "config.wsgi.application"
 
 
@@ -207,6 +232,61 @@ else:
         }
 
 
+# Профилирование запросов: SQL, шаблоны и время ответа по каждому view,
+# отчет в /diagnostics/requests/ (только в памяти процесса).
+REQUEST_PROFILING = _env_bool("REQUEST_PROFILING", False)
+REQUEST_PROFILING_BUFFER = _env_int("REQUEST_PROFILING_BUFFER", 200)
+REQUEST_PROFILING_MAX_QUERIES = _env_int("REQUEST_PROFILING_MAX_QUERIES", 30)
+REQUEST_PROFILING_MAX_MS = _env_int("REQUEST_PROFILING_MAX_MS", 800)
+REQUEST_PROFILING_DUPLICATE_REPEATS = _env_int("REQUEST_PROFILING_DUPLICATE_REPEATS", 5)
+
+
+# Метрики Prometheus (/metrics)
+# METRICS_DIR is a host-local directory shared by gunicorn workers and
+# run_worker; without it each process reports only its own values.
+METRICS_ENABLED = _env_bool("METRICS_ENABLED", True)
+METRICS_DIR = os.getenv("METRICS_DIR", "").strip()
+METRICS_FLUSH_SECONDS = _env_int("METRICS_FLUSH_SECONDS", 5)
+# Scrapers authenticate with "Authorization: Bearer <METRICS_TOKEN>"; admin/staff
+# sessions are accepted too. METRICS_ALLOWED_IPS is empty by default: behind a
+# reverse proxy on the same host every request comes from loopback.
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "").strip()
+METRICS_ALLOWED_IPS = [
+    ip.strip() for ip in os.getenv("METRICS_ALLOWED_IPS", "").split(",") if ip.strip()
+]
+
+
+# Кэш
+# One cache shared by all gunicorn workers and run_worker keeps cached counters
+# and fragments consistent; locmem (the default) is per process.
+_CACHE_BACKENDS = {
+    "locmem": ("django.core.cache.backends.locmem.LocMemCache", "almau-syllabus"),
+    "file": ("django.core.cache.backends.filebased.FileBasedCache", str(BASE_DIR / "cache")),
+    # Table created by `python manage.py createcachetable`.
+    "db": ("django.core.cache.backends.db.DatabaseCache", "django_cache"),
+    # Any Redis-protocol server (Redis, Valkey, KeyDB); needs the `redis` package.
+    "redis": ("django.core.cache.backends.redis.RedisCache", "redis://127.0.0.1:6379/1"),
+}
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "locmem").strip().lower()
+if CACHE_BACKEND not in _CACHE_BACKENDS:
+    raise ImproperlyConfigured(
+        f"Unknown CACHE_BACKEND {CACHE_BACKEND!r}; use one of: {', '.join(_CACHE_BACKENDS)}."
+    )
+_cache_class, _cache_location = _CACHE_BACKENDS[CACHE_BACKEND]
+CACHES = {
+    "default": {
+        "BACKEND": _cache_class,
+        "LOCATION": os.getenv("CACHE_LOCATION", "").strip() or _cache_location,
+        "TIMEOUT": _env_int("CACHE_TIMEOUT", 300),
+        # Prefix and version keep deployments sharing one server apart; raising
+        # CACHE_VERSION drops every key at once.
+        "KEY_PREFIX": os.getenv("CACHE_KEY_PREFIX", "almau"),
+        "VERSION": _env_int("CACHE_VERSION", 1),
+        "OPTIONS": {"MAX_ENTRIES": _env_int("CACHE_MAX_ENTRIES", 5000)} if CACHE_BACKEND != "redis" else {},
+    }
+}
+
+
 # Валидация паролей
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -247,9 +327,16 @@ STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Кэш сгенерированных PDF (не публичный, отдаётся только через view с проверкой прав)
+SYLLABUS_PDF_CACHE_DIR = Path(os.getenv("SYLLABUS_PDF_CACHE_DIR", BASE_DIR / "pdf_cache"))
+
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Пагинация списков (keyset: страница не зависит от размера таблицы)
+LIST_PAGE_SIZE = _env_int("LIST_PAGE_SIZE", 50)
+LIST_MAX_PAGE_SIZE = _env_int("LIST_MAX_PAGE_SIZE", 200)
+
 # Кастомный пользователь и редиректы логина
 
 AUTH_USER_MODEL = "accounts.User"
@@ -257,6 +344,25 @@ AUTHENTICATION_BACKENDS = [
     "accounts.backends.EmailOrUsernameBackend",
     "django.contrib.auth.backends.ModelBackend",
 ]
+# Users resolved from the session are cached; saves and admin bulk actions drop the entry.
+# Only a shared cache lets that reach every worker, and a db cache costs the same query
+# it saves, so caching is on by default for redis only and never with locmem.
+_SHARED_FAST_CACHE = CACHE_BACKEND == "redis"
+AUTH_USER_CACHE_TIMEOUT = _env_int("AUTH_USER_CACHE_TIMEOUT", 300 if _SHARED_FAST_CACHE else 0)
+if CACHE_BACKEND == "locmem":
+    AUTH_USER_CACHE_TIMEOUT = 0
+
+# Sessions: cached_db reads the session from the cache and falls back to the
+# table; db, cache and signed_cookies are also accepted. The default follows the
+# user cache: a logout must not leave the session alive in another worker's locmem.
+_SESSION_BACKENDS = {"db", "cached_db", "cache", "signed_cookies", "file"}
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "cached_db" if _SHARED_FAST_CACHE else "db").strip().lower()
+if SESSION_BACKEND not in _SESSION_BACKENDS:
+    raise ImproperlyConfigured(
+        f"Unknown SESSION_BACKEND {SESSION_BACKEND!r}; use one of: {', '.join(sorted(_SESSION_BACKENDS))}."
+    )
+SESSION_ENGINE = f"django.contrib.sessions.backends.{SESSION_BACKEND}"
+
 LOGIN_REDIRECT_URL = "dashboard"
 LOGOUT_REDIRECT_URL = "home"
 LOGIN_URL = "home"
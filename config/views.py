@@ -5,12 +5,11 @@ from django.db.models import Prefetch
 from django.shortcuts import redirect, render
 from django.views.decorators.http import require_POST
 
-from catalog.models import Course
+from core.dashboard import pending_queue, personal_counts, shared_counts
 from core.forms import AnnouncementForm
 from core.models import Announcement
 from core.notifications import build_dashboard_notifications, count_unread_notifications
 from syllabi.models import Syllabus
-from syllabi.permissions import shared_syllabi_queryset
 from workflow.models import SyllabusStatusLog
 
 
@@ -49,30 +48,19 @@ def _count_unread_notifications(user, last_seen_at=None) -> int:
 
 def _build_dashboard_context(request, announcement_form=None):
     role = request.user.role
-    my_courses_count = Course.objects.filter(owner=request.user).count()
-    shared_courses_count = Course.objects.filter(is_shared=True).count()
-    syllabi_count = Syllabus.objects.filter(creator=request.user).count()
-    shared_syllabi_count = shared_syllabi_queryset(request.user).count()
+    counts = {**personal_counts(request.user), **shared_counts(request.user)}
     announcements = Announcement.objects.select_related("created_by").all()[:6]
     can_manage_announcements = _can_manage_announcements(request.user)
 
-    pending_dean = Syllabus.objects.none()
-    pending_umu = Syllabus.objects.none()
+    pending_dean = []
+    pending_umu = []
     my_reviews = Syllabus.objects.none()
 
     if role in ["dean", "admin"]:
-        pending_dean = (
-            Syllabus.objects.filter(status=Syllabus.Status.REVIEW_DEAN)
-            .select_related("course", "creator")
-            .order_by("-updated_at")[:10]
-        )
+        pending_dean = pending_queue(Syllabus.Status.REVIEW_DEAN)
 
     if role in ["umu", "admin"]:
-        pending_umu = (
-            Syllabus.objects.filter(status=Syllabus.Status.REVIEW_UMU)
-            .select_related("course", "creator")
-            .order_by("-updated_at")[:10]
-        )
+        pending_umu = pending_queue(Syllabus.Status.REVIEW_UMU)
 
     if getattr(request.user, "is_teacher_like", False):
         correction_logs_qs = (
@@ -117,10 +105,7 @@ def _build_dashboard_context(request, announcement_form=None):
 
     return {
         "role": role,
-        "my_courses_count": my_courses_count,
-        "shared_courses_count": shared_courses_count,
-        "syllabi_count": syllabi_count,
-        "shared_syllabi_count": shared_syllabi_count,
+        **counts,
         "pending_dean": pending_dean,
         "pending_umu": pending_umu,
         "my_reviews": my_reviews,
@@ -0,0 +1,53 @@
+"""
+Small helpers around the default cache.
+
+Cached values live under a per-namespace version number; bumping the version
+invalidates every key in the namespace at once without needing key scans
+(which locmem/file/db backends do not support). A new version counter starts
+from the clock rather than 1, so if the counter is evicted from a shared cache
+the keys it left behind are not read again.
+"""
+
+import time
+
+from django.core.cache import cache
+
+DEFAULT_TIMEOUT = 300
+
+
+def _version_key(namespace: str) -> str:
+    return f"ns:{namespace}:version"
+
+
+def namespace_version(namespace: str) -> int:
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        initial = int(time.time())
+        if cache.add(key, initial, None):
+            return initial
+        # Another process created the counter first.
+        version = cache.get(key) or initial
+    return version
+
+
+def bump_namespace(namespace: str) -> None:
+    key = _version_key(namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time()), None)
+
+
+def namespaced_key(namespace: str, key: str) -> str:
+    return f"{namespace}:v{namespace_version(namespace)}:{key}"
+
+
+def get_or_build(namespace: str, key: str, builder, timeout: int = DEFAULT_TIMEOUT):
+    """Return the cached value for ``key`` or store the result of ``builder()``."""
+    full_key = namespaced_key(namespace, key)
+    value = cache.get(full_key)
+    if value is None:
+        value = builder()
+        cache.set(full_key, value, timeout)
+    return value
@@ -0,0 +1,57 @@
+"""
+Bulk copying of model rows.
+
+``bulk_clone`` copies one level of a tree with a single ``bulk_create`` and
+returns the old-pk -> new-instance map, which the next level uses to repoint
+its foreign keys. Note that ``bulk_create`` sends no ``post_save`` signals;
+callers refresh derived data (search index, caches) themselves.
+"""
+
+BATCH_SIZE = 500
+
+
+def copy_field_values(instance, exclude=()) -> dict:
+    """Concrete field values of ``instance`` keyed by attname, without the primary key."""
+    return {
+        field.attname: getattr(instance, field.attname)
+        for field in instance._meta.concrete_fields
+        if not field.primary_key and field.attname not in exclude and field.name not in exclude
+    }
+
+
+def bulk_clone(sources, overrides=None, remap=None, exclude=(), batch_size=BATCH_SIZE) -> dict:
+    """
+    Insert copies of ``sources`` (instances of one model) and return ``{old_pk: new_instance}``.
+
+    ``overrides`` sets attname values on every copy; it is either a dict or a
+    callable taking the source and returning one. ``remap`` maps a
+    foreign-key attname to an ``{old_pk: new_instance}`` dict from a previous level.
+    Sources whose remapped parent is missing are skipped.
+    """
+    sources = list(sources)
+    if not sources:
+        return {}
+
+    model = type(sources[0])
+    if overrides is None:
+        overrides = {}
+    remap = remap or {}
+    copies = []
+    originals = []
+    for source in sources:
+        values = copy_field_values(source, exclude)
+        values.update(overrides(source) if callable(overrides) else overrides)
+        skip = False
+        for attname, mapping in remap.items():
+            parent = mapping.get(values.get(attname))
+            if parent is None:
+                skip = True
+                break
+            values[attname] = parent.pk
+        if skip:
+            continue
+        copies.append(model(**values))
+        originals.append(source.pk)
+
+    created = model.objects.bulk_create(copies, batch_size=batch_size)
+    return dict(zip(originals, created))
@@ -1,3 +1,28 @@
+from django.conf import settings
+
+from core.cache import namespace_version
+
+
+class FragmentVersions:
+    """
+    Cache key parts for ``{% cache %}`` fragments. ``fragment_versions.release``
+    changes with each deploy; any other name is looked up as a cache namespace
+    version, only when a template actually uses it.
+    """
+
+    def __getitem__(self, name: str):
+        if name == "release":
+            return settings.FRAGMENT_CACHE_RELEASE
+        return namespace_version(name)
+
+
+def fragment_cache(request):
+    return {
+        "fragment_cache_timeout": settings.FRAGMENT_CACHE_TIMEOUT,
+        "fragment_versions": FragmentVersions(),
+    }
+
+
 def sidebar_notifications(request):
     if not getattr(request, "user", None) or not request.user.is_authenticated:
         return {
@@ -6,10 +31,11 @@ def sidebar_notifications(request):
         }
 
     try:
-        from core.notifications import build_dashboard_notifications, count_unread_notifications
+        from core.notifications import build_dashboard_notifications
 
         notifications = build_dashboard_notifications(request.user, limit=None)
-        unread_count = count_unread_notifications(request.user)
+        # The list holds every notification, so count unread ones without another query.
+        unread_count = sum(1 for item in notifications if item["is_unread"])
     except Exception:
         notifications = []
         unread_count = 0
@@ -0,0 +1,89 @@
+"""
+Dashboard counters and review queues.
+
+Personal counters come from one query over the user's row; role-wide parts
+(shared counts and the dean/UMU review queues) are identical for every user of
+a role and are cached briefly. Status changes bump the cache namespace.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from catalog.models import Course
+from core.cache import bump_namespace, get_or_build
+from syllabi.models import Syllabus
+
+DASHBOARD_NAMESPACE = "dashboard"
+# Version of the cached announcements fragment in dashboard.html.
+ANNOUNCEMENTS_NAMESPACE = "announcements"
+SHARED_COUNTS_TIMEOUT = 120
+PENDING_QUEUE_TIMEOUT = 60
+PENDING_QUEUE_LIMIT = 10
+
+
+def invalidate_dashboard() -> None:
+    bump_namespace(DASHBOARD_NAMESPACE)
+
+
+def invalidate_announcements() -> None:
+    bump_namespace(ANNOUNCEMENTS_NAMESPACE)
+
+
+def _count_subquery(queryset, field: str):
+    counted = queryset.filter(**{field: OuterRef("pk")}).order_by().values(field).annotate(total=Count("pk"))
+    return Coalesce(Subquery(counted.values("total")[:1], output_field=IntegerField()), Value(0))
+
+
+def personal_counts(user) -> dict[str, int]:
+    row = (
+        get_user_model()
+        .objects.filter(pk=user.pk)
+        .annotate(
+            my_courses_count=_count_subquery(Course.objects.all(), "owner"),
+            syllabi_count=_count_subquery(Syllabus.objects.all(), "creator"),
+        )
+        .values("my_courses_count", "syllabi_count")
+        .first()
+    )
+    return row or {"my_courses_count": 0, "syllabi_count": 0}
+
+
+def _build_shared_counts() -> dict[str, int]:
+    courses = Course.objects.aggregate(shared_courses_count=Count("pk", filter=Q(is_shared=True)))
+    syllabi = Syllabus.objects.aggregate(shared_syllabi_count=Count("pk", filter=Q(is_shared=True)))
+    return {**courses, **syllabi}
+
+
+def shared_counts(user) -> dict[str, int]:
+    counts = dict(get_or_build(DASHBOARD_NAMESPACE, "shared_counts", _build_shared_counts, SHARED_COUNTS_TIMEOUT))
+    can_view_shared = (
+        getattr(user, "is_superuser", False)
+        or getattr(user, "is_admin_like", False)
+        or getattr(user, "can_view_shared_courses", False)
+    )
+    if not can_view_shared:
+        counts["shared_syllabi_count"] = 0
+    return counts
+
+
+def pending_queue(status: str) -> list:
+    """Latest syllabi waiting in ``status``; shared by every reviewer of that stage."""
+
+    def build():
+        return list(
+            Syllabus.objects.filter(status=status)
+            .select_related("course", "creator")
+            .order_by("-updated_at")[:PENDING_QUEUE_LIMIT]
+        )
+
+    return get_or_build(DASHBOARD_NAMESPACE, f"pending:{status}", build, PENDING_QUEUE_TIMEOUT)
+
+
+def warm_dashboard() -> int:
+    """Precompute the role-wide dashboard parts; returns the number of cache entries built."""
+    get_or_build(DASHBOARD_NAMESPACE, "shared_counts", _build_shared_counts, SHARED_COUNTS_TIMEOUT)
+    review_statuses = (Syllabus.Status.REVIEW_DEAN, Syllabus.Status.REVIEW_UMU)
+    for status in review_statuses:
+        pending_queue(status)
+    return 1 + len(review_statuses)
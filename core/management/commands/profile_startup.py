@@ -0,0 +1,78 @@
+import json
+import os
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.startup_profile import find_regressions, profile_startup
+
+
+class Command(BaseCommand):
+    help = (
+        "Profile a cold Django boot: import time per package, app registry setup, "
+        "URL resolver build and template compilation. Writes JSON and checks it against a baseline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", help="Write the JSON report to this file.")
+        parser.add_argument("--json", action="store_true", help="Print the full JSON report.")
+        parser.add_argument("--top", type=int, default=25, help="Number of slowest modules to list.")
+        parser.add_argument("--baseline", help="JSON report of a previous run to compare against.")
+        parser.add_argument(
+            "--max-increase",
+            type=float,
+            default=20.0,
+            help="Fail if a phase is this many percent slower than the baseline (default 20).",
+        )
+        parser.add_argument(
+            "--min-delta-ms",
+            type=float,
+            default=50.0,
+            help="Ignore increases smaller than this many milliseconds (default 50).",
+        )
+        parser.add_argument("--budget-ms", type=float, help="Fail if the whole boot takes longer than this.")
+
+    def handle(self, *args, **options):
+        settings_module = os.environ.get("DJANGO_SETTINGS_MODULE", "config.settings")
+        try:
+            report = profile_startup(settings_module, top=max(1, options["top"]))
+        except RuntimeError as exc:
+            raise CommandError(f"Profiled boot failed:\n{exc}") from exc
+
+        if options["output"]:
+            Path(options["output"]).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            self._write_summary(report)
+
+        problems = []
+        if options["baseline"]:
+            try:
+                baseline = json.loads(Path(options["baseline"]).read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                raise CommandError(f"Cannot read baseline {options['baseline']}: {exc}") from exc
+            problems += find_regressions(report, baseline, options["max_increase"], options["min_delta_ms"])
+        if options["budget_ms"] is not None and report["wall_ms"] > options["budget_ms"]:
+            problems.append(f"wall_ms: {report['wall_ms']:.1f} ms (budget {options['budget_ms']:.1f} ms)")
+
+        if problems:
+            raise CommandError("Startup regression:\n" + "\n".join(problems))
+        if options["baseline"] or options["budget_ms"] is not None:
+            self.stdout.write(self.style.SUCCESS("Startup time is within the threshold."))
+
+    def _write_summary(self, report: dict) -> None:
+        phases = report["phases_ms"]
+        imports = report["imports"]
+        self.stdout.write(
+            f"Boot {report['wall_ms']:.0f} ms: setup {phases['setup']:.0f} ms, "
+            f"URLs {phases['urls']:.0f} ms, templates {phases['templates']:.0f} ms "
+            f"({report['templates']} files); {imports['modules']} modules imported in {imports['total_ms']:.0f} ms."
+        )
+        for title, packages in (("Apps", imports["apps"]), ("Dependencies", imports["dependencies"])):
+            self.stdout.write(f"{title}:")
+            for name, ms in list(packages.items())[:10]:
+                self.stdout.write(f"  {name:<32} {ms:>8.1f} ms")
+        self.stdout.write("Slowest imports (cumulative):")
+        for row in imports["slowest"]:
+            self.stdout.write(f"  {row['module']:<48} {row['cumulative_ms']:>8.1f} ms")
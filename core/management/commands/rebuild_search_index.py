@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for syllabi and courses."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            counts = rebuild_search_index()
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Search index rebuilt: "
+                f"{counts['syllabus']} syllabi, {counts['course']} courses."
+            )
+        )
@@ -0,0 +1,579 @@
+import random
+import time
+import zipfile
+from contextlib import contextmanager
+from datetime import timedelta
+from io import BytesIO
+from itertools import islice
+from xml.sax.saxutils import escape
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from ai_checker.models import AiCheckResult
+from catalog.models import Course, Topic, TopicLiterature, TopicQuestion
+from catalog.services import invalidate_shared_courses
+from core.dashboard import invalidate_dashboard
+from core.models import Notification
+from core.search import index_courses, index_syllabi
+from syllabi.facets import invalidate_facets
+from syllabi.models import Syllabus, SyllabusRevision, SyllabusTopic
+from workflow.models import SyllabusAuditLog, SyllabusStatusLog
+
+User = get_user_model()
+
+SCALE_PASSWORD = "Scale12345!"
+DEFAULT_ROLES = "teacher=20,program_leader=2,dean=1,umu=1"
+DEFAULT_STATUSES = "draft=25,ai_check=5,correction=15,review_dean=15,review_umu=10,approved=25,rejected=5"
+SEMESTERS = ("Fall", "Spring")
+S = Syllabus.Status
+
+# Workflow transitions that lead to each status; extra correction rounds are
+# inserted after the first submission to reach --history-depth.
+STATUS_PATHS = {
+    S.DRAFT: [],
+    S.AI_CHECK: [(S.DRAFT, S.AI_CHECK)],
+    S.CORRECTION: [(S.DRAFT, S.AI_CHECK), (S.AI_CHECK, S.CORRECTION)],
+    S.REVIEW_DEAN: [(S.DRAFT, S.AI_CHECK), (S.AI_CHECK, S.REVIEW_DEAN)],
+    S.REVIEW_UMU: [(S.DRAFT, S.AI_CHECK), (S.AI_CHECK, S.REVIEW_DEAN), (S.REVIEW_DEAN, S.REVIEW_UMU)],
+    S.APPROVED: [
+        (S.DRAFT, S.AI_CHECK),
+        (S.AI_CHECK, S.REVIEW_DEAN),
+        (S.REVIEW_DEAN, S.REVIEW_UMU),
+        (S.REVIEW_UMU, S.APPROVED),
+    ],
+    S.REJECTED: [(S.DRAFT, S.AI_CHECK), (S.AI_CHECK, S.REVIEW_DEAN), (S.REVIEW_DEAN, S.REJECTED)],
+}
+CORRECTION_ROUND = [(S.AI_CHECK, S.CORRECTION), (S.CORRECTION, S.AI_CHECK)]
+
+TOPIC_SUBJECTS = (
+    ("Введение в дисциплину", "Introduction to the discipline"),
+    ("Основные понятия", "Key concepts"),
+    ("Методы анализа", "Methods of analysis"),
+    ("Практический кейс", "Practical case study"),
+    ("Инструменты и технологии", "Tools and technologies"),
+    ("Моделирование", "Modelling"),
+    ("Проектная работа", "Project work"),
+    ("Оценка результатов", "Evaluating results"),
+)
+
+SECTION_TEXT = (
+    ("Краткое описание курса", "Course description", "course_description"),
+    ("Цель курса", "Course goal", "course_goal"),
+    ("Ожидаемые результаты", "Learning outcomes", "learning_outcomes"),
+    ("Методы обучения", "Teaching methods", "teaching_methods"),
+    ("Политика курса", "Course policy", "course_policy"),
+    ("Политика академической честности", "Academic integrity", "academic_integrity_policy"),
+    ("Политика оценивания", "Assessment policy", "assessment_policy"),
+)
+
+
+def parse_weights(value: str, allowed, option: str) -> dict[str, int]:
+    """``"a=3,b=1"`` -> ``{"a": 3, "b": 1}``; names must be in ``allowed``."""
+    weights = {}
+    for part in value.split(","):
+        if not part.strip():
+            continue
+        name, _, number = part.partition("=")
+        name = name.strip()
+        if name not in allowed:
+            raise CommandError(f"{option}: unknown value '{name}' (choose from {', '.join(allowed)}).")
+        try:
+            weights[name] = int(number)
+        except ValueError:
+            raise CommandError(f"{option}: '{part}' is not name=number.")
+        if weights[name] < 0:
+            raise CommandError(f"{option}: '{part}' is negative.")
+    if not sum(weights.values()):
+        raise CommandError(f"{option}: at least one positive value is required.")
+    return weights
+
+
+def status_history(status: str, depth: int) -> list[tuple[str, str]]:
+    path = STATUS_PATHS[status]
+    if not path:
+        return []
+    rounds = max(0, depth - len(path) + 1) // 2
+    return path[:1] + CORRECTION_ROUND * rounds + path[1:]
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """Let bulk_create keep generated ``auto_now``/``auto_now_add`` values instead of now()."""
+    fields = [
+        field
+        for model in models
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def _batches(iterable, size: int):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+# Attachments: small but valid documents that the AI extractors can read.
+
+
+def _pdf_text(value: str) -> str:
+    value = value.encode("latin-1", "replace").decode("latin-1")
+    return value.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def build_pdf(lines: list[str], lines_per_page: int = 48) -> bytes:
+    """A minimal PDF 1.4 with Helvetica text (Latin-1 only), one page per ``lines_per_page``."""
+    pages = [lines[start:start + lines_per_page] for start in range(0, len(lines), lines_per_page)] or [[]]
+    font_id = 3
+    page_ids = [4 + index * 2 for index in range(len(pages))]
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: f"<< /Type /Pages /Kids [{' '.join(f'{pid} 0 R' for pid in page_ids)}] /Count {len(pages)} >>".encode(),
+        font_id: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    }
+    for page_id, page_lines in zip(page_ids, pages):
+        text = "".join(f"({_pdf_text(line)}) Tj T* " for line in page_lines)
+        stream = f"BT /F1 11 Tf 14 TL 50 800 Td {text}ET".encode("latin-1")
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {page_id + 1} 0 R >>"
+        ).encode()
+        objects[page_id + 1] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+
+    output = BytesIO()
+    output.write(b"%PDF-1.4\n")
+    offsets = {}
+    for object_id in sorted(objects):
+        offsets[object_id] = output.tell()
+        output.write(b"%d 0 obj\n%s\nendobj\n" % (object_id, objects[object_id]))
+    xref = output.tell()
+    output.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for object_id in sorted(objects):
+        output.write(b"%010d 00000 n \n" % offsets[object_id])
+    output.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return output.getvalue()
+
+
+def build_docx(paragraphs: list[str]) -> bytes:
+    """A minimal WordprocessingML document with one run per paragraph."""
+    body = "".join(f'<w:p><w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>' for text in paragraphs)
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        "</Types>"
+    )
+    rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="word/document.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+        "</Relationships>"
+    )
+    output = BytesIO()
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", content_types)
+        archive.writestr("_rels/.rels", rels)
+        archive.writestr("word/document.xml", document)
+    return output.getvalue()
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a large synthetic dataset (faculties, users, courses, topics, syllabi, "
+        "workflow history, notifications, optional PDF/DOCX files) with batched bulk inserts "
+        "for load tests and index tuning."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--faculties", type=int, default=5)
+        parser.add_argument(
+            "--users-per-role",
+            default=DEFAULT_ROLES,
+            help=f"Users of each role per faculty (default: {DEFAULT_ROLES}).",
+        )
+        parser.add_argument("--courses-per-teacher", type=int, default=3)
+        parser.add_argument("--topics-per-course", type=int, default=15)
+        parser.add_argument("--syllabi-per-course", type=int, default=2)
+        parser.add_argument(
+            "--status-distribution",
+            default=DEFAULT_STATUSES,
+            help=f"Relative weights of syllabus statuses (default: {DEFAULT_STATUSES}).",
+        )
+        parser.add_argument(
+            "--history-depth",
+            type=int,
+            default=4,
+            help="Minimum status transitions (status and audit log rows) per submitted syllabus.",
+        )
+        parser.add_argument(
+            "--notifications-per-change",
+            type=int,
+            default=2,
+            help="Recipients notified of each status change (author first, then faculty reviewers).",
+        )
+        parser.add_argument(
+            "--attachments",
+            type=float,
+            default=0.0,
+            help="Share of syllabi (0..1) that get a generated file.",
+        )
+        parser.add_argument("--attachment-format", choices=("pdf", "docx", "mixed"), default="mixed")
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument("--prefix", default="scale", help="Prefix of generated usernames and course codes.")
+        parser.add_argument("--clear", action="store_true", help="Delete data generated earlier with this prefix.")
+        parser.add_argument("--skip-index", action="store_true", help="Do not update the search index.")
+        parser.add_argument("--seed", type=int, default=50)
+
+    def handle(self, *args, **options):
+        self.options = options
+        self.rng = random.Random(options["seed"])
+        self.batch_size = max(1, options["batch_size"])
+        self.prefix = options["prefix"].strip().lower()
+        self.now = timezone.now()
+        self.counts: dict[str, int] = {}
+        if not self.prefix:
+            raise CommandError("--prefix must not be empty.")
+        if not 0 <= options["attachments"] <= 1:
+            raise CommandError("--attachments is a share between 0 and 1.")
+        roles = parse_weights(options["users_per_role"], User.Role.values, "--users-per-role")
+        self.statuses = parse_weights(options["status_distribution"], S.values, "--status-distribution")
+
+        users = User.objects.filter(username__startswith=f"{self.prefix}_")
+        if options["clear"]:
+            self._clear(users)
+        elif users.exists():
+            raise CommandError(
+                f"Data with prefix '{self.prefix}' already exists. Use --clear to replace it or another --prefix."
+            )
+
+        started = time.perf_counter()
+        with transaction.atomic(), explicit_timestamps(
+            Syllabus, SyllabusStatusLog, SyllabusAuditLog, SyllabusRevision, Notification, AiCheckResult
+        ):
+            staff = self._create_users(max(1, options["faculties"]), roles)
+            courses = self._create_courses(staff)
+            topics = self._create_topics(courses)
+            syllabi = self._create_syllabi(courses, topics)
+            self._create_history(syllabi, staff)
+        if not options["skip_index"]:
+            self._index(courses, syllabi)
+        # bulk_create sends no signals: drop what the signal receivers would have.
+        invalidate_dashboard()
+        invalidate_facets()
+        invalidate_shared_courses()
+
+        elapsed = time.perf_counter() - started
+        total = sum(self.counts.values())
+        for label, count in self.counts.items():
+            self.stdout.write(f"{label}: {count}")
+        self.stdout.write(
+            self.style.SUCCESS(f"{total} rows in {elapsed:.1f} s ({total / max(elapsed, 0.001):.0f} rows/s).")
+        )
+        self.stdout.write(f"Password for generated accounts: {SCALE_PASSWORD}")
+
+    # Steps
+
+    def _bulk(self, model, objects) -> list:
+        created = []
+        for batch in _batches(objects, self.batch_size):
+            created.extend(model.objects.bulk_create(batch))
+        label = model._meta.label
+        self.counts[label] = self.counts.get(label, 0) + len(created)
+        return created
+
+    def _clear(self, users) -> None:
+        user_ids = list(users.values_list("pk", flat=True))
+        syllabus_ids = list(Syllabus.objects.filter(creator_id__in=user_ids).values_list("pk", flat=True))
+        course_ids = list(Course.objects.filter(owner_id__in=user_ids).values_list("pk", flat=True))
+        files = list(
+            Syllabus.objects.filter(pk__in=syllabus_ids).exclude(pdf_file="").exclude(pdf_file=None).values_list("pdf_file", flat=True)
+        )
+        # Regular deletes, so the delete signals drop search entries and cached pages too.
+        with transaction.atomic():
+            Notification.objects.filter(recipient_id__in=user_ids).delete()
+            # Topic is PROTECTed by syllabus topics, so these go before the courses.
+            SyllabusTopic.objects.filter(syllabus__creator_id__in=user_ids).delete()
+            Syllabus.objects.filter(pk__in=syllabus_ids).delete()
+            users.delete()
+        for name in files:
+            default_storage.delete(name)
+        self.stdout.write(
+            f"Removed {len(user_ids)} users, {len(course_ids)} courses, {len(syllabus_ids)} syllabi, {len(files)} files."
+        )
+
+    def _create_users(self, faculties: int, roles: dict[str, int]) -> dict:
+        password = make_password(SCALE_PASSWORD)
+        specs = []
+        for faculty_number in range(1, faculties + 1):
+            faculty = f"Факультет {faculty_number}"
+            for role, count in roles.items():
+                for number in range(1, count + 1):
+                    username = f"{self.prefix}_f{faculty_number}_{role}_{number}"
+                    specs.append(
+                        User(
+                            username=username,
+                            email=f"{username}@scale.almau.local",
+                            password=password,
+                            first_name=role.replace("_", " ").title(),
+                            last_name=f"{faculty_number}-{number}",
+                            role=role,
+                            faculty=faculty,
+                            department=f"Кафедра {number % 3 + 1}",
+                        )
+                    )
+        staff = {"authors": [], "reviewers": {}}
+        for user in self._bulk(User, specs):
+            if user.role in {User.Role.TEACHER, User.Role.PROGRAM_LEADER}:
+                staff["authors"].append(user)
+            elif user.role in {User.Role.DEAN, User.Role.UMU}:
+                staff["reviewers"].setdefault(user.faculty, []).append(user)
+        if not staff["authors"]:
+            raise CommandError("--users-per-role must include teacher or program_leader to own courses.")
+        return staff
+
+    def _create_courses(self, staff) -> list:
+        per_teacher = max(0, self.options["courses_per_teacher"])
+        return self._bulk(
+            Course,
+            (
+                Course(
+                    owner=author,
+                    code=f"{self.prefix.upper()}{author.pk}-{number}",
+                    title_ru=f"Дисциплина {author.pk}-{number}",
+                    title_en=f"Course {author.pk}-{number}",
+                    description_ru="Курс знакомит с предметной областью и ее практическим применением.",
+                    description_en="The course introduces the subject area and its practical use.",
+                    available_languages="ru,en",
+                    is_shared=self.rng.random() < 0.2,
+                )
+                for author in staff["authors"]
+                for number in range(1, per_teacher + 1)
+            ),
+        )
+
+    def _create_topics(self, courses) -> dict:
+        per_course = max(0, self.options["topics_per_course"])
+        topics = self._bulk(
+            Topic,
+            (
+                Topic(
+                    course=course,
+                    order_index=week,
+                    title_ru=f"{TOPIC_SUBJECTS[week % len(TOPIC_SUBJECTS)][0]} ({week})",
+                    title_en=f"{TOPIC_SUBJECTS[week % len(TOPIC_SUBJECTS)][1]} ({week})",
+                    description_ru="Лекция, обсуждение и практическое задание по теме.",
+                    default_hours=self.rng.choice((2, 3, 4)),
+                    week_type=Topic.WeekType.PRACTICE if week % 4 == 0 else Topic.WeekType.LECTURE,
+                )
+                for course in courses
+                for week in range(1, per_course + 1)
+            ),
+        )
+        self._bulk(
+            TopicLiterature,
+            (
+                TopicLiterature(topic=topic, title=f"Учебник к теме {topic.order_index}", author="Автор", year="2024", lit_type=lit_type)
+                for topic in topics
+                for lit_type in TopicLiterature.LitType.values
+            ),
+        )
+        self._bulk(
+            TopicQuestion,
+            (TopicQuestion(topic=topic, question_ru=f"Вопрос по теме «{topic.title_ru}»?") for topic in topics),
+        )
+        by_course: dict = {}
+        for topic in topics:
+            by_course.setdefault(topic.course_id, []).append(topic)
+        return by_course
+
+    def _create_syllabi(self, courses, topics_by_course) -> list:
+        per_course = max(0, self.options["syllabi_per_course"])
+        statuses, weights = list(self.statuses), list(self.statuses.values())
+        latest_year = self.now.year if self.now.month >= 8 else self.now.year - 1
+
+        def build():
+            for course in courses:
+                for number in range(per_course):
+                    year = latest_year - number // len(SEMESTERS)
+                    term = number % len(SEMESTERS)
+                    status = self.rng.choices(statuses, weights)[0]
+                    created_at = self.now - timedelta(days=self.rng.uniform(1, 730))
+                    syllabus = Syllabus(
+                        course=course,
+                        creator_id=course.owner_id,
+                        semester=f"{SEMESTERS[term]} {year + term}",
+                        academic_year=f"{year}-{year + 1}",
+                        status=status,
+                        total_weeks=len(topics_by_course.get(course.pk, [])) or 15,
+                        is_shared=status == S.APPROVED and self.rng.random() < 0.3,
+                        course_description=course.description_ru,
+                        course_goal="Сформировать у студентов системное понимание дисциплины.",
+                        learning_outcomes="Анализировать задачи, применять методы, оценивать результат.",
+                        teaching_methods="Лекции, кейсы, проектная работа.",
+                        course_policy="Посещение обязательно, сроки сдачи соблюдаются.",
+                        academic_integrity_policy="Плагиат и недобросовестное использование ИИ запрещены.",
+                        assessment_policy="Текущий контроль 40%, рубежный 20%, экзамен 40%.",
+                        main_literature="1. Базовый учебник. 2024.",
+                        created_at=created_at,
+                        updated_at=created_at,
+                    )
+                    syllabus.history = status_history(status, self.options["history_depth"])
+                    if syllabus.history:
+                        syllabus.updated_at = created_at + timedelta(hours=6 * len(syllabus.history))
+                    syllabus.version_number = 1 + sum(1 for _, to in syllabus.history if to == S.CORRECTION)
+                    self._attach(syllabus, course, topics_by_course.get(course.pk, []))
+                    yield syllabus
+
+        syllabi = self._bulk(Syllabus, build())
+        self._bulk(
+            SyllabusTopic,
+            (
+                SyllabusTopic(
+                    syllabus=syllabus,
+                    topic=topic,
+                    week_number=topic.order_index,
+                    week_label=str(topic.order_index),
+                    custom_hours=topic.default_hours,
+                    tasks="Домашнее задание и обсуждение результатов.",
+                )
+                for syllabus in syllabi
+                for topic in topics_by_course.get(syllabus.course_id, [])
+            ),
+        )
+        self._bulk(
+            SyllabusRevision,
+            (
+                SyllabusRevision(
+                    syllabus=syllabus,
+                    changed_by_id=syllabus.creator_id,
+                    version_number=syllabus.version_number,
+                    note="Сгенерировано seed_scale",
+                    created_at=syllabus.updated_at,
+                )
+                for syllabus in syllabi
+            ),
+        )
+        return syllabi
+
+    def _attach(self, syllabus, course, topics) -> None:
+        if self.rng.random() >= self.options["attachments"]:
+            return
+        file_format = self.options["attachment_format"]
+        if file_format == "mixed":
+            file_format = self.rng.choice(("pdf", "docx"))
+        if file_format == "pdf":
+            # Helvetica has no Cyrillic, so PDFs carry the English titles.
+            lines = [f"Syllabus {course.code}: {course.title_en}", f"{syllabus.semester}, {syllabus.academic_year}"]
+            lines += [f"{english}: {course.description_en}" for _, english, _ in SECTION_TEXT]
+            lines += [f"Week {topic.order_index}: {topic.title_en}" for topic in topics]
+            content = build_pdf(lines)
+        else:
+            lines = [f"Силлабус {course.code}: {course.title_ru}", f"{syllabus.semester}, {syllabus.academic_year}"]
+            for russian, _, field in SECTION_TEXT:
+                lines += [russian, getattr(syllabus, field) or course.description_ru]
+            lines += ["Тематический план по неделям"]
+            lines += [f"Неделя {topic.order_index}: {topic.title_ru}" for topic in topics]
+            content = build_docx(lines)
+        name = f"syllabi_pdfs/{course.code.lower()}_{syllabus.academic_year}_{syllabus.semester.split()[0].lower()}.{file_format}"
+        syllabus.pdf_file.name = default_storage.save(name, ContentFile(content))
+        self.counts["files"] = self.counts.get("files", 0) + 1
+
+    def _create_history(self, syllabi, staff) -> None:
+        per_change = max(0, self.options["notifications_per_change"])
+        authors = {user.pk: user for user in staff["authors"]}
+        pending_logs = []
+        audit_logs = []
+        checks = []
+        for syllabus in syllabi:
+            author = authors[syllabus.creator_id]
+            reviewers = staff["reviewers"].get(author.faculty, [])
+            changed_at = syllabus.created_at
+            for from_status, to_status in syllabus.history:
+                changed_at += timedelta(hours=6)
+                actor = author if from_status in {S.DRAFT, S.CORRECTION} else None
+                if from_status in {S.REVIEW_DEAN, S.REVIEW_UMU} and reviewers:
+                    actor = self.rng.choice(reviewers)
+                pending_logs.append(
+                    (
+                        SyllabusStatusLog(
+                            syllabus=syllabus,
+                            from_status=from_status,
+                            to_status=to_status,
+                            comment="Автоматическая проверка" if actor is None else "",
+                            changed_by=actor,
+                            changed_at=changed_at,
+                        ),
+                        [author] + self.rng.sample(reviewers, min(len(reviewers), max(0, per_change - 1))),
+                    )
+                )
+                audit_logs.append(
+                    SyllabusAuditLog(
+                        syllabus=syllabus,
+                        actor=actor,
+                        action=SyllabusAuditLog.Action.STATUS_CHANGED,
+                        message=f"{from_status} -> {to_status}",
+                        metadata={"from": from_status, "to": to_status},
+                        created_at=changed_at,
+                    )
+                )
+                if from_status == S.AI_CHECK:
+                    checks.append(
+                        AiCheckResult(
+                            syllabus=syllabus,
+                            model_name="seed-scale",
+                            summary="Синтетический результат проверки.",
+                            raw_result={"approved": to_status != S.CORRECTION, "seed_scale": True},
+                            created_at=changed_at,
+                        )
+                    )
+
+        logs = self._bulk(SyllabusStatusLog, (log for log, _ in pending_logs))
+        self._bulk(SyllabusAuditLog, audit_logs)
+        self._bulk(AiCheckResult, checks)
+        recent = self.now - timedelta(days=7)
+        self._bulk(
+            Notification,
+            (
+                Notification(
+                    recipient=recipient,
+                    syllabus_id=log.syllabus_id,
+                    status_log=log,
+                    title=f"Статус силлабуса: {log.to_status_label}",
+                    body=log.comment,
+                    actor_label=log.changed_by.get_full_name() if log.changed_by else "Система",
+                    created_at=log.changed_at,
+                    read_at=log.changed_at if log.changed_at < recent and self.rng.random() < 0.8 else None,
+                )
+                for log, (_, recipients) in zip(logs, pending_logs)
+                for recipient in recipients[:per_change]
+            ),
+        )
+
+    def _index(self, courses, syllabi) -> None:
+        for batch in _batches((course.pk for course in courses), self.batch_size):
+            index_courses(batch)
+        for batch in _batches((syllabus.pk for syllabus in syllabi), self.batch_size):
+            index_syllabi(batch)
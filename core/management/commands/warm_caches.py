@@ -0,0 +1,65 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ai_checker.assistant import load_guidelines
+from catalog.services import first_shared_courses_page
+from core.dashboard import warm_dashboard
+from syllabi.facets import warm_facets
+
+
+def _warm_guidelines() -> int:
+    load_guidelines()
+    return 1
+
+
+def _warm_shared_courses() -> int:
+    first_shared_courses_page()
+    return 1
+
+
+WARMERS = {
+    "dashboard": warm_dashboard,
+    "facets": warm_facets,
+    "guidelines": _warm_guidelines,
+    "shared_courses": _warm_shared_courses,
+}
+
+
+class Command(BaseCommand):
+    help = "Precompute shared cache entries (dashboard counters, facets, guidelines, shared courses) after a deploy."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--only",
+            action="append",
+            choices=sorted(WARMERS),
+            help="Warm only this part (repeatable).",
+        )
+
+    def handle(self, *args, **options):
+        if settings.CACHE_BACKEND == "locmem":
+            self.stdout.write(
+                self.style.WARNING(
+                    "CACHE_BACKEND=locmem is private to this process; warming it does not help web workers."
+                )
+            )
+
+        failed = 0
+        for name in options["only"] or WARMERS:
+            started = time.perf_counter()
+            try:
+                entries = WARMERS[name]()
+            except Exception as exc:
+                # A cold cache only costs the first request; never fail the deploy over it.
+                failed += 1
+                self.stderr.write(f"{name}: {exc}")
+                continue
+            elapsed = (time.perf_counter() - started) * 1000
+            self.stdout.write(f"{name}: {entries} entr{'y' if entries == 1 else 'ies'} in {elapsed:.0f} ms")
+
+        if failed:
+            self.stdout.write(self.style.WARNING(f"{failed} part(s) failed to warm."))
+        else:
+            self.stdout.write(self.style.SUCCESS("Caches warmed."))
@@ -0,0 +1,442 @@
+"""
+Prometheus metrics for the web and worker processes, served at ``/metrics``.
+
+Counters and histograms are module-level objects that keep their values in the
+memory of the process. With ``METRICS_DIR`` set, each process (every gunicorn
+worker and ``run_worker``) also writes a snapshot to ``<dir>/<pid>-<token>.json``
+at most every ``METRICS_FLUSH_SECONDS`` and on exit, and a scrape sums all
+snapshots, so the answer does not depend on which worker serves it. Snapshots
+of processes that have exited are folded into ``archive.json``: counters survive
+worker restarts and the directory does not grow. The directory must be local
+to the host (liveness is checked by pid). Queue depth is read from the database
+at scrape time.
+"""
+
+import atexit
+import json
+import logging
+import math
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+ARCHIVE_NAME = "archive.json"
+LOCK_NAME = ".lock"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+SLOW_BUCKETS = (0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+SIZE_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+class Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames=(), registry=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.registry = registry or REGISTRY
+        self.registry.register(self)
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _values(self) -> dict:
+        return self.registry.values.setdefault(self.name, {})
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase.")
+        key = self._key(labels)
+        with self.registry.lock:
+            values = self._values()
+            values[key] = values.get(key, 0) + amount
+        self.registry.maybe_flush()
+
+
+class Histogram(Metric):
+    """Bucket counts are stored per bucket (not cumulative) with the sum last."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS, registry=None):
+        self.buckets = tuple(float(bound) for bound in sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = len(self.buckets)
+        for position, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = position
+                break
+        with self.registry.lock:
+            values = self._values()
+            row = values.get(key)
+            if row is None:
+                row = values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            row[index] += 1
+            row[-1] += value
+        self.registry.maybe_flush()
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: dict[str, Metric] = {}
+        self.collectors = []
+        self.values: dict[str, dict] = {}
+        self.lock = threading.Lock()
+        self._token = uuid.uuid4().hex[:8]
+        self._last_flush = 0.0
+        self._exit_hook = False
+
+    def register(self, metric: Metric) -> None:
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric {metric.name} is already registered.")
+        self.metrics[metric.name] = metric
+
+    def collector(self, func):
+        """Register ``func() -> [(name, help, [(labels, value), ...])]`` as gauges read at scrape time."""
+        self.collectors.append(func)
+        return func
+
+    def reset(self) -> None:
+        with self.lock:
+            self.values.clear()
+
+    def _after_fork(self) -> None:
+        # A forked gunicorn worker must not report the values of its parent.
+        self.lock = threading.Lock()
+        self.values = {}
+        self._token = uuid.uuid4().hex[:8]
+        self._last_flush = 0.0
+
+    # Snapshots
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            data = {}
+            for name, values in self.values.items():
+                metric = self.metrics[name]
+                entry = {"kind": metric.kind, "samples": [[list(key), _copy(value)] for key, value in values.items()]}
+                if metric.kind == "histogram":
+                    entry["buckets"] = list(metric.buckets)
+                data[name] = entry
+        return data
+
+    def _directory(self) -> Path | None:
+        directory = getattr(settings, "METRICS_DIR", "")
+        return Path(directory) if directory else None
+
+    def _own_file(self, directory: Path) -> Path:
+        return directory / f"{os.getpid()}-{self._token}.json"
+
+    def flush(self) -> None:
+        directory = self._directory()
+        if directory is None:
+            return
+        self._last_flush = time.monotonic()
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            _write_json(self._own_file(directory), self.snapshot())
+        except OSError as exc:
+            logger.warning("Could not write metrics snapshot to %s: %s", directory, exc)
+        if not self._exit_hook:
+            self._exit_hook = True
+            atexit.register(self.flush)
+
+    def maybe_flush(self) -> None:
+        if time.monotonic() - self._last_flush >= settings.METRICS_FLUSH_SECONDS:
+            self.flush()
+
+    def aggregate(self) -> dict:
+        """Values of all processes: this one plus every snapshot in ``METRICS_DIR``."""
+        directory = self._directory()
+        if directory is None:
+            return self.snapshot()
+
+        self.flush()
+        layouts = self._layouts()
+        with _directory_lock(directory):
+            _archive_dead_snapshots(directory, layouts)
+            merged: dict = {}
+            for path in sorted(directory.glob("*.json")):
+                _merge(merged, _read_json(path), layouts)
+        return merged
+
+    def _layouts(self) -> dict:
+        return {
+            name: list(metric.buckets) if metric.kind == "histogram" else None
+            for name, metric in self.metrics.items()
+        }
+
+    # Exposition
+
+    def render(self) -> str:
+        data = self.aggregate()
+        lines = []
+        for name, metric in sorted(self.metrics.items()):
+            lines.append(f"# HELP {name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            entry = data.get(name)
+            if not entry:
+                continue
+            for labels, value in sorted(entry["samples"]):
+                pairs = list(zip(metric.labelnames, labels))
+                if metric.kind == "counter":
+                    lines.append(f"{name}{_labels(pairs)} {_number(value)}")
+                    continue
+                cumulative = 0
+                for bound, count in zip(list(metric.buckets) + [math.inf], value[:-1]):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_labels(pairs + [('le', _number(bound))])} {cumulative}")
+                lines.append(f"{name}_sum{_labels(pairs)} {_number(value[-1])}")
+                lines.append(f"{name}_count{_labels(pairs)} {cumulative}")
+
+        for collect in self.collectors:
+            try:
+                families = collect()
+            except Exception as exc:
+                logger.warning("Metrics collector %s failed: %s", collect.__name__, exc)
+                continue
+            for name, documentation, samples in families:
+                lines.append(f"# HELP {name} {_escape_help(documentation)}")
+                lines.append(f"# TYPE {name} gauge")
+                for labels, value in samples:
+                    lines.append(f"{name}{_labels(sorted(labels.items()))} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _write_json(path: Path, data: dict) -> None:
+    temporary = path.with_name(f".{path.name}.tmp")
+    temporary.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(temporary, path)
+
+
+def _read_json(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _copy(value):
+    return list(value) if isinstance(value, list) else value
+
+
+def _merge(target: dict, source: dict, layouts: dict) -> None:
+    """Add ``source`` samples into ``target``; histograms with an outdated bucket layout are dropped."""
+    for name, entry in source.items():
+        if name not in layouts or entry.get("buckets") != layouts[name]:
+            continue
+        current = target.setdefault(name, {**entry, "samples": []})
+        samples = {tuple(labels): value for labels, value in current["samples"]}
+        for labels, value in entry["samples"]:
+            key = tuple(labels)
+            previous = samples.get(key)
+            if previous is None:
+                samples[key] = _copy(value)
+            elif entry["kind"] == "histogram":
+                samples[key] = [a + b for a, b in zip(previous, value)]
+            else:
+                samples[key] = previous + value
+        current["samples"] = [[list(key), value] for key, value in samples.items()]
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+@contextmanager
+def _directory_lock(directory: Path):
+    with open(directory / LOCK_NAME, "a+") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _archive_dead_snapshots(directory: Path, layouts: dict) -> None:
+    dead = []
+    for path in directory.glob("*-*.json"):
+        pid = path.stem.split("-", 1)[0]
+        if pid.isdigit() and not _pid_alive(int(pid)):
+            dead.append(path)
+    if not dead:
+        return
+    archive_path = directory / ARCHIVE_NAME
+    archive = {}
+    _merge(archive, _read_json(archive_path), layouts)
+    for path in dead:
+        _merge(archive, _read_json(path), layouts)
+    _write_json(archive_path, archive)
+    for path in dead:
+        path.unlink(missing_ok=True)
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(pairs) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in pairs) + "}"
+
+
+def _number(value) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return f"{float(value):.1f}"
+    return repr(float(value))
+
+
+REGISTRY = Registry()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=REGISTRY._after_fork)
+
+
+# Series
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Request latency per URL name.",
+    ("view", "method"),
+)
+WORKER_JOB_WAIT = Histogram(
+    "worker_job_wait_seconds",
+    "Time from enqueue to claim by run_worker.",
+    ("queue",),
+    buckets=SLOW_BUCKETS,
+)
+AI_CHECK_DURATION = Histogram(
+    "ai_check_duration_seconds",
+    "run_ai_check duration by decision path.",
+    ("path",),
+    buckets=SLOW_BUCKETS,
+)
+LLM_REQUEST_DURATION = Histogram(
+    "llm_request_duration_seconds",
+    "LLM generation latency by provider.",
+    ("provider",),
+    buckets=SLOW_BUCKETS,
+)
+LLM_REQUEST_ERRORS = Counter(
+    "llm_request_errors_total",
+    "Failed LLM generations by provider.",
+    ("provider",),
+)
+TEXT_EXTRACTION_DURATION = Histogram(
+    "text_extraction_duration_seconds",
+    "Text extraction time by file type.",
+    ("file_type",),
+)
+PDF_RENDER_DURATION = Histogram(
+    "pdf_render_duration_seconds",
+    "WeasyPrint render time of one syllabus PDF.",
+)
+NOTIFICATION_FANOUT = Histogram(
+    "notification_fanout_size",
+    "Notifications created per status change.",
+    buckets=SIZE_BUCKETS,
+)
+
+
+@REGISTRY.collector
+def queue_depth():
+    from django.db.models import Count, Min
+    from django.utils import timezone
+
+    from syllabi.models import PdfRenderJob, Syllabus
+
+    samples = [
+        (
+            {"queue": "ai_check", "status": Syllabus.Status.AI_CHECK.value},
+            Syllabus.objects.filter(status=Syllabus.Status.AI_CHECK).count(),
+        )
+    ]
+    counts = dict(PdfRenderJob.objects.values_list("status").annotate(total=Count("pk")).order_by())
+    for status in (PdfRenderJob.Status.PENDING, PdfRenderJob.Status.RUNNING, PdfRenderJob.Status.FAILED):
+        samples.append(({"queue": "pdf_render", "status": status.value}, counts.get(status.value, 0)))
+
+    # A growing age means the worker is down or busy elsewhere (AI checks go first).
+    now = timezone.now()
+    oldest = {
+        "ai_check": Syllabus.objects.filter(status=Syllabus.Status.AI_CHECK).aggregate(at=Min("updated_at"))["at"],
+        "pdf_render": PdfRenderJob.objects.filter(status=PdfRenderJob.Status.PENDING).aggregate(
+            at=Min("updated_at")
+        )["at"],
+    }
+    ages = [
+        ({"queue": queue}, max(0.0, (now - queued_at).total_seconds()) if queued_at else 0.0)
+        for queue, queued_at in oldest.items()
+    ]
+    return [
+        ("worker_queue_depth", "Jobs per worker queue and status.", samples),
+        ("worker_oldest_job_age_seconds", "Wait of the oldest queued job per queue.", ages),
+    ]
+
+
+def render() -> str:
+    return REGISTRY.render()
+
+
+class MetricsMiddleware:
+    """Observes request latency per URL name; inactive when ``METRICS_ENABLED`` is off."""
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        started = time.perf_counter()
+        response = self.get_response(request)
+        match = getattr(request, "resolver_match", None)
+        view_name = (match.view_name if match else "") or "<unresolved>"
+        HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, view=view_name, method=request.method)
+        return response
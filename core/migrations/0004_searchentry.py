@@ -0,0 +1,138 @@
+from django.db import migrations, models
+
+# Frozen copies of core.search as of this migration: later changes to the live
+# module must not change what a fresh `migrate` does.
+FTS_TABLE = "core_searchentry_fts"
+SYLLABUS_DOCUMENT_FIELDS = (
+    "course__code",
+    "course__title_ru",
+    "course__title_kz",
+    "course__title_en",
+    "semester",
+    "academic_year",
+    "creator__first_name",
+    "creator__last_name",
+    "creator__username",
+)
+COURSE_DOCUMENT_FIELDS = (
+    "code",
+    "title_ru",
+    "title_kz",
+    "title_en",
+    "owner__username",
+    "owner__first_name",
+    "owner__last_name",
+)
+BACKFILL_BATCH_SIZE = 500
+
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    (
+        "ALTER TABLE core_searchentry ADD COLUMN search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('simple', content)) STORED"
+    ),
+    "CREATE INDEX core_searchentry_vector_gin ON core_searchentry USING gin (search_vector)",
+    "CREATE INDEX core_searchentry_content_trgm ON core_searchentry USING gin (content gin_trgm_ops)",
+]
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS core_searchentry_content_trgm",
+    "DROP INDEX IF EXISTS core_searchentry_vector_gin",
+    "ALTER TABLE core_searchentry DROP COLUMN IF EXISTS search_vector",
+]
+SQLITE_FORWARD = [
+    (
+        f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+        "content, content='core_searchentry', content_rowid='id', tokenize='trigram')"
+    ),
+    (
+        "CREATE TRIGGER core_searchentry_fts_ai AFTER INSERT ON core_searchentry BEGIN "
+        f"INSERT INTO {FTS_TABLE}(rowid, content) VALUES (new.id, new.content); END"
+    ),
+    (
+        "CREATE TRIGGER core_searchentry_fts_ad AFTER DELETE ON core_searchentry BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, content) VALUES ('delete', old.id, old.content); END"
+    ),
+    (
+        "CREATE TRIGGER core_searchentry_fts_au AFTER UPDATE ON core_searchentry BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, content) VALUES ('delete', old.id, old.content); "
+        f"INSERT INTO {FTS_TABLE}(rowid, content) VALUES (new.id, new.content); END"
+    ),
+]
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS core_searchentry_fts_au",
+    "DROP TRIGGER IF EXISTS core_searchentry_fts_ad",
+    "DROP TRIGGER IF EXISTS core_searchentry_fts_ai",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+
+def _create_fulltext_structures(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        for statement in POSTGRES_FORWARD:
+            schema_editor.execute(statement)
+    elif vendor == "sqlite":
+        try:
+            for statement in SQLITE_FORWARD:
+                schema_editor.execute(statement)
+        except Exception:
+            # SQLite built without FTS5/trigram: search falls back to LIKE on content.
+            for statement in SQLITE_BACKWARD:
+                schema_editor.execute(statement)
+
+
+def _drop_fulltext_structures(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        for statement in POSTGRES_BACKWARD:
+            schema_editor.execute(statement)
+    elif vendor == "sqlite":
+        for statement in SQLITE_BACKWARD:
+            schema_editor.execute(statement)
+
+
+def _normalize_document(values) -> str:
+    return " ".join(" ".join(str(value) for value in values if value).lower().split())
+
+
+def _backfill_entries(apps, schema_editor):
+    SearchEntry = apps.get_model("core", "SearchEntry")
+    sources = (
+        ("syllabus", apps.get_model("syllabi", "Syllabus"), SYLLABUS_DOCUMENT_FIELDS),
+        ("course", apps.get_model("catalog", "Course"), COURSE_DOCUMENT_FIELDS),
+    )
+    for kind, model, fields in sources:
+        rows = model.objects.order_by().values_list("pk", *fields)
+        SearchEntry.objects.bulk_create(
+            (SearchEntry(kind=kind, object_id=row[0], content=_normalize_document(row[1:])) for row in rows),
+            batch_size=BACKFILL_BATCH_SIZE,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0001_initial"),
+        ("syllabi", "0003_alter_syllabus_total_weeks_default_12"),
+        ("core", "0003_notification"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchEntry",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("kind", models.CharField(choices=[("syllabus", "Силлабус"), ("course", "Курс")], max_length=16)),
+                ("object_id", models.PositiveBigIntegerField()),
+                ("content", models.TextField(blank=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(fields=("kind", "object_id"), name="unique_search_entry_per_object"),
+                ],
+            },
+        ),
+        migrations.RunPython(_create_fulltext_structures, _drop_fulltext_structures),
+        migrations.RunPython(_backfill_entries, migrations.RunPython.noop),
+    ]
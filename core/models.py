@@ -64,6 +64,44 @@ class Notification(models.Model):
                 name="unique_notification_per_recipient_status_log",
             ),
         ]
+        indexes = [
+            models.Index(fields=["recipient", "-created_at"], name="notification_recipient_idx"),
+            # Unread counters and mark-as-read only touch rows with read_at IS NULL.
+            models.Index(
+                fields=["recipient", "-created_at"],
+                condition=models.Q(read_at__isnull=True),
+                name="notification_unread_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Notification<{self.recipient_id}:{self.syllabus_id}:{self.status_log_id}>"
+
+
+class SearchEntry(models.Model):
+    """Denormalized search document for a syllabus or course.
+
+    The backend-specific full-text structures (tsvector + trigram on PostgreSQL,
+    FTS5 on SQLite) are created in the migration and kept in sync by the
+    database itself; see ``core.search``.
+    """
+
+    class Kind(models.TextChoices):
+        SYLLABUS = "syllabus", "Силлабус"
+        COURSE = "course", "Курс"
+
+    kind = models.CharField(max_length=16, choices=Kind.choices)
+    object_id = models.PositiveBigIntegerField()
+    content = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "object_id"],
+                name="unique_search_entry_per_object",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"SearchEntry<{self.kind}:{self.object_id}>"
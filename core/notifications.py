@@ -1,6 +1,7 @@
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 
+from core.metrics import NOTIFICATION_FANOUT
 from core.models import Notification, NotificationState
 from syllabi.models import Syllabus
 
@@ -56,7 +57,8 @@ def _active_role_users(role_key: str):
     return User.objects.filter(is_active=True, role=role_key)
 
 
-def notification_recipients(status_log) -> list:
+def notification_recipients(status_log, role_users: dict | None = None) -> list:
+    """Users to notify about ``status_log``; ``role_users`` caches role lookups across calls."""
     syllabus = status_log.syllabus
     recipients_by_id = {}
     excluded_ids = {status_log.changed_by_id}
@@ -68,13 +70,20 @@ def notification_recipients(status_log) -> list:
             return
         recipients_by_id[user.pk] = user
 
+    def role_members(role_key: str):
+        if role_users is None:
+            return _active_role_users(role_key)
+        if role_key not in role_users:
+            role_users[role_key] = list(_active_role_users(role_key))
+        return role_users[role_key]
+
     if status_log.to_status == Syllabus.Status.REVIEW_DEAN:
         excluded_ids.add(syllabus.creator_id)
-        for user in _active_role_users("dean"):
+        for user in role_members("dean"):
             add_recipient(user)
     elif status_log.to_status == Syllabus.Status.REVIEW_UMU:
         excluded_ids.add(syllabus.creator_id)
-        for user in _active_role_users("umu"):
+        for user in role_members("umu"):
             add_recipient(user)
     elif status_log.to_status in {
         Syllabus.Status.CORRECTION,
@@ -86,16 +95,16 @@ def notification_recipients(status_log) -> list:
     return list(recipients_by_id.values())
 
 
-def create_notifications_for_status_log(status_log) -> int:
-    recipients = notification_recipients(status_log)
+def _build_notifications(status_log, role_users: dict | None = None) -> list:
+    recipients = notification_recipients(status_log, role_users)
     if not recipients:
-        return 0
+        return []
 
     title = notification_title(status_log)
     body = notification_body(status_log)
     actor_label = notification_actor_label(status_log)
 
-    notifications = [
+    return [
         Notification(
             recipient=user,
             syllabus=status_log.syllabus,
@@ -107,7 +116,22 @@ def create_notifications_for_status_log(status_log) -> int:
         )
         for user in recipients
     ]
-    Notification.objects.bulk_create(notifications, ignore_conflicts=True)
+
+
+def create_notifications_for_status_log(status_log) -> int:
+    return create_notifications_for_status_logs([status_log])
+
+
+def create_notifications_for_status_logs(status_logs) -> int:
+    """Fan out notifications for many logs with one role lookup per role and one INSERT."""
+    role_users: dict = {}
+    notifications = []
+    for status_log in status_logs:
+        built = _build_notifications(status_log, role_users)
+        NOTIFICATION_FANOUT.observe(len(built))
+        notifications.extend(built)
+    if notifications:
+        Notification.objects.bulk_create(notifications, ignore_conflicts=True)
     return len(notifications)
 
 
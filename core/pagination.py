@@ -0,0 +1,174 @@
+"""
+Keyset (cursor) pagination for list views.
+
+Pages are addressed by the ordering values of the row at the page edge instead
+of an OFFSET, so every page is a single indexed range scan of ``page_size + 1``
+rows no matter how deep the user has paged or how large the table is.
+The ordering must end with a unique column (normally ``id``) to be stable.
+"""
+
+import base64
+import binascii
+import datetime
+import json
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+CURSOR_PARAM = "cursor"
+PAGE_SIZE_PARAM = "page_size"
+DIRECTION_NEXT = "n"
+DIRECTION_PREVIOUS = "p"
+
+
+@dataclass
+class KeysetPage:
+    object_list: list
+    page_size: int
+    has_next: bool = False
+    has_previous: bool = False
+    next_url: str = ""
+    previous_url: str = ""
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def has_other_pages(self) -> bool:
+        return self.has_next or self.has_previous
+
+
+def _split_ordering(ordering) -> list[tuple[str, bool]]:
+    return [(name.lstrip("-"), name.startswith("-")) for name in ordering]
+
+
+def _resolve_field(model, path: str):
+    parts = path.split("__")
+    for part in parts[:-1]:
+        model = model._meta.get_field(part).related_model
+    return model._meta.get_field(parts[-1])
+
+
+def _object_value(obj, path: str):
+    value = obj
+    for part in path.split("__"):
+        if value is None:
+            return None
+        value = getattr(value, part)
+    return value
+
+
+class _CursorEncoder(DjangoJSONEncoder):
+    # DjangoJSONEncoder drops microseconds, which would make the cursor skip rows.
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def encode_cursor(values, direction: str) -> str:
+    payload = json.dumps({"v": list(values), "d": direction}, cls=_CursorEncoder)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, model, fields) -> tuple[list, str] | None:
+    """Return ``(values, direction)`` or ``None`` for a malformed cursor."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        raw_values = payload["v"]
+        direction = payload["d"]
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+        return None
+    if direction not in (DIRECTION_NEXT, DIRECTION_PREVIOUS):
+        return None
+    if not isinstance(raw_values, list) or len(raw_values) != len(fields):
+        return None
+    try:
+        values = [
+            _resolve_field(model, name).to_python(raw)
+            for (name, _desc), raw in zip(fields, raw_values)
+        ]
+    except (FieldDoesNotExist, ValidationError, AttributeError):
+        return None
+    return values, direction
+
+
+def _keyset_filter(fields, values, forward: bool) -> Q:
+    """
+    Row-value comparison ``(f1, f2, ...) > (v1, v2, ...)`` expanded into ORs,
+    honouring the direction of each ordering column.
+    """
+    condition = Q()
+    for index, (name, descending) in enumerate(fields):
+        lookup = "lt" if descending == forward else "gt"
+        term = Q(**{f"{name}__{lookup}": values[index]})
+        for prev_index, (prev_name, _desc) in enumerate(fields[:index]):
+            term &= Q(**{prev_name: values[prev_index]})
+        condition |= term
+    return condition
+
+
+def _page_size(request, default: int, maximum: int) -> int:
+    raw = request.GET.get(PAGE_SIZE_PARAM)
+    try:
+        size = int(raw) if raw else default
+    except ValueError:
+        size = default
+    return max(1, min(size, maximum))
+
+
+def _page_url(request, cursor: str) -> str:
+    params = request.GET.copy()
+    params[CURSOR_PARAM] = cursor
+    return f"?{params.urlencode()}"
+
+
+def keyset_paginate(request, queryset, ordering, page_size=None, max_page_size=None) -> KeysetPage:
+    """
+    Slice ``queryset`` by the ``cursor`` GET parameter.
+    ``ordering`` is a tuple of ``order_by`` names ending with a unique column.
+    Other GET parameters (filters) are carried over into the page links.
+    """
+    default_size = page_size or settings.LIST_PAGE_SIZE
+    maximum = max_page_size or settings.LIST_MAX_PAGE_SIZE
+    size = _page_size(request, default_size, maximum)
+
+    fields = _split_ordering(ordering)
+    decoded = decode_cursor(request.GET.get(CURSOR_PARAM, ""), queryset.model, fields)
+    forward = decoded is None or decoded[1] == DIRECTION_NEXT
+
+    if forward:
+        qs = queryset.order_by(*ordering)
+    else:
+        qs = queryset.order_by(*[name[1:] if name.startswith("-") else f"-{name}" for name in ordering])
+    if decoded is not None:
+        qs = qs.filter(_keyset_filter(fields, decoded[0], forward))
+
+    rows = list(qs[: size + 1])
+    has_more = len(rows) > size
+    rows = rows[:size]
+    if not forward:
+        rows.reverse()
+
+    if forward:
+        has_next, has_previous = has_more, decoded is not None
+    else:
+        has_next, has_previous = True, has_more
+
+    page = KeysetPage(object_list=rows, page_size=size, has_next=has_next, has_previous=has_previous)
+    if rows and has_next:
+        values = [_object_value(rows[-1], name) for name, _desc in fields]
+        page.next_url = _page_url(request, encode_cursor(values, DIRECTION_NEXT))
+    if rows and has_previous:
+        values = [_object_value(rows[0], name) for name, _desc in fields]
+        page.previous_url = _page_url(request, encode_cursor(values, DIRECTION_PREVIOUS))
+    return page
@@ -0,0 +1,207 @@
+"""
+Opt-in per-request profiling (``REQUEST_PROFILING=true``).
+
+For every request the middleware records the number and total time of SQL
+queries, repeated query fingerprints (the N+1 signature), template render time
+and total latency. Records are kept per URL name in an in-memory ring buffer of
+the process and served as JSON at ``/diagnostics/requests/``. Requests over the
+configured budgets are logged with their top query fingerprints.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.template.base import Template
+
+logger = logging.getLogger(__name__)
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\(\s*(?:%s|\?)(?:\s*,\s*(?:%s|\?))*\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_current = ContextVar("request_profile", default=None)
+_buffers: dict[str, deque] = {}
+_buffers_lock = threading.Lock()
+_template_patch_lock = threading.Lock()
+_template_patched = False
+
+
+def fingerprint(sql: str) -> str:
+    """SQL with literals and IN-lists collapsed, so repeats of one query compare equal."""
+    sql = _STRING_RE.sub("?", sql)
+    sql = _NUMBER_RE.sub("?", sql)
+    sql = _IN_LIST_RE.sub("(...)", sql)
+    return _WHITESPACE_RE.sub(" ", sql).strip()
+
+
+class RequestProfile:
+    def __init__(self):
+        self.queries = 0
+        self.query_ms = 0.0
+        self.template_ms = 0.0
+        self.template_depth = 0
+        self.fingerprint_counts: Counter = Counter()
+        self.fingerprint_ms: Counter = Counter()
+
+    def record_query(self, sql: str, elapsed_ms: float) -> None:
+        key = fingerprint(sql)
+        self.queries += 1
+        self.query_ms += elapsed_ms
+        self.fingerprint_counts[key] += 1
+        self.fingerprint_ms[key] += elapsed_ms
+
+    def duplicates(self, min_repeats: int = 2) -> list[dict]:
+        return [
+            {"sql": sql, "count": count, "ms": round(self.fingerprint_ms[sql], 2)}
+            for sql, count in self.fingerprint_counts.most_common()
+            if count >= min_repeats
+        ]
+
+    def top_queries(self, limit: int = 5) -> list[dict]:
+        ordered = sorted(self.fingerprint_ms.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [
+            {"sql": sql, "count": self.fingerprint_counts[sql], "ms": round(ms, 2)} for sql, ms in ordered
+        ]
+
+
+def _query_wrapper(execute, sql, params, many, context):
+    profile = _current.get()
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        if profile is not None:
+            profile.record_query(sql, (time.perf_counter() - started) * 1000)
+
+
+def _patch_template_render() -> None:
+    """Time the outermost Template.render of each request (includes nested templates)."""
+    global _template_patched
+    with _template_patch_lock:
+        if _template_patched:
+            return
+        original = Template.render
+
+        def render(self, context):
+            profile = _current.get()
+            if profile is None:
+                return original(self, context)
+            profile.template_depth += 1
+            started = time.perf_counter()
+            try:
+                return original(self, context)
+            finally:
+                profile.template_depth -= 1
+                if profile.template_depth == 0:
+                    profile.template_ms += (time.perf_counter() - started) * 1000
+
+        Template.render = render
+        _template_patched = True
+
+
+def record(view_name: str, entry: dict) -> None:
+    with _buffers_lock:
+        buffer = _buffers.get(view_name)
+        if buffer is None:
+            buffer = _buffers[view_name] = deque(maxlen=settings.REQUEST_PROFILING_BUFFER)
+        buffer.append(entry)
+
+
+def reset() -> None:
+    with _buffers_lock:
+        _buffers.clear()
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def report() -> dict:
+    """Per-view aggregates over the ring buffers, slowest views first."""
+    with _buffers_lock:
+        snapshot = {name: list(buffer) for name, buffer in _buffers.items()}
+
+    views = {}
+    for name, entries in snapshot.items():
+        latencies = [entry["total_ms"] for entry in entries]
+        queries = [entry["queries"] for entry in entries]
+        duplicates: Counter = Counter()
+        for entry in entries:
+            for item in entry["duplicates"]:
+                duplicates[item["sql"]] = max(duplicates[item["sql"]], item["count"])
+        views[name] = {
+            "requests": len(entries),
+            "latency_ms": {
+                "mean": round(sum(latencies) / len(latencies), 2),
+                "p95": round(_percentile(latencies, 0.95), 2),
+                "max": round(max(latencies), 2),
+            },
+            "queries": {"mean": round(sum(queries) / len(queries), 2), "max": max(queries)},
+            "query_ms_mean": round(sum(entry["query_ms"] for entry in entries) / len(entries), 2),
+            "template_ms_mean": round(sum(entry["template_ms"] for entry in entries) / len(entries), 2),
+            "duplicate_queries": [{"sql": sql, "max_count": count} for sql, count in duplicates.most_common(5)],
+            "recent": entries[-5:],
+        }
+    ordered = dict(sorted(views.items(), key=lambda item: item[1]["latency_ms"]["p95"], reverse=True))
+    return {"buffer_size": settings.REQUEST_PROFILING_BUFFER, "views": ordered}
+
+
+class RequestProfilingMiddleware:
+    def __init__(self, get_response):
+        if not settings.REQUEST_PROFILING:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        _patch_template_render()
+
+    def __call__(self, request):
+        profile = RequestProfile()
+        token = _current.set(profile)
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(_query_wrapper))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        total_ms = (time.perf_counter() - started) * 1000
+
+        match = getattr(request, "resolver_match", None)
+        view_name = (match.view_name if match else "") or "<unresolved>"
+        entry = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "total_ms": round(total_ms, 2),
+            "queries": profile.queries,
+            "query_ms": round(profile.query_ms, 2),
+            "template_ms": round(profile.template_ms, 2),
+            "duplicates": profile.duplicates(settings.REQUEST_PROFILING_DUPLICATE_REPEATS),
+        }
+        record(view_name, entry)
+        self._log_offender(view_name, entry, profile)
+        return response
+
+    def _log_offender(self, view_name: str, entry: dict, profile: RequestProfile) -> None:
+        reasons = []
+        if entry["queries"] > settings.REQUEST_PROFILING_MAX_QUERIES:
+            reasons.append(f"{entry['queries']} queries")
+        if entry["total_ms"] > settings.REQUEST_PROFILING_MAX_MS:
+            reasons.append(f"{entry['total_ms']:.0f} ms")
+        if entry["duplicates"]:
+            reasons.append(f"{len(entry['duplicates'])} repeated query shape(s)")
+        if not reasons:
+            return
+        top = "\n".join(f"  {item['count']}x {item['ms']:.1f} ms  {item['sql'][:300]}" for item in profile.top_queries())
+        logger.warning("Slow request %s %s (%s): %s\n%s", entry["method"], entry["path"], view_name, ", ".join(reasons), top)
+
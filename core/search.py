@@ -0,0 +1,221 @@
+"""
+Full-text search over syllabi and courses.
+
+Every syllabus and course has one ``SearchEntry`` row with a lowercased text
+document built from its own columns and the columns of related rows (course,
+creator, owner). Lists search that single table instead of OR-ing
+``icontains`` across joins:
+
+* PostgreSQL: generated ``tsvector`` column with a GIN index for word-prefix
+  matches, plus a ``pg_trgm`` GIN index that serves substring (ILIKE) matches.
+* SQLite: FTS5 virtual table with the trigram tokenizer, synced by triggers.
+* Anything else: substring match on the single document column.
+"""
+
+import re
+
+from django.db import connection
+from django.db.models.expressions import RawSQL
+
+from core.models import SearchEntry
+
+FTS_TABLE = "core_searchentry_fts"
+INDEX_BATCH_SIZE = 500
+
+SYLLABUS_DOCUMENT_FIELDS = (
+    "course__code",
+    "course__title_ru",
+    "course__title_kz",
+    "course__title_en",
+    "semester",
+    "academic_year",
+    "creator__first_name",
+    "creator__last_name",
+    "creator__username",
+)
+COURSE_DOCUMENT_FIELDS = (
+    "code",
+    "title_ru",
+    "title_kz",
+    "title_en",
+    "owner__username",
+    "owner__first_name",
+    "owner__last_name",
+)
+
+# Model fields whose change requires the search document to be rebuilt.
+SYLLABUS_INDEXED_FIELDS = frozenset({"course", "creator", "semester", "academic_year"})
+COURSE_INDEXED_FIELDS = frozenset({"code", "title_ru", "title_kz", "title_en", "owner"})
+USER_INDEXED_FIELDS = frozenset({"username", "first_name", "last_name"})
+
+_TSQUERY_SPECIAL_RE = re.compile(r"[&|!():*'\\<>\"]")
+_SQLITE_TRIGRAM_MIN = 3
+_fts_available: bool | None = None
+
+
+def normalize_document(values) -> str:
+    return " ".join(" ".join(str(value) for value in values if value).lower().split())
+
+
+def _query_tokens(query: str) -> list[str]:
+    return normalize_document([query]).split()
+
+
+def build_search_entries(kind: str, rows) -> list:
+    """Build unsaved entries from ``(pk, *document_fields)`` value tuples."""
+    return [
+        SearchEntry(kind=kind, object_id=row[0], content=normalize_document(row[1:]))
+        for row in rows
+    ]
+
+
+def save_search_entries(entries) -> int:
+    if not entries:
+        return 0
+    SearchEntry.objects.bulk_create(
+        entries,
+        batch_size=INDEX_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=["kind", "object_id"],
+        update_fields=["content", "updated_at"],
+    )
+    return len(entries)
+
+
+def _index_queryset(kind: str, queryset, fields) -> int:
+    rows = queryset.order_by().values_list("pk", *fields)
+    return save_search_entries(build_search_entries(kind, rows))
+
+
+def index_syllabi(syllabus_ids) -> int:
+    from syllabi.models import Syllabus
+
+    ids = list(syllabus_ids)
+    if not ids:
+        return 0
+    return _index_queryset(
+        SearchEntry.Kind.SYLLABUS,
+        Syllabus.objects.filter(pk__in=ids),
+        SYLLABUS_DOCUMENT_FIELDS,
+    )
+
+
+def index_courses(course_ids) -> int:
+    from catalog.models import Course
+
+    ids = list(course_ids)
+    if not ids:
+        return 0
+    return _index_queryset(
+        SearchEntry.Kind.COURSE,
+        Course.objects.filter(pk__in=ids),
+        COURSE_DOCUMENT_FIELDS,
+    )
+
+
+def reindex_course(course) -> None:
+    index_courses([course.pk])
+    index_syllabi(course.syllabi.values_list("pk", flat=True))
+
+
+def reindex_user(user) -> None:
+    from catalog.models import Course
+    from syllabi.models import Syllabus
+
+    index_courses(Course.objects.filter(owner=user).values_list("pk", flat=True))
+    index_syllabi(Syllabus.objects.filter(creator=user).values_list("pk", flat=True))
+
+
+def remove_from_index(kind: str, object_ids) -> int:
+    ids = list(object_ids)
+    if not ids:
+        return 0
+    deleted, _ = SearchEntry.objects.filter(kind=kind, object_id__in=ids).delete()
+    return deleted
+
+
+def rebuild_search_index() -> dict[str, int]:
+    """Rebuild all entries from scratch."""
+    from catalog.models import Course
+    from syllabi.models import Syllabus
+
+    SearchEntry.objects.all().delete()
+    counts = {
+        SearchEntry.Kind.SYLLABUS.value: _index_queryset(
+            SearchEntry.Kind.SYLLABUS, Syllabus.objects.all(), SYLLABUS_DOCUMENT_FIELDS
+        ),
+        SearchEntry.Kind.COURSE.value: _index_queryset(
+            SearchEntry.Kind.COURSE, Course.objects.all(), COURSE_DOCUMENT_FIELDS
+        ),
+    }
+
+    if connection.vendor == "sqlite" and FTS_TABLE in connection.introspection.table_names():
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+    return counts
+
+
+def _sqlite_fts_available() -> bool:
+    global _fts_available
+    if _fts_available is None:
+        _fts_available = FTS_TABLE in connection.introspection.table_names()
+    return _fts_available
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _postgres_filter(tokens: list[str]) -> tuple[str, list]:
+    ts_tokens = []
+    for token in tokens:
+        ts_tokens.extend(_TSQUERY_SPECIAL_RE.sub(" ", token).split())
+    like_pattern = f"%{_escape_like(' '.join(tokens))}%"
+    if not ts_tokens:
+        return "content ILIKE %s", [like_pattern]
+    tsquery = " & ".join(f"{token}:*" for token in ts_tokens)
+    return (
+        "(search_vector @@ to_tsquery('simple', %s) OR content ILIKE %s)",
+        [tsquery, like_pattern],
+    )
+
+
+def _sqlite_filter(tokens: list[str]) -> tuple[str, list]:
+    clauses = []
+    params: list = []
+    fts_tokens = [token for token in tokens if len(token) >= _SQLITE_TRIGRAM_MIN]
+    if fts_tokens and _sqlite_fts_available():
+        match_expr = " AND ".join('"{}"'.format(token.replace('"', '""')) for token in fts_tokens)
+        clauses.append(f"id IN (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s)")
+        params.append(match_expr)
+        like_tokens = [token for token in tokens if len(token) < _SQLITE_TRIGRAM_MIN]
+    else:
+        like_tokens = tokens
+    for token in like_tokens:
+        clauses.append("content LIKE %s ESCAPE '\\'")
+        params.append(f"%{_escape_like(token)}%")
+    return " AND ".join(clauses), params
+
+
+def search_object_ids(kind: str, query: str):
+    """
+    Return a ``values_list("object_id")`` queryset of objects matching ``query``.
+    Intended for ``.filter(pk__in=...)`` so the match runs as one subquery.
+    """
+    tokens = _query_tokens(query)
+    entries = SearchEntry.objects.filter(kind=kind)
+    if not tokens:
+        return entries.values_list("object_id", flat=True)
+
+    vendor = connection.vendor
+    if vendor == "postgresql":
+        where, params = _postgres_filter(tokens)
+    elif vendor == "sqlite":
+        where, params = _sqlite_filter(tokens)
+    else:
+        for token in tokens:
+            entries = entries.filter(content__contains=token)
+        return entries.values_list("object_id", flat=True)
+
+    matching_ids = RawSQL(f"SELECT id FROM core_searchentry WHERE {where}", params)
+    return entries.filter(id__in=matching_ids).values_list("object_id", flat=True)
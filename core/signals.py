@@ -0,0 +1,83 @@
+import logging
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from catalog.models import Course
+from catalog.services import invalidate_shared_courses
+from core import search
+from core.dashboard import invalidate_announcements
+from core.models import Announcement, SearchEntry
+from syllabi.models import Syllabus
+
+logger = logging.getLogger(__name__)
+User = get_user_model()
+
+
+def _touches(update_fields, indexed_fields) -> bool:
+    return update_fields is None or bool(set(update_fields) & indexed_fields)
+
+
+@receiver(post_save, sender=Syllabus, dispatch_uid="search_index_syllabus_saved")
+def index_saved_syllabus(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    if raw or not _touches(update_fields, search.SYLLABUS_INDEXED_FIELDS):
+        return
+    try:
+        search.index_syllabi([instance.pk])
+    except Exception as exc:
+        logger.error("Search index update failed for syllabus %s: %s", instance.pk, exc)
+
+
+@receiver(post_save, sender=Course, dispatch_uid="search_index_course_saved")
+def index_saved_course(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    if raw or not _touches(update_fields, search.COURSE_INDEXED_FIELDS):
+        return
+    try:
+        if created:
+            search.index_courses([instance.pk])
+        else:
+            search.reindex_course(instance)
+    except Exception as exc:
+        logger.error("Search index update failed for course %s: %s", instance.pk, exc)
+
+
+@receiver(post_save, sender=User, dispatch_uid="search_index_user_saved")
+def index_saved_user(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    if raw or created or not _touches(update_fields, search.USER_INDEXED_FIELDS):
+        return
+    # Owner names are shown (and sorted on) in the cached shared course list.
+    invalidate_shared_courses()
+    try:
+        search.reindex_user(instance)
+    except Exception as exc:
+        logger.error("Search index update failed for user %s: %s", instance.pk, exc)
+
+
+@receiver(post_delete, sender=Syllabus, dispatch_uid="search_index_syllabus_deleted")
+def unindex_deleted_syllabus(sender, instance, **kwargs):
+    try:
+        search.remove_from_index(SearchEntry.Kind.SYLLABUS, [instance.pk])
+    except Exception as exc:
+        logger.error("Search index removal failed for syllabus %s: %s", instance.pk, exc)
+
+
+@receiver(post_delete, sender=Course, dispatch_uid="search_index_course_deleted")
+def unindex_deleted_course(sender, instance, **kwargs):
+    try:
+        search.remove_from_index(SearchEntry.Kind.COURSE, [instance.pk])
+    except Exception as exc:
+        logger.error("Search index removal failed for course %s: %s", instance.pk, exc)
+
+
+@receiver(post_save, sender=Announcement, dispatch_uid="announcements_fragment_saved")
+@receiver(post_delete, sender=Announcement, dispatch_uid="announcements_fragment_deleted")
+def announcement_changed(sender, instance, **kwargs):
+    # Covers create_announcement and edits in the admin.
+    invalidate_announcements()
+
+
+@receiver(post_save, sender=Course, dispatch_uid="shared_courses_course_saved")
+@receiver(post_delete, sender=Course, dispatch_uid="shared_courses_course_deleted")
+def course_changed(sender, instance, **kwargs):
+    invalidate_shared_courses()
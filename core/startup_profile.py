@@ -0,0 +1,172 @@
+"""
+Startup profiling for ``manage.py profile_startup``.
+
+The boot is measured in a fresh interpreter started with ``-X importtime``:
+imports cached by the calling process would otherwise hide the cost. Run as a
+script (``python -m core.startup_profile``) the module times Django setup, the
+URL resolver and template compilation and prints them as JSON; the caller
+parses the import log from stderr. Only the standard library is imported at
+module level so the measurement starts clean.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+PHASES = ("setup", "urls", "templates")
+IMPORT_LINE_PREFIX = "import time:"
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+def _warm_templates() -> int:
+    from django.template import engines
+    from django.template.loader import get_template
+
+    count = 0
+    for engine in engines.all():
+        for directory in engine.template_dirs:
+            root = Path(directory)
+            for path in sorted(root.rglob("*.html")):
+                get_template(path.relative_to(root).as_posix(), using=engine.name)
+                count += 1
+    return count
+
+
+def measure_phases() -> dict:
+    """Time each boot phase in the current (fresh) process."""
+    import django
+
+    timings = {}
+    started = time.perf_counter()
+    django.setup()
+    timings["setup"] = _elapsed_ms(started)
+
+    from django.urls import get_resolver
+
+    started = time.perf_counter()
+    get_resolver().url_patterns
+    timings["urls"] = _elapsed_ms(started)
+
+    started = time.perf_counter()
+    templates = _warm_templates()
+    timings["templates"] = _elapsed_ms(started)
+    return {"phases_ms": timings, "templates": templates}
+
+
+def parse_importtime(log: str) -> list[dict]:
+    """Rows of ``-X importtime`` output as ``{"module", "self_us", "cumulative_us", "depth"}``."""
+    rows = []
+    for line in log.splitlines():
+        if not line.startswith(IMPORT_LINE_PREFIX):
+            continue
+        parts = line[len(IMPORT_LINE_PREFIX):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # the header line
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        rows.append(
+            {
+                "module": stripped,
+                "self_us": int(parts[0]),
+                "cumulative_us": int(parts[1]),
+                "depth": (len(name) - len(stripped)) // 2,
+            }
+        )
+    return rows
+
+
+def _first_party_packages() -> set[str]:
+    return {
+        path.name
+        for path in BASE_DIR.iterdir()
+        if path.is_dir() and (path / "__init__.py").exists()
+    }
+
+
+def summarize_imports(rows: list[dict], top: int = 25) -> dict:
+    """Self time per top-level package, split into our apps and dependencies."""
+    first_party = _first_party_packages()
+    packages: dict[str, int] = {}
+    for row in rows:
+        package = row["module"].split(".")[0]
+        packages[package] = packages.get(package, 0) + row["self_us"]
+
+    def _ms(values: dict[str, int]) -> dict[str, float]:
+        ordered = sorted(values.items(), key=lambda item: item[1], reverse=True)
+        return {name: round(us / 1000, 1) for name, us in ordered}
+
+    slowest = sorted(rows, key=lambda row: row["cumulative_us"], reverse=True)[:top]
+    return {
+        "total_ms": round(sum(packages.values()) / 1000, 1),
+        "modules": len(rows),
+        "apps": _ms({name: us for name, us in packages.items() if name in first_party}),
+        "dependencies": _ms({name: us for name, us in packages.items() if name not in first_party}),
+        "slowest": [
+            {
+                "module": row["module"],
+                "self_ms": round(row["self_us"] / 1000, 1),
+                "cumulative_ms": round(row["cumulative_us"] / 1000, 1),
+            }
+            for row in slowest
+        ],
+    }
+
+
+def profile_startup(settings_module: str, top: int = 25) -> dict:
+    """Boot Django in a child interpreter and return phase timings and import costs."""
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings_module}
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "core.startup_profile"],
+        cwd=BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    wall_ms = _elapsed_ms(started)
+    if completed.returncode != 0:
+        lines = [line for line in completed.stderr.splitlines() if not line.startswith(IMPORT_LINE_PREFIX)]
+        raise RuntimeError("\n".join(lines[-20:]) or f"exit code {completed.returncode}")
+
+    report = json.loads(completed.stdout.strip().splitlines()[-1])
+    report["wall_ms"] = wall_ms
+    report["python"] = sys.version.split()[0]
+    report["imports"] = summarize_imports(parse_importtime(completed.stderr), top=top)
+    return report
+
+
+def tracked_metrics(report: dict) -> dict[str, float]:
+    """Flat metric map compared against a baseline."""
+    metrics = {f"{phase}_ms": report["phases_ms"][phase] for phase in PHASES}
+    metrics["imports_ms"] = report["imports"]["total_ms"]
+    metrics["wall_ms"] = report["wall_ms"]
+    return metrics
+
+
+def find_regressions(report: dict, baseline: dict, max_increase_pct: float, min_delta_ms: float) -> list[str]:
+    """
+    Metrics that grew more than ``max_increase_pct`` over ``baseline``. Changes
+    smaller than ``min_delta_ms`` are ignored: short phases are noisy.
+    """
+    current = tracked_metrics(report)
+    previous = tracked_metrics(baseline)
+    problems = []
+    for name, value in current.items():
+        before = previous.get(name)
+        if not before:
+            continue
+        limit = before * (1 + max_increase_pct / 100)
+        if value > limit and value - before >= min_delta_ms:
+            problems.append(f"{name}: {value:.1f} ms (baseline {before:.1f} ms, limit {limit:.1f} ms)")
+    return problems
+
+
+if __name__ == "__main__":
+    print(json.dumps(measure_phases()))
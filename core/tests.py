@@ -1,12 +1,32 @@
+import json
+import os
+import tempfile
+from io import StringIO
 from pathlib import Path
+from unittest import mock
 
 from django.contrib.auth import get_user_model
 from django.conf import settings
-from django.test import SimpleTestCase, TestCase
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.http import HttpResponse
+from django.db import connection
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
-from catalog.models import Course
-from syllabi.models import Syllabus
+from ai_checker.management.commands.run_worker import Command as WorkerCommand
+from catalog.models import Course, Topic, TopicLiterature, TopicQuestion
+from catalog.services import first_shared_courses_page
+from core import metrics, profiling
+from core.cache import bump_namespace, namespace_version
+from core.context_processors import FragmentVersions
+from core.models import Notification
+from core.dashboard import invalidate_announcements, pending_queue, personal_counts, warm_dashboard
+from core.startup_profile import find_regressions, parse_importtime, summarize_imports
+from syllabi.facets import warm_facets
+from syllabi.models import Syllabus, SyllabusTopic
+from workflow.models import SyllabusStatusLog
 from workflow.services import change_status
 
 
@@ -42,6 +62,18 @@ class DiagnosticsAccessTests(TestCase):
         response = self.client.get(reverse("diagnostics"))
         self.assertNotEqual(response.status_code, 403)
 
+    def test_pdf_probe_result_is_cached_between_calls(self):
+        cache.clear()
+        admin_user = User.objects.create_user(username="diag_cache", password="pass1234", role="admin")
+        self.client.force_login(admin_user)
+
+        with mock.patch("syllabi.pdf_renderer._probe", return_value="ok") as probe:
+            self.client.get(reverse("diagnostics"))
+            response = self.client.get(reverse("diagnostics"))
+
+        self.assertEqual(probe.call_count, 1)
+        self.assertEqual(response.json()["checks"]["pdf"], "ok")
+
 
 class DashboardEncodingTests(TestCase):
     def test_dean_dashboard_contains_normal_russian_text(self):
@@ -222,3 +254,483 @@ class DashboardNotificationsTests(TestCase):
     def test_mark_notifications_read_requires_authentication(self):
         response = self.client.post(reverse("notifications_mark_read"))
         self.assertEqual(response.status_code, 302)
+
+
+class DashboardStatsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.teacher = User.objects.create_user(username="stats_teacher", password="pass1234", role="teacher")
+        self.dean = User.objects.create_user(username="stats_dean", password="pass1234", role="dean")
+        course = Course.objects.create(owner=self.teacher, code="ST101", available_languages="ru", is_shared=True)
+        Course.objects.create(owner=self.teacher, code="ST102", available_languages="ru")
+        self.syllabus = Syllabus.objects.create(
+            course=course,
+            creator=self.teacher,
+            semester="Fall 2025",
+            academic_year="2025-2026",
+            status=Syllabus.Status.AI_CHECK,
+        )
+
+    def test_counters_are_computed_per_user(self):
+        self.client.force_login(self.teacher)
+        response = self.client.get(reverse("dashboard"))
+
+        self.assertEqual(response.context["my_courses_count"], 2)
+        self.assertEqual(response.context["shared_courses_count"], 1)
+        self.assertEqual(response.context["syllabi_count"], 1)
+        self.assertEqual(personal_counts(self.dean), {"my_courses_count": 0, "syllabi_count": 0})
+
+    def test_review_queue_is_cached_and_refreshed_by_status_change(self):
+        self.assertEqual(pending_queue(Syllabus.Status.REVIEW_DEAN), [])
+        with self.assertNumQueries(0):
+            pending_queue(Syllabus.Status.REVIEW_DEAN)
+
+        change_status(self.teacher, self.syllabus, Syllabus.Status.REVIEW_DEAN)
+
+        self.assertEqual(pending_queue(Syllabus.Status.REVIEW_DEAN), [self.syllabus])
+
+
+class StartupProfileTests(SimpleTestCase):
+    IMPORT_LOG = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:      1200 |       1200 |   django.utils\n"
+        "import time:      3000 |       4200 | django\n"
+        "import time:       800 |        800 |     syllabi.models\n"
+        "import time:       500 |       1300 |   syllabi\n"
+    )
+
+    def _report(self, setup=400.0, urls=30.0, templates=150.0, imports=450.0, wall=950.0):
+        return {
+            "phases_ms": {"setup": setup, "urls": urls, "templates": templates},
+            "imports": {"total_ms": imports},
+            "wall_ms": wall,
+        }
+
+    def test_importtime_log_is_grouped_by_package(self):
+        rows = parse_importtime(self.IMPORT_LOG)
+        summary = summarize_imports(rows, top=2)
+
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[0]["depth"], 1)
+        self.assertEqual(summary["apps"], {"syllabi": 1.3})
+        self.assertEqual(summary["dependencies"], {"django": 4.2})
+        self.assertEqual(summary["total_ms"], 5.5)
+        self.assertEqual([row["module"] for row in summary["slowest"]], ["django", "syllabi"])
+
+    def test_regressions_respect_percent_and_noise_floor(self):
+        baseline = self._report()
+
+        self.assertEqual(find_regressions(self._report(urls=45.0), baseline, 20, 50), [])
+        problems = find_regressions(self._report(setup=600.0, wall=1150.0), baseline, 20, 50)
+        self.assertEqual([problem.split(":")[0] for problem in problems], ["setup_ms", "wall_ms"])
+
+    def test_command_fails_on_regression(self):
+        report = self._report(setup=900.0)
+        report["templates"] = 1
+        report["imports"].update(modules=1, apps={}, dependencies={}, slowest=[])
+
+        with mock.patch("core.management.commands.profile_startup.profile_startup", return_value=report), \
+                mock.patch("pathlib.Path.read_text", return_value=json.dumps(self._report())):
+            with self.assertRaisesMessage(CommandError, "setup_ms"):
+                call_command("profile_startup", baseline="startup.json", stdout=StringIO())
+
+
+class FragmentCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.dean = User.objects.create_user(username="dean_fragments", password="pass1234", role="dean")
+        self.teacher = User.objects.create_user(username="teacher_fragments", password="pass1234", role="teacher")
+
+    def test_new_announcement_replaces_cached_fragment(self):
+        self.client.force_login(self.dean)
+        self.assertContains(self.client.get(reverse("dashboard")), "Публикаций пока нет")
+
+        self.client.post(
+            reverse("announcement_create"),
+            {"title": "FRAGMENT_TITLE", "body": "Текст объявления"},
+        )
+
+        self.assertContains(self.client.get(reverse("dashboard")), "FRAGMENT_TITLE")
+
+    def test_navigation_fragment_varies_by_role(self):
+        self.client.force_login(self.dean)
+        self.assertNotContains(self.client.get(reverse("workflow_guide")), reverse("courses_list") + '" class="nav-link"')
+
+        self.client.force_login(self.teacher)
+        response = self.client.get(reverse("workflow_guide"))
+
+        self.assertContains(response, reverse("courses_list") + '" class="nav-link"')
+        self.assertContains(response, "Роль: Преподаватель")
+
+    def test_fragment_versions_resolve_release_and_namespaces(self):
+        versions = FragmentVersions()
+        before = versions["announcements"]
+
+        invalidate_announcements()
+
+        self.assertEqual(versions["release"], settings.FRAGMENT_CACHE_RELEASE)
+        self.assertEqual(versions["announcements"], before + 1)
+
+
+class CacheWarmingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.teacher = User.objects.create_user(
+            username="teacher_warm", password="pass1234", role="teacher", first_name="Айгерим"
+        )
+        Course.objects.create(owner=self.teacher, code="WARM101", available_languages="ru", is_shared=True)
+
+    def test_warm_caches_fills_shared_entries(self):
+        call_command("warm_caches", stdout=StringIO())
+
+        with self.assertNumQueries(0):
+            page = first_shared_courses_page()
+            warm_facets()
+            warm_dashboard()
+        self.assertEqual([course.code for course in page], ["WARM101"])
+
+    def test_shared_course_list_cache_follows_course_changes(self):
+        self.client.force_login(self.teacher)
+        self.assertContains(self.client.get(reverse("shared_courses_list")), "WARM101")
+
+        Course.objects.create(owner=self.teacher, code="WARM202", available_languages="ru", is_shared=True)
+
+        self.assertContains(self.client.get(reverse("shared_courses_list")), "WARM202")
+
+    def test_new_namespace_version_starts_from_clock(self):
+        with mock.patch("core.cache.time.time", return_value=1_700_000_000):
+            self.assertEqual(namespace_version("warm_test"), 1_700_000_000)
+        bump_namespace("warm_test")
+        self.assertEqual(namespace_version("warm_test"), 1_700_000_001)
+
+
+@override_settings(REQUEST_PROFILING=True, REQUEST_PROFILING_BUFFER=3, REQUEST_PROFILING_DUPLICATE_REPEATS=2)
+class RequestProfilingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        profiling.reset()
+        self.admin = User.objects.create_user(username="admin_profiling", password="pass1234", role="admin")
+        self.teacher = User.objects.create_user(username="teacher_profiling", password="pass1234", role="teacher")
+
+    def tearDown(self):
+        profiling.reset()
+
+    def test_fingerprint_collapses_literals_and_in_lists(self):
+        self.assertEqual(
+            profiling.fingerprint("SELECT * FROM t WHERE id = 5 AND name = 'x''y' AND pk IN (%s, %s, %s)"),
+            "SELECT * FROM t WHERE id = ? AND name = ? AND pk IN (...)",
+        )
+
+    def test_requests_are_aggregated_per_view_in_a_ring_buffer(self):
+        self.client.force_login(self.teacher)
+        for _ in range(4):
+            self.client.get(reverse("workflow_guide"))
+
+        self.client.force_login(self.admin)
+        data = self.client.get(reverse("request_profile_report")).json()
+
+        guide = data["views"]["workflow_guide"]
+        self.assertEqual(guide["requests"], 3)
+        self.assertGreaterEqual(guide["queries"]["max"], 1)
+        self.assertGreater(guide["template_ms_mean"], 0)
+        self.assertEqual(guide["recent"][-1]["path"], reverse("workflow_guide"))
+
+    def test_repeated_queries_are_logged(self):
+        def view(request):
+            for pk in (1, 2, 3):
+                list(User.objects.filter(pk=pk))
+            return HttpResponse("ok")
+
+        middleware = profiling.RequestProfilingMiddleware(view)
+        with self.assertLogs("core.profiling", level="WARNING") as logs:
+            middleware(RequestFactory().get("/n-plus-one/"))
+
+        self.assertIn("repeated query shape", logs.output[0])
+        entry = profiling.report()["views"]["<unresolved>"]
+        self.assertEqual(entry["duplicate_queries"][0]["max_count"], 3)
+
+    def test_report_is_admin_only(self):
+        self.client.force_login(self.teacher)
+        self.assertEqual(self.client.get(reverse("request_profile_report")).status_code, 403)
+
+
+class MetricsTests(TestCase):
+    def setUp(self):
+        self.registry = metrics.Registry()
+        self.counter = metrics.Counter("jobs_total", "Jobs.", ("queue",), registry=self.registry)
+        self.histogram = metrics.Histogram("job_seconds", "Job time.", buckets=(1, 5), registry=self.registry)
+
+    def test_exposition_format(self):
+        self.counter.inc(queue='a"b')
+        self.counter.inc(2, queue='a"b')
+        for value in (0.5, 3, 10):
+            self.histogram.observe(value)
+
+        text = self.registry.render()
+
+        self.assertIn("# TYPE jobs_total counter", text)
+        self.assertIn('jobs_total{queue="a\\"b"} 3.0', text)
+        self.assertIn('job_seconds_bucket{le="1.0"} 1', text)
+        self.assertIn('job_seconds_bucket{le="5.0"} 2', text)
+        self.assertIn('job_seconds_bucket{le="+Inf"} 3', text)
+        self.assertIn("job_seconds_sum 13.5", text)
+        self.assertIn("job_seconds_count 3", text)
+
+    def test_labels_must_match(self):
+        with self.assertRaises(ValueError):
+            self.counter.inc(provider="x")
+
+    def test_snapshots_of_all_processes_are_summed_and_dead_ones_archived(self):
+        with tempfile.TemporaryDirectory() as directory, override_settings(METRICS_DIR=directory):
+            other = {"jobs_total": {"kind": "counter", "samples": [[["pdf"], 4]]}}
+            stale = {"job_seconds": {"kind": "histogram", "buckets": [1.0, 10.0], "samples": [[[], [1, 0, 0, 2.0]]]}}
+            Path(directory, f"{os.getppid()}-live.json").write_text(json.dumps(other))
+            Path(directory, "999999999-dead.json").write_text(json.dumps({**other, **stale}))
+            self.counter.inc(queue="pdf")
+            self.histogram.observe(2)
+
+            text = self.registry.render()
+
+            self.assertIn('jobs_total{queue="pdf"} 9.0', text)
+            # A snapshot with another bucket layout (an older release) is dropped.
+            self.assertIn("job_seconds_count 1", text)
+            names = sorted(path.name for path in Path(directory).glob("*.json"))
+            self.assertNotIn("999999999-dead.json", names)
+            self.assertIn(metrics.ARCHIVE_NAME, names)
+
+            Path(directory, f"{os.getppid()}-live.json").unlink()
+            self.assertIn('jobs_total{queue="pdf"} 5.0', self.registry.render())
+
+    def test_endpoint_reports_queue_depth_and_request_latency(self):
+        teacher = User.objects.create_user(username="teacher_metrics", password="pass1234", role="teacher")
+        course = Course.objects.create(owner=teacher, code="MET101", available_languages="ru")
+        Syllabus.objects.create(course=course, creator=teacher, status=Syllabus.Status.AI_CHECK)
+        self.client.get(reverse("healthz"))
+        admin = User.objects.create_user(username="admin_metrics", password="pass1234", role="admin")
+        self.client.force_login(admin)
+
+        response = self.client.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        text = response.content.decode()
+        self.assertIn('worker_queue_depth{queue="ai_check",status="ai_check"} 1.0', text)
+        self.assertIn('worker_oldest_job_age_seconds{queue="pdf_render"} 0.0', text)
+        self.assertIn('http_request_duration_seconds_count{view="healthz",method="GET"}', text)
+
+    @override_settings(METRICS_TOKEN="scrape-token")
+    def test_endpoint_requires_token_or_allowed_address(self):
+        # Loopback is not trusted by default: a local proxy makes every request look local.
+        self.assertEqual(self.client.get("/metrics", REMOTE_ADDR="127.0.0.1").status_code, 403)
+        self.assertEqual(self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer wrong").status_code, 403)
+        response = self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer scrape-token")
+        self.assertEqual(response.status_code, 200)
+        with override_settings(METRICS_ALLOWED_IPS=["10.0.0.5"]):
+            self.assertEqual(self.client.get("/metrics", REMOTE_ADDR="10.0.0.5").status_code, 200)
+
+
+class QueryBudgetTests(TestCase):
+    """
+    Upper bounds on queries per page at a realistic volume. The seeded rows are
+    far more than any budget, so an N+1 on topics, literature, status logs or
+    notifications fails here. Raise a budget only with a reason. Page budgets
+    include the session and user lookups of the default (uncached) settings.
+    """
+
+    COURSES = 20
+    TOPICS_PER_COURSE = 16
+    SYLLABI_PER_COURSE = 15
+    STATUS_FLOW = (Syllabus.Status.DRAFT, Syllabus.Status.AI_CHECK, Syllabus.Status.CORRECTION)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create_user(username="budget_teacher", password="pass1234", role="teacher")
+        cls.dean = User.objects.create_user(username="budget_dean", password="pass1234", role="dean")
+        cls.umu = User.objects.create_user(username="budget_umu", password="pass1234", role="umu")
+
+        courses = Course.objects.bulk_create(
+            Course(
+                owner=cls.teacher,
+                code=f"PERF{index:03d}",
+                title_ru=f"Курс {index}",
+                available_languages="ru,en",
+                is_shared=index % 2 == 0,
+            )
+            for index in range(cls.COURSES)
+        )
+        topics = Topic.objects.bulk_create(
+            Topic(course=course, order_index=week, title_ru=f"Тема {week}", description_ru="Описание темы")
+            for course in courses
+            for week in range(1, cls.TOPICS_PER_COURSE + 1)
+        )
+        TopicLiterature.objects.bulk_create(
+            TopicLiterature(topic=topic, title=f"Книга {number}", author="Автор", year="2024", lit_type=lit_type)
+            for topic in topics
+            for number, lit_type in enumerate(TopicLiterature.LitType.values)
+        )
+        TopicQuestion.objects.bulk_create(TopicQuestion(topic=topic, question_ru="Вопрос?") for topic in topics)
+
+        statuses = list(Syllabus.Status.values)
+        syllabi = Syllabus.objects.bulk_create(
+            Syllabus(
+                course=course,
+                creator=cls.teacher,
+                semester="Fall 2026",
+                academic_year=f"{2000 + number}-{2001 + number}",
+                status=statuses[number % len(statuses)],
+                course_description="Описание курса",
+                course_goal="Цель курса",
+                learning_outcomes="Результаты обучения",
+            )
+            for course in courses
+            for number in range(cls.SYLLABI_PER_COURSE)
+        )
+        topics_by_course: dict = {}
+        for topic in topics:
+            topics_by_course.setdefault(topic.course_id, []).append(topic)
+        SyllabusTopic.objects.bulk_create(
+            SyllabusTopic(syllabus=syllabus, topic=topic, week_number=topic.order_index, tasks="Задание")
+            for syllabus in syllabi
+            for topic in topics_by_course[syllabus.course_id]
+        )
+        logs = SyllabusStatusLog.objects.bulk_create(
+            SyllabusStatusLog(
+                syllabus=syllabus,
+                from_status=from_status,
+                to_status=to_status,
+                comment="Комментарий",
+                changed_by=cls.dean,
+            )
+            for syllabus in syllabi
+            for from_status, to_status in zip(cls.STATUS_FLOW, cls.STATUS_FLOW[1:])
+        )
+        Notification.objects.bulk_create(
+            Notification(recipient=recipient, syllabus_id=log.syllabus_id, status_log=log, title="Статус изменен")
+            for log in logs
+            for recipient in (cls.teacher, cls.dean)
+        )
+        cls.syllabus = syllabi[0]
+        cls.syllabus.status = Syllabus.Status.DRAFT
+        cls.syllabus.save(update_fields=["status"])
+        cls.shared_course = next(course for course in courses if course.is_shared)
+
+    def setUp(self):
+        cache.clear()
+
+    def assertMaxQueries(self, budget, func):
+        with CaptureQueriesContext(connection) as queries:
+            result = func()
+        if len(queries) > budget:
+            listing = "\n".join(f"{number}. {query['sql']}" for number, query in enumerate(queries, 1))
+            self.fail(f"{len(queries)} queries, budget {budget}:\n{listing}")
+        return result
+
+    def get(self, user, url, budget):
+        self.client.force_login(user)
+        response = self.assertMaxQueries(budget, lambda: self.client.get(url))
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_syllabus_detail(self):
+        self.get(self.teacher, reverse("syllabus_detail", args=[self.syllabus.pk]), 8)
+
+    def test_syllabi_list(self):
+        self.get(self.teacher, reverse("syllabi_list"), 5)
+        self.get(self.umu, reverse("syllabi_list"), 5)
+
+    def test_dashboard(self):
+        self.get(self.teacher, reverse("dashboard"), 9)
+        self.get(self.dean, reverse("dashboard"), 9)
+
+    def test_course_detail(self):
+        self.get(self.teacher, reverse("course_detail", args=[self.shared_course.pk]), 8)
+
+    def test_course_fork(self):
+        self.client.force_login(self.teacher)
+        url = reverse("course_fork", args=[self.shared_course.pk])
+        response = self.assertMaxQueries(17, lambda: self.client.post(url))
+        self.assertEqual(response.status_code, 302)
+
+    def test_syllabus_edit_topics_post(self):
+        topics = Topic.objects.filter(course=self.syllabus.course).order_by("order_index")
+        data = {}
+        for topic in topics[: self.TOPICS_PER_COURSE - 2]:
+            data[f"include_{topic.pk}"] = "on"
+            data[f"week_{topic.pk}"] = str(topic.order_index)
+            data[f"title_{topic.pk}"] = f"Новая тема {topic.order_index}"
+        self.client.force_login(self.teacher)
+        url = reverse("syllabus_edit_topics", args=[self.syllabus.pk])
+        response = self.assertMaxQueries(12, lambda: self.client.post(url, data))
+        self.assertEqual(response.status_code, 302)
+
+    def test_worker_iteration(self):
+        worker = WorkerCommand(stdout=StringIO())
+        queued = worker._next_ai_check()
+        reply = '{"approved": true, "feedback": "<p>OK</p>"}'
+        with mock.patch("ai_checker.services.generate_text", return_value=reply):
+            self.assertMaxQueries(12, lambda: worker._process_ai_check(worker._next_ai_check()))
+        queued.refresh_from_db()
+        self.assertNotEqual(queued.status, Syllabus.Status.AI_CHECK)
+
+
+class SeedScaleTests(TestCase):
+    def setUp(self):
+        self.media = tempfile.TemporaryDirectory()
+        self.addCleanup(self.media.cleanup)
+        override = override_settings(MEDIA_ROOT=self.media.name)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def seed(self, *args):
+        call_command(
+            "seed_scale",
+            "--faculties=2",
+            "--users-per-role=teacher=2,dean=1,umu=1",
+            "--courses-per-teacher=2",
+            "--topics-per-course=4",
+            "--syllabi-per-course=3",
+            "--status-distribution=approved=1,correction=1",
+            "--history-depth=4",
+            "--attachments=1",
+            "--batch-size=7",
+            *args,
+            stdout=StringIO(),
+        )
+
+    def test_generates_consistent_workflow_data(self):
+        self.seed()
+
+        self.assertEqual(User.objects.filter(username__startswith="scale_").count(), 8)
+        syllabi = Syllabus.objects.filter(creator__username__startswith="scale_")
+        self.assertEqual(syllabi.count(), 2 * 2 * 2 * 3)
+        self.assertEqual(SyllabusTopic.objects.filter(syllabus__in=syllabi).count(), 24 * 4)
+        for syllabus in syllabi.prefetch_related("status_logs"):
+            logs = sorted(syllabus.status_logs.all(), key=lambda log: log.changed_at)
+            self.assertGreaterEqual(len(logs), 4)
+            self.assertEqual(logs[0].from_status, Syllabus.Status.DRAFT)
+            self.assertEqual(logs[-1].to_status, syllabus.status)
+            self.assertGreaterEqual(syllabus.updated_at, logs[-1].changed_at)
+        # The author and one faculty reviewer hear about every change.
+        self.assertEqual(
+            Notification.objects.filter(syllabus__in=syllabi).count(),
+            SyllabusStatusLog.objects.filter(syllabus__in=syllabi).count() * 2,
+        )
+
+    def test_attachments_are_readable_documents(self):
+        from ai_checker.services import extract_text_from_file
+
+        self.seed("--attachment-format=pdf")
+        syllabus = Syllabus.objects.filter(creator__username__startswith="scale_").first()
+        self.assertTrue(syllabus.pdf_file.name.endswith(".pdf"))
+        with syllabus.pdf_file.open("rb") as handle:
+            self.assertTrue(handle.read().startswith(b"%PDF-1.4"))
+
+        self.seed("--clear", "--attachment-format=docx")
+        syllabus = Syllabus.objects.filter(creator__username__startswith="scale_").first()
+        self.assertIn("Тематический план по неделям", extract_text_from_file(syllabus.pdf_file.path))
+        self.assertEqual(len(list(Path(self.media.name, "syllabi_pdfs").glob("*.pdf"))), 0)
+
+    def test_existing_prefix_requires_clear(self):
+        self.seed()
+        with self.assertRaises(CommandError):
+            self.seed()
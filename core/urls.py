@@ -1,10 +1,12 @@
 from django.urls import path
 
-from .views import diagnostics, healthz, mark_notifications_read, workflow_guide
+from .views import diagnostics, healthz, mark_notifications_read, metrics, request_profile_report, workflow_guide
 
 urlpatterns = [
     path("healthz/", healthz, name="healthz"),
     path("diagnostics/", diagnostics, name="diagnostics"),
+    path("diagnostics/requests/", request_profile_report, name="request_profile_report"),
+    path("metrics", metrics, name="metrics"),
     path("guide/", workflow_guide, name="workflow_guide"),
     path("notifications/mark-read/", mark_notifications_read, name="notifications_mark_read"),
 ]
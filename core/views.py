@@ -1,15 +1,19 @@
+import hmac
 import os
-from io import BytesIO
 from pathlib import Path
 
 from django.contrib.auth.decorators import login_required
 from django.conf import settings
 from django.db import connection
 from django.db.migrations.executor import MigrationExecutor
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import render
 from django.views.decorators.http import require_POST
 
+from syllabi.pdf_renderer import probe_renderer
+from . import metrics as metrics_registry
+from . import profiling
+
 
 def _check_db():
     with connection.cursor() as cursor:
@@ -109,22 +113,44 @@ def diagnostics(request):
     except Exception as exc:
         fail("media", f"{type(exc).__name__}: {exc}")
 
-    try:
-        from weasyprint import HTML  # type: ignore
-
-        buffer = BytesIO()
-        HTML(string="<html><body>ok</body></html>").write_pdf(target=buffer)
-        if buffer.getbuffer().nbytes == 0:
-            fail("pdf", "empty output")
-        else:
-            result["checks"]["pdf"] = "ok"
-    except Exception as exc:
-        fail("pdf", f"{type(exc).__name__}: {exc}")
+    pdf_check = probe_renderer()
+    if pdf_check == "ok":
+        result["checks"]["pdf"] = "ok"
+    else:
+        fail("pdf", pdf_check.removeprefix("fail: "))
 
     code = 200 if result["status"] == "ok" else 500
     return JsonResponse(result, status=code)
 
 
+def request_profile_report(request):
+    """Per-view request profiles of this process (see core.profiling)."""
+    if not _can_access_diagnostics(request.user):
+        return JsonResponse({"status": "forbidden"}, status=403)
+    if not settings.REQUEST_PROFILING:
+        return JsonResponse({"status": "disabled", "hint": "Set REQUEST_PROFILING=true."}, status=404)
+    return JsonResponse({"status": "ok", **profiling.report()}, json_dumps_params={"ensure_ascii": False})
+
+
+def _can_scrape_metrics(request) -> bool:
+    token = settings.METRICS_TOKEN
+    header = request.headers.get("Authorization", "")
+    if token and hmac.compare_digest(header.encode(), f"Bearer {token}".encode()):
+        return True
+    if request.META.get("REMOTE_ADDR") in settings.METRICS_ALLOWED_IPS:
+        return True
+    return _can_access_diagnostics(request.user)
+
+
+def metrics(request):
+    """Prometheus text exposition of all processes (see core.metrics)."""
+    if not settings.METRICS_ENABLED:
+        return JsonResponse({"status": "disabled", "hint": "Set METRICS_ENABLED=true."}, status=404)
+    if not _can_scrape_metrics(request):
+        return JsonResponse({"status": "forbidden"}, status=403)
+    return HttpResponse(metrics_registry.render(), content_type=metrics_registry.CONTENT_TYPE)
+
+
 @login_required
 def workflow_guide(request):
     return render(request, "guide/workflow_guide.html")
@@ -7,4 +7,6 @@ pip install -r requirements.txt
 pip install httpx==0.28.1 pypdf==5.1.0 "markitdown[pdf]==0.1.4"
 
 python manage.py migrate --noinput
+# No-op unless CACHE_BACKEND=db.
+python manage.py createcachetable
 python manage.py collectstatic --noinput
@@ -2,7 +2,13 @@
 set -euo pipefail
 
 # Run AI worker in background so queue processing works on free single-service deploy.
-python manage.py run_worker &
+# It runs at a lower CPU priority so gunicorn boots and serves requests first on the shared CPU.
+nice -n "${AI_WORKER_NICE:-10}" python manage.py run_worker &
+
+# A shared cache (CACHE_BACKEND other than locmem) is filled before the first request.
+if [ "${CACHE_BACKEND:-locmem}" != "locmem" ]; then
+  python manage.py warm_caches || true
+fi
 
 # Start Django web process in foreground.
 exec gunicorn config.wsgi:application --bind 0.0.0.0:${PORT:-8000} --workers ${WEB_CONCURRENCY:-2} --timeout 180
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Syllabus, SyllabusTopic, SyllabusRevision
+from .models import PdfRenderJob, Syllabus, SyllabusTopic, SyllabusRevision
 
 
 @admin.register(Syllabus)
@@ -22,3 +22,10 @@ class SyllabusRevisionAdmin(admin.ModelAdmin):
     list_display = ("syllabus", "version_number", "changed_by", "created_at", "note")
     list_filter = ("created_at",)
     search_fields = ("syllabus__course__code", "note", "changed_by__username")
+
+
+@admin.register(PdfRenderJob)
+class PdfRenderJobAdmin(admin.ModelAdmin):
+    list_display = ("syllabus", "version_number", "status", "attempts", "updated_at")
+    list_filter = ("status",)
+    search_fields = ("syllabus__course__code",)
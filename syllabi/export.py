@@ -0,0 +1,134 @@
+"""
+Bulk export of syllabus files as a streamed ZIP archive.
+
+The archive is produced entry by entry into a small in-memory buffer that is
+drained after every chunk, so memory use is bounded by ``CHUNK_SIZE`` rather
+than by the archive size. Only already rendered (cached) or uploaded files are
+packed; missing PDFs are queued for the worker and listed in ``missing.txt``.
+A cached PDF counts only if it was rendered from the current content, the same
+check a single download makes, so files left behind by writes that skipped the
+signals are never packed.
+"""
+
+import io
+import re
+import zipfile
+
+from . import pdf_cache
+from .models import Syllabus
+from .pdf_jobs import enqueue_pdf_render
+from .services import render_syllabus_content
+
+CHUNK_SIZE = 256 * 1024
+MISSING_MANIFEST_NAME = "missing.txt"
+_UNSAFE_NAME_RE = re.compile(r"[^\w.\-]+", re.UNICODE)
+
+
+def export_queryset(filters: dict):
+    """Syllabi matching export filters: ``year``, ``semester``, ``faculty``, ``status``."""
+    status = filters.get("status") or Syllabus.Status.APPROVED
+    syllabi = Syllabus.objects.filter(status=status).select_related("course").order_by("course__code", "pk")
+    if filters.get("year"):
+        syllabi = syllabi.filter(academic_year=filters["year"])
+    if filters.get("semester"):
+        syllabi = syllabi.filter(semester=filters["semester"])
+    if filters.get("faculty"):
+        syllabi = syllabi.filter(creator__faculty__iexact=filters["faculty"])
+    return syllabi
+
+
+def _safe(value: str) -> str:
+    return _UNSAFE_NAME_RE.sub("_", value or "").strip("_") or "x"
+
+
+def archive_name(syllabus, extension: str = ".pdf") -> str:
+    parts = (syllabus.course.code, syllabus.semester, syllabus.academic_year, f"id{syllabus.pk}")
+    return "_".join(_safe(part) for part in parts) + extension
+
+
+def export_source(syllabus):
+    """Return ``(archive name, opener)`` for the file to pack, or ``None`` if not ready."""
+    if syllabus.pdf_file:
+        name = syllabus.pdf_file.name
+        extension = "." + name.rsplit(".", 1)[-1].lower() if "." in name else ".pdf"
+        return archive_name(syllabus, extension), lambda: syllabus.pdf_file.open("rb")
+    cached = pdf_cache.find_cached_pdf(syllabus, render_syllabus_content(syllabus)[1])
+    if cached is None:
+        return None
+    return archive_name(syllabus), lambda: cached.open("rb")
+
+
+def export_progress(syllabi) -> dict[str, int]:
+    """Count ready files; missing or outdated PDFs are queued so the count catches up."""
+    ready = 0
+    total = 0
+    for syllabus in syllabi.iterator(chunk_size=500):
+        total += 1
+        if export_source(syllabus) is not None:
+            ready += 1
+        else:
+            enqueue_pdf_render(syllabus)
+    return {"total": total, "ready": ready, "missing": total - ready}
+
+
+class _StreamBuffer(io.RawIOBase):
+    """Write-only, non-seekable sink; ``zipfile`` switches to data descriptors for it."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_zip(syllabi, enqueue_missing: bool = True):
+    """
+    Yield ZIP archive bytes for ``syllabi``.
+    PDFs are stored without recompression (they are already compressed).
+    """
+    return (chunk for chunk in _iter_zip_chunks(syllabi, enqueue_missing) if chunk)
+
+
+def _iter_zip_chunks(syllabi, enqueue_missing: bool):
+    buffer = _StreamBuffer()
+    missing: list[str] = []
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        for syllabus in syllabi.iterator(chunk_size=200):
+            source = export_source(syllabus)
+            if source is None:
+                missing.append(archive_name(syllabus))
+                if enqueue_missing:
+                    enqueue_pdf_render(syllabus)
+                continue
+
+            name, opener = source
+            try:
+                with opener() as src, archive.open(name, mode="w") as dest:
+                    while chunk := src.read(CHUNK_SIZE):
+                        dest.write(chunk)
+                        yield buffer.drain()
+            except FileNotFoundError:
+                # Cache file was invalidated between lookup and read.
+                missing.append(name)
+            yield buffer.drain()
+
+        if missing:
+            archive.writestr(
+                MISSING_MANIFEST_NAME,
+                "PDF ещё не сформированы (поставлены в очередь):\n" + "\n".join(missing) + "\n",
+            )
+    yield buffer.drain()
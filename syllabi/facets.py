@@ -0,0 +1,90 @@
+"""
+Filter facets (years, courses, authors) for syllabus lists.
+
+All three option lists come from one GROUP BY over the scope's base queryset
+and are cached per scope until any syllabus, course code or author name changes.
+"""
+
+from django.db.models import Count
+
+from core.cache import bump_namespace, get_or_build
+
+FACETS_NAMESPACE = "syllabus_facets"
+FACETS_TIMEOUT = 600
+
+SCOPE_ALL = "all"
+SCOPE_SHARED = "shared"
+
+# Syllabus fields that decide which facet bucket (and scope) a row falls into.
+SYLLABUS_FACET_FIELDS = frozenset({"academic_year", "course", "creator", "status", "is_shared"})
+
+
+def creator_scope(user) -> str:
+    return f"creator:{user.pk}"
+
+
+def invalidate_facets() -> None:
+    bump_namespace(FACETS_NAMESPACE)
+
+
+def compute_facets(queryset) -> dict[str, list[dict]]:
+    rows = (
+        queryset.order_by()
+        .values(
+            "academic_year",
+            "course_id",
+            "course__code",
+            "creator_id",
+            "creator__first_name",
+            "creator__last_name",
+            "creator__username",
+        )
+        .annotate(total=Count("id"))
+    )
+
+    years: dict[str, int] = {}
+    courses: dict[int, dict] = {}
+    creators: dict[int, dict] = {}
+    for row in rows:
+        total = row["total"]
+        years[row["academic_year"]] = years.get(row["academic_year"], 0) + total
+
+        course = courses.setdefault(
+            row["course_id"], {"id": row["course_id"], "code": row["course__code"], "count": 0}
+        )
+        course["count"] += total
+
+        full_name = f"{row['creator__first_name']} {row['creator__last_name']}".strip()
+        creator = creators.setdefault(
+            row["creator_id"],
+            {
+                "id": row["creator_id"],
+                "label": full_name or row["creator__username"],
+                "sort_key": (row["creator__last_name"], row["creator__first_name"], row["creator__username"]),
+                "count": 0,
+            },
+        )
+        creator["count"] += total
+
+    creator_list = sorted(creators.values(), key=lambda item: item["sort_key"])
+    for item in creator_list:
+        del item["sort_key"]
+    return {
+        "years": [{"value": year, "count": count} for year, count in sorted(years.items(), reverse=True)],
+        "courses": sorted(courses.values(), key=lambda item: item["code"]),
+        "creators": creator_list,
+    }
+
+
+def syllabus_facets(queryset, scope: str) -> dict[str, list[dict]]:
+    """Facets for ``queryset`` cached under ``scope`` (one key per visibility scope)."""
+    return get_or_build(FACETS_NAMESPACE, scope, lambda: compute_facets(queryset), FACETS_TIMEOUT)
+
+
+def warm_facets() -> int:
+    """Build the two scopes shared by many users: reviewers' full list and approved shared syllabi."""
+    from .models import Syllabus
+
+    syllabus_facets(Syllabus.objects.all(), SCOPE_ALL)
+    syllabus_facets(Syllabus.objects.filter(is_shared=True, status=Syllabus.Status.APPROVED), SCOPE_SHARED)
+    return 2
@@ -151,3 +151,46 @@ class SyllabusDetailsForm(forms.ModelForm):
             "main_literature": forms.Textarea(attrs={"rows": 4, "class": "form-control"}),
             "additional_literature": forms.Textarea(attrs={"rows": 4, "class": "form-control"}),
         }
+
+
+class SyllabusRolloverForm(forms.Form):
+    """Целевой семестр для переноса силлабуса."""
+
+    semester = forms.CharField(
+        label="Семестр",
+        max_length=50,
+        widget=forms.TextInput(attrs={"class": "form-control", "placeholder": "Например: Осень 2026"}),
+    )
+    academic_year = forms.CharField(
+        label="Учебный год",
+        max_length=20,
+        widget=forms.TextInput(attrs={"class": "form-control", "placeholder": "2026-2027"}),
+    )
+
+
+class YearRolloverForm(forms.Form):
+    """Перенос всех утвержденных силлабусов учебного года (для УМУ)."""
+
+    source_academic_year = forms.CharField(
+        label="Из учебного года",
+        max_length=20,
+        widget=forms.TextInput(attrs={"class": "form-control", "placeholder": "2025-2026"}),
+    )
+    source_semester = forms.CharField(
+        label="Только семестр",
+        max_length=50,
+        required=False,
+        widget=forms.TextInput(attrs={"class": "form-control"}),
+    )
+    academic_year = forms.CharField(
+        label="В учебный год",
+        max_length=20,
+        widget=forms.TextInput(attrs={"class": "form-control", "placeholder": "2026-2027"}),
+    )
+    semester = forms.CharField(
+        label="Новый семестр",
+        max_length=50,
+        required=False,
+        help_text="Оставьте пустым, чтобы сохранить семестр исходного силлабуса.",
+        widget=forms.TextInput(attrs={"class": "form-control"}),
+    )
@@ -0,0 +1,88 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from syllabi.export import export_queryset, export_source, iter_zip
+from syllabi.models import Syllabus
+
+
+def _init_render_process():
+    # Spawned (non-fork) processes start without Django configured.
+    if not apps.ready:
+        django.setup()
+
+
+def _render_in_subprocess(syllabus_id: int) -> tuple[int, str]:
+    from syllabi.services import render_syllabus_pdf
+
+    try:
+        syllabus = Syllabus.objects.select_related("course").get(pk=syllabus_id)
+        render_syllabus_pdf(syllabus)
+    except Exception as exc:
+        return syllabus_id, str(exc)
+    return syllabus_id, ""
+
+
+class Command(BaseCommand):
+    help = "Export syllabus files as a ZIP, rendering missing PDFs in a process pool first."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", required=True, help="Path of the ZIP file to write.")
+        parser.add_argument("--year", default="", help='Academic year, e.g. "2025-2026".')
+        parser.add_argument("--semester", default="")
+        parser.add_argument("--faculty", default="", help="Faculty of the syllabus author.")
+        parser.add_argument(
+            "--status",
+            default=Syllabus.Status.APPROVED,
+            choices=[value for value, _label in Syllabus.Status.choices],
+        )
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+        parser.add_argument(
+            "--skip-render",
+            action="store_true",
+            help="Pack only files that already exist; list the rest in missing.txt.",
+        )
+
+    def handle(self, *args, **options):
+        filters = {key: options[key] for key in ("year", "semester", "faculty", "status")}
+        syllabi = export_queryset(filters)
+
+        missing_ids = [
+            syllabus.pk for syllabus in syllabi.iterator(chunk_size=500) if export_source(syllabus) is None
+        ]
+        if missing_ids and not options["skip_render"]:
+            self._render_missing(missing_ids, max(1, options["workers"]))
+
+        written = 0
+        with open(options["output"], "wb") as output:
+            for chunk in iter_zip(syllabi, enqueue_missing=False):
+                output.write(chunk)
+                written += len(chunk)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Archive written: {options['output']} ({written / 1024 / 1024:.1f} MB).")
+        )
+
+    def _render_missing(self, syllabus_ids: list[int], workers: int) -> None:
+        total = len(syllabus_ids)
+        self.stdout.write(f"Rendering {total} missing PDF(s) with {workers} process(es)...")
+        # Forked children must not share the parent's database sockets.
+        connections.close_all()
+
+        failed = 0
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_process) as pool:
+            futures = [pool.submit(_render_in_subprocess, pk) for pk in syllabus_ids]
+            for done, future in enumerate(as_completed(futures), start=1):
+                syllabus_id, error = future.result()
+                if error:
+                    failed += 1
+                    self.stderr.write(f"[{done}/{total}] syllabus {syllabus_id}: {error}")
+                else:
+                    self.stdout.write(f"[{done}/{total}] syllabus {syllabus_id} rendered")
+
+        if failed:
+            self.stdout.write(self.style.WARNING(f"{failed} PDF(s) failed and are listed in missing.txt."))
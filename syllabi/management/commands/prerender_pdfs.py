@@ -0,0 +1,67 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from syllabi import pdf_cache
+from syllabi.models import Syllabus
+from syllabi.pdf_jobs import enqueue_pdf_render
+from syllabi.pdf_renderer import PdfRendererUnavailable
+from syllabi.services import render_syllabus_content, render_syllabus_pdf
+
+
+class Command(BaseCommand):
+    help = "Render (or queue) PDFs for approved syllabi of a semester so downloads hit the cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--semester", help='Semester label, e.g. "Fall 2025".')
+        parser.add_argument("--academic-year", help='Academic year, e.g. "2025-2026".')
+        parser.add_argument(
+            "--status",
+            default=Syllabus.Status.APPROVED,
+            choices=[value for value, _label in Syllabus.Status.choices],
+        )
+        parser.add_argument("--force", action="store_true", help="Re-render even if a cached PDF exists.")
+        parser.add_argument(
+            "--enqueue",
+            action="store_true",
+            help="Only add render jobs for run_worker instead of rendering in this process.",
+        )
+
+    def handle(self, *args, **options):
+        syllabi = (
+            Syllabus.objects.filter(status=options["status"], pdf_file="")
+            .select_related("course")
+            .order_by("pk")
+        )
+        if options["semester"]:
+            syllabi = syllabi.filter(semester=options["semester"])
+        if options["academic_year"]:
+            syllabi = syllabi.filter(academic_year=options["academic_year"])
+
+        total = syllabi.count()
+        rendered = skipped = failed = 0
+        for index, syllabus in enumerate(syllabi.iterator(chunk_size=200), start=1):
+            if options["force"]:
+                pdf_cache.invalidate_syllabus_pdf(syllabus.pk)
+            elif pdf_cache.find_cached_pdf(syllabus, render_syllabus_content(syllabus)[1]) is not None:
+                skipped += 1
+                continue
+
+            if options["enqueue"]:
+                enqueue_pdf_render(syllabus)
+                rendered += 1
+                continue
+
+            try:
+                render_syllabus_pdf(syllabus)
+            except PdfRendererUnavailable as exc:
+                raise CommandError(str(exc)) from exc
+            except Exception as exc:
+                failed += 1
+                self.stderr.write(f"[{index}/{total}] syllabus {syllabus.pk}: {exc}")
+                continue
+            rendered += 1
+            self.stdout.write(f"[{index}/{total}] syllabus {syllabus.pk} rendered")
+
+        action = "queued" if options["enqueue"] else "rendered"
+        self.stdout.write(
+            self.style.SUCCESS(f"PDFs {action}: {rendered}, already cached: {skipped}, failed: {failed}.")
+        )
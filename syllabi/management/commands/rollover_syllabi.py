@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from syllabi.models import Syllabus
+from syllabi.rollover import rollover_syllabi, year_rollover_queryset
+
+
+class Command(BaseCommand):
+    help = "Copy the syllabi of an academic year into a new one as drafts (university-wide rollover)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--from-year", required=True, help='Source academic year, e.g. "2025-2026".')
+        parser.add_argument("--to-year", required=True, help='Target academic year, e.g. "2026-2027".')
+        parser.add_argument("--from-semester", default="", help="Only roll syllabi of this semester.")
+        parser.add_argument(
+            "--semester",
+            default="",
+            help="Semester of the copies; by default each copy keeps the semester of its source.",
+        )
+        parser.add_argument(
+            "--status",
+            action="append",
+            choices=[value for value, _label in Syllabus.Status.choices],
+            help="Source statuses to roll (repeatable). Default: approved.",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--dry-run", action="store_true", help="Only count the source syllabi.")
+
+    def handle(self, *args, **options):
+        sources = year_rollover_queryset(options["from_year"], options["from_semester"], options["status"])
+        if options["dry_run"]:
+            self.stdout.write(f"{sources.count()} syllabus(es) would be rolled into {options['to_year']}.")
+            return
+
+        batch_size = max(1, options["batch_size"])
+        created = skipped = 0
+        # All batches commit together; each batch is one bulk insert per table.
+        with transaction.atomic():
+            batch = []
+            for syllabus in sources.iterator(chunk_size=batch_size):
+                batch.append(syllabus)
+                if len(batch) >= batch_size:
+                    created, skipped = self._roll(batch, options, created, skipped)
+                    batch = []
+            if batch:
+                created, skipped = self._roll(batch, options, created, skipped)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rolled {created} syllabus(es) into {options['to_year']}; skipped {skipped}.")
+        )
+
+    def _roll(self, batch, options, created, skipped):
+        result = rollover_syllabi(batch, options["to_year"], options["semester"])
+        return created + len(result["created"]), skipped + result["skipped"]
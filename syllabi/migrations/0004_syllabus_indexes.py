@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("syllabi", "0003_alter_syllabus_total_weeks_default_12"),
+        ("catalog", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="syllabus",
+            index=models.Index(
+                condition=models.Q(status="ai_check"),
+                fields=["updated_at"],
+                name="syllabus_ai_check_queue_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="syllabus",
+            index=models.Index(fields=["creator", "status", "academic_year"], name="syllabus_creator_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="syllabus",
+            index=models.Index(fields=["status", "-updated_at"], name="syllabus_status_updated_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="syllabus",
+            index=models.Index(fields=["-updated_at", "-id"], name="syllabus_updated_id_idx"),
+        ),
+    ]
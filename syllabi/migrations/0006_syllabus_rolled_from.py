@@ -0,0 +1,24 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("syllabi", "0005_pdfrenderjob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="syllabus",
+            name="rolled_from",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="rollovers",
+                to="syllabi.syllabus",
+                verbose_name="Перенесен из",
+            ),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("syllabi", "0006_syllabus_rolled_from"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="pdfrenderjob",
+            name="content_hash",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+    ]
@@ -78,6 +78,14 @@ class Syllabus(models.Model):
     )
     is_shared = models.BooleanField("Доступен другим?", default=False)
     version_number = models.PositiveIntegerField("Версия", default=1)
+    rolled_from = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="rollovers",
+        verbose_name="Перенесен из",
+    )
 
     ai_feedback = models.TextField(
         "Отчет ИИ",
@@ -120,6 +128,18 @@ class Syllabus(models.Model):
         verbose_name = "Силлабус"
         verbose_name_plural = "Силлабусы"
         ordering = ["-updated_at"]
+        indexes = [
+            # Worker queue: status='ai_check' ORDER BY updated_at.
+            models.Index(
+                fields=["updated_at"],
+                condition=models.Q(status="ai_check"),
+                name="syllabus_ai_check_queue_idx",
+            ),
+            models.Index(fields=["creator", "status", "academic_year"], name="syllabus_creator_status_idx"),
+            models.Index(fields=["status", "-updated_at"], name="syllabus_status_updated_idx"),
+            # Keyset pagination of the full list.
+            models.Index(fields=["-updated_at", "-id"], name="syllabus_updated_id_idx"),
+        ]
 
     def __str__(self):
         return f"{self.course.code} | {self.semester} | {self.get_status_display()}"
@@ -180,3 +200,42 @@ class SyllabusRevision(models.Model):
 
     def __str__(self):
         return f"{self.syllabus_id} v{self.version_number}"
+
+
+class PdfRenderJob(models.Model):
+    """Queued background render of a syllabus PDF (one row per syllabus)."""
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "В очереди"
+        RUNNING = "running", "Генерируется"
+        DONE = "done", "Готово"
+        FAILED = "failed", "Ошибка"
+
+    syllabus = models.OneToOneField(
+        Syllabus,
+        on_delete=models.CASCADE,
+        related_name="pdf_render_job",
+    )
+    version_number = models.PositiveIntegerField(default=1)
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+    # Hash of the content the last failed render was given (see pdf_cache.html_hash).
+    content_hash = models.CharField(max_length=32, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["created_at"]
+        verbose_name = "Генерация PDF"
+        verbose_name_plural = "Очередь генерации PDF"
+        indexes = [
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(status="pending"),
+                name="pdf_job_pending_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.syllabus_id} v{self.version_number} {self.status}"
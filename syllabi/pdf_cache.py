@@ -0,0 +1,92 @@
+"""
+On-disk cache of generated syllabus PDFs.
+
+Files are named ``<syllabus id>-v<version>-<html hash>.pdf``. The HTML hash is
+also the ETag. A syllabus has at most one cached file; anything that changes
+its PDF content deletes the file. Downloads and the bulk export still look the
+file up by the hash of the current content, so a write that skipped the
+signals (a bulk update) cannot serve an outdated PDF.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+HASH_LENGTH = 32
+# Syllabus fields that never appear in the generated PDF.
+NON_PDF_FIELDS = frozenset({"ai_feedback", "is_shared", "pdf_file", "updated_at"})
+
+
+def cache_dir() -> Path:
+    return Path(settings.SYLLABUS_PDF_CACHE_DIR)
+
+
+def html_hash(html: str) -> str:
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()[:HASH_LENGTH]
+
+
+def cache_path(syllabus, content_hash: str) -> Path:
+    return cache_dir() / f"{syllabus.pk}-v{syllabus.version_number}-{content_hash}.pdf"
+
+
+def etag_for_path(path: Path) -> str:
+    return f'"{path.stem.rsplit("-", 1)[-1]}"'
+
+
+def find_cached_pdf(syllabus, content_hash: str | None = None) -> Path | None:
+    """The cached file of the current version; only one for ``content_hash`` if given."""
+    directory = cache_dir()
+    if not directory.is_dir():
+        return None
+    if content_hash is not None:
+        path = cache_path(syllabus, content_hash)
+        return path if path.exists() else None
+    matches = sorted(directory.glob(f"{syllabus.pk}-v{syllabus.version_number}-*.pdf"))
+    return matches[-1] if matches else None
+
+
+def store_pdf(syllabus, content_hash: str, data: bytes) -> Path | None:
+    """Write atomically so concurrent readers never see a partial file."""
+    target = cache_path(syllabus, content_hash)
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        invalidate_syllabus_pdf(syllabus.pk)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        os.replace(tmp_name, target)
+    except OSError as exc:
+        logger.error("PDF cache write failed for syllabus %s: %s", syllabus.pk, exc)
+        return None
+    return target
+
+
+def invalidate_syllabus_pdf(syllabus_id) -> int:
+    directory = cache_dir()
+    if not directory.is_dir():
+        return 0
+    removed = 0
+    for path in directory.glob(f"{syllabus_id}-v*.pdf"):
+        try:
+            path.unlink()
+            removed += 1
+        except FileNotFoundError:
+            continue
+    return removed
+
+
+def invalidate_course_pdfs(course_id) -> int:
+    from .models import Syllabus
+
+    if not cache_dir().is_dir():
+        return 0
+    return sum(
+        invalidate_syllabus_pdf(pk)
+        for pk in Syllabus.objects.filter(course_id=course_id).values_list("pk", flat=True)
+    )
@@ -0,0 +1,142 @@
+"""
+Background PDF render queue.
+
+Web requests only enqueue; ``run_worker`` (or ``prerender_pdfs``) renders into
+the on-disk cache from ``pdf_cache``. One job row per syllabus is reused.
+A job that failed ``MAX_ATTEMPTS`` times is retried only for a new version or
+new content.
+"""
+
+import logging
+
+from django.db.models import F
+from django.utils import timezone
+
+from core.metrics import WORKER_JOB_WAIT
+from .models import PdfRenderJob, Syllabus
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 3
+PRERENDER_STATUSES = frozenset({Syllabus.Status.REVIEW_UMU, Syllabus.Status.APPROVED})
+
+
+def _content_hash(syllabus) -> str:
+    from .services import render_syllabus_content
+
+    try:
+        return render_syllabus_content(syllabus)[1]
+    except Exception:
+        # Building the HTML is what fails; a later fix changes the hash from "".
+        return ""
+
+
+def _exhausted(job: PdfRenderJob, syllabus) -> bool:
+    return (
+        job.version_number == syllabus.version_number
+        and job.status == PdfRenderJob.Status.FAILED
+        and job.attempts >= MAX_ATTEMPTS
+    )
+
+
+def _requeue(job: PdfRenderJob, syllabus, content_hash: str | None = None) -> bool:
+    """
+    Reset ``job`` to pending for the syllabus' current version; False if nothing to do.
+    Spent retries are granted again when ``content_hash`` differs from the failed one.
+    """
+    same_version = job.version_number == syllabus.version_number
+    if same_version and job.status in (PdfRenderJob.Status.PENDING, PdfRenderJob.Status.RUNNING):
+        return False
+    if _exhausted(job, syllabus):
+        if content_hash is None or content_hash == job.content_hash:
+            return False
+        job.attempts = 0
+
+    if not same_version:
+        job.attempts = 0
+    job.version_number = syllabus.version_number
+    job.status = PdfRenderJob.Status.PENDING
+    job.error = ""
+    return True
+
+
+def enqueue_pdf_render(syllabus) -> PdfRenderJob:
+    job, created = PdfRenderJob.objects.get_or_create(
+        syllabus=syllabus,
+        defaults={"version_number": syllabus.version_number},
+    )
+    # Only a job out of retries pays for rendering the HTML to compare content.
+    content_hash = _content_hash(syllabus) if not created and _exhausted(job, syllabus) else None
+    if not created and _requeue(job, syllabus, content_hash):
+        job.save(update_fields=["version_number", "status", "attempts", "error", "updated_at"])
+    return job
+
+
+def enqueue_pdf_renders(syllabi) -> int:
+    """``enqueue_pdf_render`` for many syllabi: one read, one insert and one update."""
+    syllabi = list(syllabi)
+    if not syllabi:
+        return 0
+    jobs = {job.syllabus_id: job for job in PdfRenderJob.objects.filter(syllabus__in=[s.pk for s in syllabi])}
+
+    new_jobs = []
+    requeued = []
+    now = timezone.now()
+    for syllabus in syllabi:
+        job = jobs.get(syllabus.pk)
+        if job is None:
+            new_jobs.append(PdfRenderJob(syllabus=syllabus, version_number=syllabus.version_number))
+        elif _requeue(job, syllabus):
+            job.updated_at = now
+            requeued.append(job)
+
+    PdfRenderJob.objects.bulk_create(new_jobs, ignore_conflicts=True)
+    if requeued:
+        PdfRenderJob.objects.bulk_update(requeued, ["version_number", "status", "attempts", "error", "updated_at"])
+    return len(new_jobs) + len(requeued)
+
+
+def requeue_stale_jobs() -> int:
+    """Jobs left ``running`` by a worker that died mid-render go back to the queue."""
+    return PdfRenderJob.objects.filter(status=PdfRenderJob.Status.RUNNING).update(
+        status=PdfRenderJob.Status.PENDING,
+        updated_at=timezone.now(),
+    )
+
+
+def claim_next_job() -> PdfRenderJob | None:
+    candidates = (
+        PdfRenderJob.objects.filter(status=PdfRenderJob.Status.PENDING)
+        .order_by("created_at")
+        .values_list("pk", "updated_at")[:5]
+    )
+    for job_id, queued_at in list(candidates):
+        now = timezone.now()
+        claimed = PdfRenderJob.objects.filter(pk=job_id, status=PdfRenderJob.Status.PENDING).update(
+            status=PdfRenderJob.Status.RUNNING,
+            attempts=F("attempts") + 1,
+            updated_at=now,
+        )
+        if claimed:
+            WORKER_JOB_WAIT.observe(max(0.0, (now - queued_at).total_seconds()), queue="pdf_render")
+            return PdfRenderJob.objects.select_related("syllabus__course").get(pk=job_id)
+    return None
+
+
+def process_job(job: PdfRenderJob) -> bool:
+    from .services import render_syllabus_pdf
+
+    try:
+        render_syllabus_pdf(job.syllabus)
+    except Exception as exc:
+        logger.error("PDF render failed for syllabus %s: %s", job.syllabus_id, exc)
+        job.status = PdfRenderJob.Status.FAILED
+        job.error = str(exc)[:2000]
+        job.content_hash = _content_hash(job.syllabus)
+        job.save(update_fields=["status", "error", "content_hash", "updated_at"])
+        return False
+
+    job.status = PdfRenderJob.Status.DONE
+    job.error = ""
+    job.save(update_fields=["status", "error", "updated_at"])
+    return True
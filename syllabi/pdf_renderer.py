@@ -0,0 +1,97 @@
+"""
+WeasyPrint renderer shared by every PDF render in a process.
+
+Font discovery (``FontConfiguration``) and parsing of the syllabus stylesheet
+happen once per process and are reused by the worker and bulk commands, so a
+render only lays out the document itself.
+"""
+
+import hashlib
+import threading
+
+from django.contrib.staticfiles import finders
+from django.core.cache import cache
+
+from core.metrics import PDF_RENDER_DURATION
+
+STYLESHEET_PATH = "css/syllabus_pdf.css"
+PROBE_CACHE_KEY = "diagnostics:pdf_renderer"
+PROBE_TTL_SECONDS = 300
+
+WEASYPRINT_MISSING_MESSAGE = (
+    "Системные зависимости WeasyPrint не установлены. "
+    "Установите GTK/Pango (см. https://doc.courtbouillon.org/weasyprint/stable/first_steps.html#installation) "
+    "или замените реализацию генерации PDF."
+)
+
+_lock = threading.Lock()
+_font_config = None
+_stylesheets = None
+_stylesheet_fingerprint = None
+
+
+class PdfRendererUnavailable(RuntimeError):
+    pass
+
+
+def _weasyprint():
+    # Imported lazily: the web process never renders and may lack Pango/GTK.
+    try:
+        import weasyprint  # type: ignore
+    except Exception as exc:  # pragma: no cover - environment without system deps
+        raise PdfRendererUnavailable(WEASYPRINT_MISSING_MESSAGE) from exc
+    return weasyprint
+
+
+def _stylesheet_file() -> str:
+    path = finders.find(STYLESHEET_PATH)
+    if not path:
+        raise FileNotFoundError(f"Stylesheet {STYLESHEET_PATH} not found in static files.")
+    return path
+
+
+def stylesheet_fingerprint() -> str:
+    """Short digest of the stylesheet, mixed into PDF cache keys."""
+    global _stylesheet_fingerprint
+    if _stylesheet_fingerprint is None:
+        with open(_stylesheet_file(), "rb") as handle:
+            _stylesheet_fingerprint = hashlib.sha256(handle.read()).hexdigest()[:12]
+    return _stylesheet_fingerprint
+
+
+def _resources():
+    global _font_config, _stylesheets
+    if _stylesheets is None:
+        with _lock:
+            if _stylesheets is None:
+                weasyprint = _weasyprint()
+                from weasyprint.text.fonts import FontConfiguration  # type: ignore
+
+                font_config = FontConfiguration()
+                _stylesheets = [weasyprint.CSS(filename=_stylesheet_file(), font_config=font_config)]
+                _font_config = font_config
+    return _font_config, _stylesheets
+
+
+def write_pdf(html: str) -> bytes:
+    weasyprint = _weasyprint()
+    font_config, stylesheets = _resources()
+    with PDF_RENDER_DURATION.time():
+        return weasyprint.HTML(string=html).write_pdf(stylesheets=stylesheets, font_config=font_config)
+
+
+def _probe() -> str:
+    try:
+        data = _weasyprint().HTML(string="<html><body>ok</body></html>").write_pdf()
+    except Exception as exc:
+        return f"fail: {type(exc).__name__}: {exc}"
+    return "ok" if data else "fail: empty output"
+
+
+def probe_renderer(ttl: int = PROBE_TTL_SECONDS) -> str:
+    """Result of a tiny test render, cached so health probes do not render every time."""
+    result = cache.get(PROBE_CACHE_KEY)
+    if result is None:
+        result = _probe()
+        cache.set(PROBE_CACHE_KEY, result, ttl)
+    return result
@@ -0,0 +1,93 @@
+"""
+Roll syllabi forward into a new semester.
+
+Copies are made in one transaction with one bulk insert per table: syllabi,
+their topics and a revision row each. Copies start as drafts, point back to the
+source through ``rolled_from`` and continue its version numbering.
+"""
+
+from django.db import transaction
+
+from core.cloning import bulk_clone
+from core.dashboard import invalidate_dashboard
+from core.search import index_syllabi
+from .facets import invalidate_facets
+from .models import Syllabus, SyllabusRevision, SyllabusTopic
+
+# Review state and artifacts of the source that must not carry over.
+ROLLOVER_EXCLUDED_FIELDS = ("pdf_file", "ai_feedback", "is_shared", "created_at", "updated_at")
+
+
+def _target_key(syllabus, semester: str, academic_year: str) -> tuple:
+    return syllabus.course_id, syllabus.creator_id, semester or syllabus.semester, academic_year
+
+
+def rollover_syllabi(sources, academic_year: str, semester: str = "", actor=None) -> dict:
+    """
+    Copy ``sources`` into ``academic_year`` (and ``semester``; blank keeps each
+    source's semester). Sources that already have a syllabus for the same course,
+    author and term are skipped. Returns ``{"created": [...], "skipped": n}``.
+    """
+    sources = list(sources)
+    if not sources:
+        return {"created": [], "skipped": 0}
+
+    existing = set(
+        Syllabus.objects.filter(
+            course_id__in={s.course_id for s in sources},
+            creator_id__in={s.creator_id for s in sources},
+            academic_year=academic_year,
+        ).values_list("course_id", "creator_id", "semester", "academic_year")
+    )
+    selected = []
+    for source in sources:
+        key = _target_key(source, semester, academic_year)
+        if key in existing:
+            continue
+        existing.add(key)
+        selected.append(source)
+
+    with transaction.atomic():
+        syllabus_map = bulk_clone(
+            selected,
+            overrides=lambda source: {
+                "semester": semester or source.semester,
+                "academic_year": academic_year,
+                "status": Syllabus.Status.DRAFT,
+                "version_number": source.version_number + 1,
+                "rolled_from_id": source.pk,
+            },
+            exclude=ROLLOVER_EXCLUDED_FIELDS,
+        )
+        bulk_clone(
+            SyllabusTopic.objects.filter(syllabus__in=list(syllabus_map)).order_by("pk"),
+            remap={"syllabus_id": syllabus_map},
+        )
+        SyllabusRevision.objects.bulk_create(
+            SyllabusRevision(
+                syllabus=syllabus_map[source.pk],
+                changed_by=actor,
+                version_number=source.version_number + 1,
+                note=f"Перенесено из {source.semester} {source.academic_year}"[:255],
+            )
+            for source in selected
+        )
+
+    created = list(syllabus_map.values())
+    if created:
+        # bulk_create sends no post_save, so refresh what the signals would have.
+        index_syllabi([syllabus.pk for syllabus in created])
+        invalidate_facets()
+        invalidate_dashboard()
+    return {"created": created, "skipped": len(sources) - len(selected)}
+
+
+def year_rollover_queryset(academic_year: str, semester: str = "", statuses=None):
+    """Syllabi of a whole academic year to roll forward; approved ones by default."""
+    syllabi = Syllabus.objects.filter(
+        academic_year=academic_year,
+        status__in=statuses or [Syllabus.Status.APPROVED],
+    )
+    if semester:
+        syllabi = syllabi.filter(semester=semester)
+    return syllabi.order_by("pk")
@@ -1,9 +1,18 @@
 from collections import Counter
-from io import BytesIO
+from pathlib import Path
 
-from django.http import HttpResponse
+from django.db import transaction
+from django.http import FileResponse, HttpResponseNotModified
+from django.shortcuts import render
 from django.template.loader import render_to_string
 
+from . import pdf_cache, pdf_jobs, pdf_renderer
+from workflow.models import SyllabusAuditLog
+
+from .models import PdfRenderJob, SyllabusTopic
+
+PDF_PENDING_REFRESH_SECONDS = 5
+
 
 def _split_lines(value: str) -> list[str]:
     if not value:
@@ -99,22 +108,73 @@ def validate_syllabus_structure(syllabus) -> list[str]:
     return errors
 
 
-def generate_syllabus_pdf(syllabus):
+TOPIC_EDITOR_FIELDS = (
+    "week_number",
+    "is_included",
+    "week_label",
+    "custom_title",
+    "custom_hours",
+    "tasks",
+    "learning_outcomes",
+    "literature_notes",
+    "assessment",
+)
+
+
+def save_syllabus_topics(syllabus, rows: dict[int, dict], actor=None) -> dict[str, int]:
     """
-    Generate PDF or return informative 501 if WeasyPrint deps are missing.
-    We import WeasyPrint lazily to avoid command-time failures when system libs aren't installed.
+    Replace the syllabus topics with ``rows`` ({topic_id: field values}) in a fixed
+    number of queries: one read, then at most one DELETE, one bulk INSERT and one
+    bulk UPDATE of only the rows and columns that actually changed, plus the
+    ``updated_at`` touch and audit log when anything changed.
     """
-    try:
-        from weasyprint import HTML  # type: ignore
-    except Exception:  # pragma: no cover - environment without system deps
-        return HttpResponse(
-            "Системные зависимости WeasyPrint не установлены. "
-            "Установите GTK/Pango (см. https://doc.courtbouillon.org/weasyprint/stable/first_steps.html#installation) "
-            "или замените реализацию генерации PDF.",
-            status=501,
-            content_type="text/plain; charset=utf-8",
-        )
+    with transaction.atomic():
+        existing = {st.topic_id: st for st in syllabus.syllabus_topics.all()}
+
+        to_create = []
+        to_update = []
+        changed_fields: set[str] = set()
+        for topic_id, values in rows.items():
+            current = existing.get(topic_id)
+            if current is None:
+                to_create.append(SyllabusTopic(syllabus=syllabus, topic_id=topic_id, **values))
+                continue
+            dirty = [field for field, value in values.items() if getattr(current, field) != value]
+            if dirty:
+                for field in dirty:
+                    setattr(current, field, values[field])
+                to_update.append(current)
+                changed_fields.update(dirty)
 
+        delete_ids = [st.pk for topic_id, st in existing.items() if topic_id not in rows]
+        if delete_ids:
+            SyllabusTopic.objects.filter(pk__in=delete_ids).delete()
+        if to_create:
+            SyllabusTopic.objects.bulk_create(to_create)
+        if to_update:
+            SyllabusTopic.objects.bulk_update(to_update, sorted(changed_fields))
+
+        summary = {"created": len(to_create), "updated": len(to_update), "deleted": len(delete_ids)}
+        if any(summary.values()):
+            # Topics are part of the syllabus: bump updated_at (keys the memoized AI text).
+            syllabus.save(update_fields=["updated_at"])
+            SyllabusAuditLog.objects.create(
+                syllabus=syllabus,
+                actor=actor,
+                action=SyllabusAuditLog.Action.TOPICS_UPDATED,
+                metadata={**summary, "fields": sorted(changed_fields)},
+                message=(
+                    f"Темы: добавлено {summary['created']}, изменено {summary['updated']}, "
+                    f"удалено {summary['deleted']}"
+                ),
+            )
+
+    if any(summary.values()):
+        pdf_cache.invalidate_syllabus_pdf(syllabus.pk)
+    return summary
+
+
+def render_syllabus_html(syllabus) -> str:
     topics = (
         syllabus.syllabus_topics.select_related("topic")
         .prefetch_related("topic__literature", "topic__questions")
@@ -127,7 +187,7 @@ def generate_syllabus_pdf(syllabus):
     )
     learning_outcomes_list = _split_lines(syllabus.learning_outcomes)
     teaching_methods_list = _split_lines(syllabus.teaching_methods)
-    html = render_to_string(
+    return render_to_string(
         "syllabi/pdf.html",
         {
             "syllabus": syllabus,
@@ -139,13 +199,76 @@ def generate_syllabus_pdf(syllabus):
         },
     )
 
-    pdf_io = BytesIO()
-    HTML(string=html).write_pdf(target=pdf_io)
-    pdf_io.seek(0)
 
-    response = HttpResponse(pdf_io.getvalue(), content_type="application/pdf")
-    safe_code = syllabus.course.code.replace(" ", "_")
-    response["Content-Disposition"] = (
-        f'attachment; filename="syllabus-{safe_code}-v{syllabus.version_number}.pdf"'
+def _pdf_response(syllabus, path: Path, request=None):
+    etag = pdf_cache.etag_for_path(path)
+    if request is not None and _parse_if_none_match(request) & {etag, "*"}:
+        response = HttpResponseNotModified()
+    else:
+        safe_code = syllabus.course.code.replace(" ", "_")
+        response = FileResponse(
+            path.open("rb"),
+            as_attachment=True,
+            filename=f"syllabus-{safe_code}-v{syllabus.version_number}.pdf",
+            content_type="application/pdf",
+        )
+    response["ETag"] = etag
+    # Auth-only content: browsers may keep it but must revalidate (cheap 304).
+    response["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def _parse_if_none_match(request) -> set[str]:
+    header = request.headers.get("If-None-Match", "")
+    return {item.strip().removeprefix("W/") for item in header.split(",") if item.strip()}
+
+
+def render_syllabus_content(syllabus) -> tuple[str, str]:
+    """The PDF's HTML and the content hash its cached file is named after."""
+    html = render_syllabus_html(syllabus)
+    return html, pdf_cache.html_hash(html + pdf_renderer.stylesheet_fingerprint())
+
+
+def render_syllabus_pdf(syllabus) -> Path:
+    """
+    Render the PDF into the on-disk cache and return its path.
+    Runs in the worker / management commands; a web request only falls back to
+    it when no worker has claimed the job (see ``serve_syllabus_pdf``).
+    """
+    html, content_hash = render_syllabus_content(syllabus)
+    existing = pdf_cache.cache_path(syllabus, content_hash)
+    if existing.exists():
+        return existing
+
+    path = pdf_cache.store_pdf(syllabus, content_hash, pdf_renderer.write_pdf(html))
+    if path is None:
+        raise OSError(f"Не удалось сохранить PDF в {pdf_cache.cache_dir()}.")
+    return path
+
+
+def serve_syllabus_pdf(syllabus, request):
+    """
+    Serve the cached PDF, or queue a background render and show a waiting page
+    that refreshes itself until the file is ready.
+    """
+    _html, content_hash = render_syllabus_content(syllabus)
+    cached = pdf_cache.find_cached_pdf(syllabus, content_hash)
+    if cached is not None:
+        return _pdf_response(syllabus, cached, request)
+
+    job = pdf_jobs.enqueue_pdf_render(syllabus)
+    failed = job.status == PdfRenderJob.Status.FAILED
+    response = render(
+        request,
+        "syllabi/pdf_pending.html",
+        {
+            "syllabus": syllabus,
+            "job": job,
+            "failed": failed,
+            "refresh_seconds": PDF_PENDING_REFRESH_SECONDS,
+        },
+        status=503 if failed else 202,
     )
+    if not failed:
+        response["Retry-After"] = str(PDF_PENDING_REFRESH_SECONDS)
     return response
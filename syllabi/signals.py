@@ -0,0 +1,61 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from catalog.models import Course, Topic, TopicLiterature
+from core.dashboard import invalidate_dashboard
+from .facets import SYLLABUS_FACET_FIELDS, invalidate_facets
+from .models import Syllabus
+from .pdf_cache import NON_PDF_FIELDS, invalidate_course_pdfs, invalidate_syllabus_pdf
+
+User = get_user_model()
+
+USER_FACET_FIELDS = frozenset({"username", "first_name", "last_name"})
+
+
+def _touches(update_fields, fields) -> bool:
+    return update_fields is None or bool(set(update_fields) & fields)
+
+
+@receiver(post_save, sender=Syllabus, dispatch_uid="facets_syllabus_saved")
+def syllabus_saved(sender, instance, created, update_fields=None, **kwargs):
+    if _touches(update_fields, SYLLABUS_FACET_FIELDS):
+        invalidate_facets()
+    if not created and (update_fields is None or not set(update_fields) <= NON_PDF_FIELDS):
+        invalidate_syllabus_pdf(instance.pk)
+    if created:
+        # Status changes go through workflow.services, which invalidates the dashboard itself.
+        invalidate_dashboard()
+
+
+@receiver(post_delete, sender=Syllabus, dispatch_uid="facets_syllabus_deleted")
+def syllabus_deleted(sender, instance, **kwargs):
+    invalidate_facets()
+    invalidate_dashboard()
+    invalidate_syllabus_pdf(instance.pk)
+
+
+@receiver(post_save, sender=Course, dispatch_uid="facets_course_saved")
+def course_saved(sender, instance, created, update_fields=None, **kwargs):
+    if not created and _touches(update_fields, {"code"}):
+        invalidate_facets()
+    if not created:
+        invalidate_course_pdfs(instance.pk)
+
+
+@receiver(post_save, sender=Topic, dispatch_uid="pdf_topic_saved")
+@receiver(post_delete, sender=Topic, dispatch_uid="pdf_topic_deleted")
+def topic_changed(sender, instance, **kwargs):
+    invalidate_course_pdfs(instance.course_id)
+
+
+@receiver(post_save, sender=TopicLiterature, dispatch_uid="pdf_topic_literature_saved")
+@receiver(post_delete, sender=TopicLiterature, dispatch_uid="pdf_topic_literature_deleted")
+def topic_literature_changed(sender, instance, **kwargs):
+    invalidate_course_pdfs(Topic.objects.filter(pk=instance.topic_id).values("course_id")[:1])
+
+
+@receiver(post_save, sender=User, dispatch_uid="facets_user_saved")
+def user_saved(sender, instance, created, update_fields=None, **kwargs):
+    if not created and _touches(update_fields, USER_FACET_FIELDS):
+        invalidate_facets()
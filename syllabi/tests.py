@@ -1,11 +1,29 @@
+import io
+import tempfile
+import zipfile
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock, skipUnless
+
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
 from django.urls import reverse
+from django.utils import timezone
 
 from catalog.models import Course, Topic
+from core.models import Notification, SearchEntry
+from syllabi import pdf_cache, pdf_renderer
+from syllabi.facets import SCOPE_ALL, syllabus_facets
 from syllabi.forms import SyllabusForm
-from syllabi.models import Syllabus, SyllabusTopic
+from syllabi.models import PdfRenderJob, Syllabus, SyllabusRevision, SyllabusTopic
+from syllabi.pdf_jobs import MAX_ATTEMPTS, claim_next_job, process_job
+from syllabi.rollover import rollover_syllabi
+from syllabi.services import render_syllabus_content, render_syllabus_html, save_syllabus_topics
+from workflow.models import SyllabusAuditLog, SyllabusStatusLog
 
 User = get_user_model()
 
@@ -384,6 +402,33 @@ class SyllabusRoleViewTests(TestCase):
         self.assertEqual(syllabus_topic.custom_title, "Algorithms Basics")
         self.assertEqual(syllabus_topic.tasks, "Read chapter 1")
 
+    def test_topic_save_is_a_bulk_diff_with_audit_summary(self):
+        teacher = self._create_user("teacher_bulk_topics", "teacher")
+        course = self._create_course(teacher, code="CS416")
+        topics = [self._create_topic(course, title=f"Topic {index}", order_index=index) for index in range(1, 21)]
+        syllabus = Syllabus.objects.create(
+            course=course,
+            creator=teacher,
+            semester="Fall 2025",
+            academic_year="2025-2026",
+        )
+        SyllabusTopic.objects.create(syllabus=syllabus, topic=topics[0], week_number=1, tasks="old")
+        SyllabusTopic.objects.create(syllabus=syllabus, topic=topics[1], week_number=2)
+        rows = {
+            topic.pk: {"week_number": week, "is_included": True, "tasks": "new" if week == 1 else ""}
+            for week, topic in enumerate(topics[:1] + topics[2:], start=1)
+        }
+
+        # read + delete + insert + update + updated_at + audit log, inside one savepoint
+        with self.assertNumQueries(8):
+            summary = save_syllabus_topics(syllabus, rows, actor=teacher)
+
+        self.assertEqual(summary, {"created": 18, "updated": 1, "deleted": 1})
+        self.assertEqual(syllabus.syllabus_topics.count(), 19)
+        self.assertEqual(syllabus.syllabus_topics.get(topic=topics[0]).tasks, "new")
+        log = SyllabusAuditLog.objects.get(syllabus=syllabus, action=SyllabusAuditLog.Action.TOPICS_UPDATED)
+        self.assertEqual(log.metadata["fields"], ["tasks"])
+
     def test_syllabus_edit_details_post_updates_fields(self):
         teacher = self._create_user("teacher_edit_details", "teacher")
         course = self._create_course(teacher, code="CS415")
@@ -498,3 +543,525 @@ class SyllabusRoleViewTests(TestCase):
         syllabus.refresh_from_db()
         self.assertEqual(syllabus.status, Syllabus.Status.DRAFT)
         self.assertEqual(syllabus.version_number, 1)
+
+
+class SyllabusSearchTests(TestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(
+            username="search_teacher",
+            password="pass1234",
+            role="teacher",
+            first_name="Айгерим",
+            last_name="Тулеген",
+        )
+        self.course = Course.objects.create(
+            owner=self.teacher,
+            code="FIN201",
+            title_ru="Корпоративные финансы",
+            available_languages="ru",
+        )
+        self.other_course = Course.objects.create(
+            owner=self.teacher,
+            code="MKT101",
+            title_ru="Маркетинг",
+            available_languages="ru",
+        )
+        self.syllabus = Syllabus.objects.create(
+            course=self.course,
+            creator=self.teacher,
+            semester="Fall 2025",
+            academic_year="2025-2026",
+        )
+        self.other_syllabus = Syllabus.objects.create(
+            course=self.other_course,
+            creator=self.teacher,
+            semester="Spring 2026",
+            academic_year="2025-2026",
+        )
+        self.client.force_login(self.teacher)
+
+    def _search(self, query: str) -> list[int]:
+        response = self.client.get(reverse("syllabi_list"), {"q": query})
+        self.assertEqual(response.status_code, 200)
+        return [item.pk for item in response.context["syllabi"]]
+
+    def test_search_matches_course_title_substring_case_insensitive(self):
+        self.assertEqual(self._search("ФИНАНС"), [self.syllabus.pk])
+
+    def test_search_matches_short_code_prefix_and_multiple_terms(self):
+        self.assertEqual(self._search("fi"), [self.syllabus.pk])
+        self.assertEqual(self._search("тулеген spring"), [self.other_syllabus.pk])
+
+    def test_index_follows_course_and_user_updates(self):
+        self.course.title_ru = "Управленческий учет"
+        self.course.save()
+        self.teacher.last_name = "Серикова"
+        self.teacher.save()
+
+        self.assertEqual(self._search("финансы"), [])
+        self.assertEqual(self._search("учет"), [self.syllabus.pk])
+        self.assertCountEqual(
+            self._search("серикова"),
+            [self.syllabus.pk, self.other_syllabus.pk],
+        )
+
+    def test_deleted_syllabus_is_removed_from_index(self):
+        syllabus_pk = self.syllabus.pk
+        self.syllabus.delete()
+
+        self.assertFalse(
+            SearchEntry.objects.filter(kind=SearchEntry.Kind.SYLLABUS, object_id=syllabus_pk).exists()
+        )
+
+    def test_index_failure_does_not_block_delete(self):
+        syllabus_pk = self.syllabus.pk
+        with mock.patch("core.search.remove_from_index", side_effect=RuntimeError("index down")):
+            with self.assertLogs("core.signals", level="ERROR"):
+                self.syllabus.delete()
+
+        self.assertFalse(Syllabus.objects.filter(pk=syllabus_pk).exists())
+
+
+class SyllabusListPaginationTests(TestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(username="page_teacher", password="pass1234", role="teacher")
+        self.course = Course.objects.create(owner=self.teacher, code="PG101", available_languages="ru")
+        self.syllabi = [
+            Syllabus.objects.create(
+                course=self.course,
+                creator=self.teacher,
+                semester=f"Fall {index}",
+                academic_year="2025-2026",
+            )
+            for index in range(5)
+        ]
+        Syllabus.objects.create(
+            course=self.course,
+            creator=self.teacher,
+            semester="Approved",
+            academic_year="2025-2026",
+            status=Syllabus.Status.APPROVED,
+        )
+        self.client.force_login(self.teacher)
+
+    def test_pages_walk_all_rows_once_and_keep_filters(self):
+        url = reverse("syllabi_list")
+        params = {"status": Syllabus.Status.DRAFT, "page_size": "2"}
+        seen = []
+        response = self.client.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, 200)
+            page = response.context["page"]
+            self.assertLessEqual(len(page), 2)
+            seen.extend(item.pk for item in response.context["syllabi"])
+            if not page.next_url:
+                break
+            self.assertIn("status=draft", page.next_url)
+            response = self.client.get(url + page.next_url)
+
+        expected = sorted(self.syllabi, key=lambda item: (item.updated_at, item.pk), reverse=True)
+        self.assertEqual(seen, [item.pk for item in expected])
+
+    def test_previous_link_returns_to_first_page(self):
+        url = reverse("syllabi_list")
+        first = self.client.get(url, {"page_size": "2"})
+        second = self.client.get(url + first.context["page"].next_url)
+        back = self.client.get(url + second.context["page"].previous_url)
+
+        self.assertEqual(
+            [item.pk for item in back.context["syllabi"]],
+            [item.pk for item in first.context["syllabi"]],
+        )
+        self.assertFalse(back.context["page"].has_previous)
+
+    def test_invalid_cursor_and_page_size_fall_back_to_first_page(self):
+        response = self.client.get(reverse("syllabi_list"), {"cursor": "broken", "page_size": "abc"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["syllabi"]), 6)
+        self.assertFalse(response.context["page"].has_other_pages)
+
+
+class SyllabusFacetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.dean = User.objects.create_user(username="facet_dean", password="pass1234", role="dean")
+        self.teacher = User.objects.create_user(
+            username="facet_teacher",
+            password="pass1234",
+            role="teacher",
+            first_name="Дана",
+            last_name="Ахметова",
+        )
+        self.course = Course.objects.create(owner=self.teacher, code="FC101", available_languages="ru")
+        for year in ("2024-2025", "2025-2026", "2025-2026"):
+            Syllabus.objects.create(
+                course=self.course,
+                creator=self.teacher,
+                semester="Fall",
+                academic_year=year,
+            )
+
+    def test_facets_have_counts_and_are_served_from_cache(self):
+        self.client.force_login(self.dean)
+        self.client.get(reverse("syllabi_list"))
+
+        with self.assertNumQueries(0):
+            facets = syllabus_facets(Syllabus.objects.all(), SCOPE_ALL)
+
+        self.assertEqual(
+            facets["years"],
+            [{"value": "2025-2026", "count": 2}, {"value": "2024-2025", "count": 1}],
+        )
+        self.assertEqual(facets["courses"], [{"id": self.course.pk, "code": "FC101", "count": 3}])
+        self.assertEqual(facets["creators"], [{"id": self.teacher.pk, "label": "Дана Ахметова", "count": 3}])
+
+    def test_syllabus_save_invalidates_cached_facets(self):
+        self.client.force_login(self.dean)
+        self.client.get(reverse("syllabi_list"))
+
+        Syllabus.objects.create(
+            course=self.course,
+            creator=self.teacher,
+            semester="Spring",
+            academic_year="2026-2027",
+        )
+        response = self.client.get(reverse("syllabi_list"))
+
+        self.assertEqual(response.context["year_options"][0], {"value": "2026-2027", "count": 1})
+
+
+@skipUnless(connection.vendor == "postgresql", "EXPLAIN output is checked on PostgreSQL only")
+class QueryPlanIndexTests(TestCase):
+    def _plan(self, queryset) -> str:
+        with connection.cursor() as cursor:
+            # Tiny test tables would otherwise always be seq-scanned.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        return queryset.explain()
+
+    def test_worker_queue_uses_partial_index(self):
+        plan = self._plan(Syllabus.objects.filter(status=Syllabus.Status.AI_CHECK).order_by("updated_at"))
+        self.assertIn("syllabus_ai_check_queue_idx", plan)
+
+    def test_list_filters_use_creator_status_index(self):
+        plan = self._plan(
+            Syllabus.objects.filter(creator_id=1, status=Syllabus.Status.DRAFT, academic_year="2025-2026")
+        )
+        self.assertIn("syllabus_creator_status_idx", plan)
+
+    def test_correction_log_lookup_uses_composite_index(self):
+        plan = self._plan(
+            SyllabusStatusLog.objects.filter(syllabus_id=1, to_status=Syllabus.Status.CORRECTION).order_by("-changed_at")
+        )
+        self.assertIn("statuslog_syllabus_to_idx", plan)
+
+    def test_unread_notifications_use_partial_index(self):
+        plan = self._plan(Notification.objects.filter(recipient_id=1, read_at__isnull=True))
+        self.assertIn("notification_unread_idx", plan)
+
+
+class SyllabusPdfCacheTests(TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        override = override_settings(SYLLABUS_PDF_CACHE_DIR=self._tmp.name)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.teacher = User.objects.create_user(username="pdf_teacher", password="pass1234", role="teacher")
+        self.course = Course.objects.create(owner=self.teacher, code="PDF101", available_languages="ru")
+        self.syllabus = Syllabus.objects.create(
+            course=self.course,
+            creator=self.teacher,
+            semester="Fall 2025",
+            academic_year="2025-2026",
+        )
+        self.content_hash = render_syllabus_content(self.syllabus)[1]
+        self.cached = pdf_cache.store_pdf(self.syllabus, self.content_hash, b"%PDF-1.4 cached")
+        self.client.force_login(self.teacher)
+
+    def test_cached_pdf_is_served_with_etag_and_revalidated(self):
+        url = reverse("syllabus_pdf", args=[self.syllabus.pk])
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"%PDF-1.4 cached")
+        self.assertEqual(response["ETag"], f'"{self.content_hash}"')
+
+        not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=f'"{self.content_hash}"')
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_file_for_other_content_is_not_served(self):
+        # QuerySet.update sends no signals, so the old file is still on disk.
+        Syllabus.objects.filter(pk=self.syllabus.pk).update(course_goal="Изменено в обход сигналов")
+        self.syllabus.refresh_from_db()
+
+        response = self.client.get(reverse("syllabus_pdf", args=[self.syllabus.pk]))
+
+        self.assertEqual(response.status_code, 202)
+        self.assertTrue(self.cached.exists())
+
+    def test_details_and_topic_changes_invalidate_cached_pdf(self):
+        self.syllabus.course_goal = "Новая цель"
+        self.syllabus.save()
+        self.assertFalse(self.cached.exists())
+
+        cached = pdf_cache.store_pdf(self.syllabus, "def456", b"%PDF-1.4 cached")
+        Topic.objects.create(course=self.course, order_index=1, title_ru="Тема", default_hours=2)
+        self.assertFalse(cached.exists())
+
+    def test_download_without_cache_queues_render_instead_of_rendering(self):
+        pdf_cache.invalidate_syllabus_pdf(self.syllabus.pk)
+        url = reverse("syllabus_pdf", args=[self.syllabus.pk])
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 202)
+        job = PdfRenderJob.objects.get(syllabus=self.syllabus)
+        self.assertEqual(job.status, PdfRenderJob.Status.PENDING)
+
+        def fake_render(syllabus):
+            return pdf_cache.store_pdf(syllabus, render_syllabus_content(syllabus)[1], b"%PDF-1.4 worker")
+
+        with mock.patch("syllabi.services.render_syllabus_pdf", side_effect=fake_render):
+            self.assertTrue(process_job(claim_next_job()))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, PdfRenderJob.Status.DONE)
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_failed_job_is_retried_only_after_content_changes(self):
+        pdf_cache.invalidate_syllabus_pdf(self.syllabus.pk)
+        url = reverse("syllabus_pdf", args=[self.syllabus.pk])
+        self.client.get(url)
+        with mock.patch("syllabi.services.render_syllabus_pdf", side_effect=RuntimeError("bad font")):
+            for _attempt in range(MAX_ATTEMPTS):
+                PdfRenderJob.objects.filter(syllabus=self.syllabus).update(status=PdfRenderJob.Status.PENDING)
+                self.assertFalse(process_job(claim_next_job()))
+
+        self.assertEqual(self.client.get(url).status_code, 503)
+
+        self.syllabus.course_goal = "Исправленная цель"
+        self.syllabus.save()
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 202)
+        job = PdfRenderJob.objects.get(syllabus=self.syllabus)
+        self.assertEqual((job.status, job.attempts), (PdfRenderJob.Status.PENDING, 0))
+
+    def test_long_pending_job_is_never_rendered_in_the_request(self):
+        pdf_cache.invalidate_syllabus_pdf(self.syllabus.pk)
+        url = reverse("syllabus_pdf", args=[self.syllabus.pk])
+        self.assertEqual(self.client.get(url).status_code, 202)
+        PdfRenderJob.objects.filter(syllabus=self.syllabus).update(
+            updated_at=timezone.now() - timedelta(hours=1)
+        )
+
+        with mock.patch("syllabi.services.render_syllabus_pdf") as render_pdf:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 202)
+        render_pdf.assert_not_called()
+        self.assertEqual(PdfRenderJob.objects.get(syllabus=self.syllabus).status, PdfRenderJob.Status.PENDING)
+
+    def test_pdf_stylesheet_is_shared_outside_the_template(self):
+        html = render_syllabus_html(self.syllabus)
+
+        self.assertNotIn("<style>", html)
+        self.assertEqual(len(pdf_renderer.stylesheet_fingerprint()), 12)
+
+    def test_ai_feedback_update_keeps_cached_pdf(self):
+        self.syllabus.ai_feedback = "ok"
+        self.syllabus.save(update_fields=["ai_feedback"])
+
+        self.assertTrue(self.cached.exists())
+
+
+class SyllabusExportTests(TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        override = override_settings(SYLLABUS_PDF_CACHE_DIR=self._tmp.name)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.umu = User.objects.create_user(username="export_umu", password="pass1234", role="umu")
+        self.teacher = User.objects.create_user(
+            username="export_teacher", password="pass1234", role="teacher", faculty="Бизнес"
+        )
+        course = Course.objects.create(owner=self.teacher, code="EXP101", available_languages="ru")
+        self.ready = Syllabus.objects.create(
+            course=course,
+            creator=self.teacher,
+            semester="Fall 2025",
+            academic_year="2025-2026",
+            status=Syllabus.Status.APPROVED,
+        )
+        self.pending = Syllabus.objects.create(
+            course=course,
+            creator=self.teacher,
+            semester="Fall 2025",
+            academic_year="2025-2026",
+            status=Syllabus.Status.APPROVED,
+        )
+        pdf_cache.store_pdf(self.ready, render_syllabus_content(self.ready)[1], b"%PDF-1.4 ready")
+
+    def test_export_streams_ready_files_and_queues_missing(self):
+        self.client.force_login(self.umu)
+        response = self.client.get(reverse("syllabi_export"), {"year": "2025-2026", "faculty": "Бизнес"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content)))
+        names = archive.namelist()
+        self.assertIn(f"EXP101_Fall_2025_2025-2026_id{self.ready.pk}.pdf", names)
+        self.assertEqual(archive.read(names[0]), b"%PDF-1.4 ready")
+        self.assertIn(f"id{self.pending.pk}", archive.read("missing.txt").decode("utf-8"))
+        self.assertTrue(PdfRenderJob.objects.filter(syllabus=self.pending).exists())
+
+    def test_export_status_reports_progress(self):
+        self.client.force_login(self.umu)
+        response = self.client.get(reverse("syllabi_export_status"), {"year": "2025-2026"})
+
+        self.assertEqual(response.json(), {"total": 2, "ready": 1, "missing": 1})
+
+    def test_export_leaves_out_outdated_pdf(self):
+        topic = Topic.objects.create(course=self.ready.course, order_index=1, title_ru="Старая тема", default_hours=2)
+        SyllabusTopic.objects.create(syllabus=self.ready, topic=topic, week_number=1)
+        outdated = pdf_cache.store_pdf(self.ready, render_syllabus_content(self.ready)[1], b"%PDF-1.4 old")
+        # QuerySet.update sends no signals: the old file stays on disk.
+        Topic.objects.filter(pk=topic.pk).update(title_ru="Новая тема")
+        self.client.force_login(self.umu)
+
+        self.assertEqual(
+            self.client.get(reverse("syllabi_export_status"), {"year": "2025-2026"}).json(),
+            {"total": 2, "ready": 0, "missing": 2},
+        )
+        response = self.client.get(reverse("syllabi_export"), {"year": "2025-2026"})
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content)))
+
+        self.assertTrue(outdated.exists())
+        self.assertEqual(archive.namelist(), ["missing.txt"])
+        self.assertIn(f"id{self.ready.pk}", archive.read("missing.txt").decode("utf-8"))
+        self.assertTrue(PdfRenderJob.objects.filter(syllabus=self.ready).exists())
+
+    def test_teacher_cannot_export(self):
+        self.client.force_login(self.teacher)
+        response = self.client.get(reverse("syllabi_export"))
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_command_writes_archive_without_rendering(self):
+        output = Path(self._tmp.name) / "export.zip"
+        call_command("export_syllabi", output=str(output), skip_render=True, stdout=io.StringIO())
+
+        with zipfile.ZipFile(output) as archive:
+            self.assertEqual(len(archive.namelist()), 2)
+
+
+class SyllabusRolloverTests(TestCase):
+    def setUp(self):
+        self.teacher = User.objects.create_user(username="roll_teacher", password="pass1234", role="teacher")
+        self.umu = User.objects.create_user(username="roll_umu", password="pass1234", role="umu")
+        self.course = Course.objects.create(owner=self.teacher, code="ROL101", available_languages="ru")
+        topics = [
+            Topic.objects.create(course=self.course, order_index=index, title_ru=f"Тема {index}")
+            for index in range(1, 6)
+        ]
+        self.source = Syllabus.objects.create(
+            course=self.course,
+            creator=self.teacher,
+            semester="Fall 2025",
+            academic_year="2025-2026",
+            status=Syllabus.Status.APPROVED,
+            version_number=3,
+            course_goal="Цель курса",
+            ai_feedback="Замечаний нет",
+            is_shared=True,
+        )
+        SyllabusTopic.objects.bulk_create(
+            SyllabusTopic(syllabus=self.source, topic=topic, week_number=index, tasks=f"Задание {index}")
+            for index, topic in enumerate(topics, start=1)
+        )
+
+    def test_rollover_copies_sections_and_topics_as_draft(self):
+        result = rollover_syllabi([self.source], "2026-2027", "Fall 2026", actor=self.teacher)
+
+        copy = result["created"][0]
+        copy.refresh_from_db()
+        self.assertEqual(copy.status, Syllabus.Status.DRAFT)
+        self.assertEqual((copy.semester, copy.academic_year), ("Fall 2026", "2026-2027"))
+        self.assertEqual(copy.version_number, 4)
+        self.assertEqual(copy.rolled_from, self.source)
+        self.assertEqual(copy.course_goal, "Цель курса")
+        self.assertEqual(copy.ai_feedback, "")
+        self.assertFalse(copy.is_shared)
+        self.assertIsNotNone(copy.created_at)
+        self.assertEqual(
+            list(copy.syllabus_topics.values_list("week_number", "tasks")),
+            [(index, f"Задание {index}") for index in range(1, 6)],
+        )
+        self.assertEqual(self.source.syllabus_topics.count(), 5)
+        self.assertTrue(SyllabusRevision.objects.filter(syllabus=copy, version_number=4).exists())
+        self.assertTrue(SearchEntry.objects.filter(kind=SearchEntry.Kind.SYLLABUS, object_id=copy.pk).exists())
+
+    def test_rollover_skips_existing_target(self):
+        rollover_syllabi([self.source], "2026-2027", "Fall 2026")
+        result = rollover_syllabi([self.source], "2026-2027", "Fall 2026")
+
+        self.assertEqual(result, {"created": [], "skipped": 1})
+        self.assertEqual(Syllabus.objects.filter(academic_year="2026-2027").count(), 1)
+
+    def test_teacher_rolls_own_syllabus_from_detail(self):
+        self.client.force_login(self.teacher)
+        response = self.client.post(
+            reverse("syllabus_rollover", args=[self.source.pk]),
+            {"semester": "Fall 2026", "academic_year": "2026-2027"},
+        )
+
+        copy = Syllabus.objects.get(rolled_from=self.source)
+        self.assertRedirects(response, reverse("syllabus_detail", args=[copy.pk]))
+
+    def test_other_teacher_cannot_roll_syllabus(self):
+        other = User.objects.create_user(username="roll_other", password="pass1234", role="teacher")
+        self.client.force_login(other)
+        response = self.client.post(
+            reverse("syllabus_rollover", args=[self.source.pk]),
+            {"semester": "Fall 2026", "academic_year": "2026-2027"},
+        )
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_umu_rolls_whole_year(self):
+        Syllabus.objects.create(
+            course=self.course,
+            creator=self.teacher,
+            semester="Spring 2026",
+            academic_year="2025-2026",
+            status=Syllabus.Status.APPROVED,
+        )
+        self.client.force_login(self.umu)
+        self.assertEqual(self.client.get(reverse("syllabi_rollover_year")).status_code, 200)
+        response = self.client.post(
+            reverse("syllabi_rollover_year"),
+            {"source_academic_year": "2025-2026", "academic_year": "2026-2027"},
+        )
+
+        self.assertRedirects(response, reverse("syllabi_list"))
+        self.assertEqual(
+            set(Syllabus.objects.filter(academic_year="2026-2027").values_list("semester", flat=True)),
+            {"Fall 2025", "Spring 2026"},
+        )
+
+    def test_teacher_cannot_roll_whole_year(self):
+        self.client.force_login(self.teacher)
+        response = self.client.get(reverse("syllabi_rollover_year"))
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_command_rolls_year_in_batches(self):
+        out = io.StringIO()
+        call_command("rollover_syllabi", from_year="2025-2026", to_year="2026-2027", batch_size=1, stdout=out)
+
+        self.assertIn("Rolled 1", out.getvalue())
+        self.assertEqual(SyllabusTopic.objects.filter(syllabus__academic_year="2026-2027").count(), 5)
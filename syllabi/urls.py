@@ -5,6 +5,10 @@ from . import views
 urlpatterns = [
     path("", views.syllabi_list, name="syllabi_list"),
     path("shared/", views.shared_syllabi_list, name="shared_syllabi_list"),
+    path("export/", views.syllabi_export, name="syllabi_export"),
+    path("export/status/", views.syllabi_export_status, name="syllabi_export_status"),
+    path("bulk-status/", views.syllabi_bulk_status, name="syllabi_bulk_status"),
+    path("rollover/", views.syllabi_rollover_year, name="syllabi_rollover_year"),
     path("create/", views.syllabus_create, name="syllabus_create"),
     path("create/upload/", views.upload_pdf_view, name="upload_pdf"),
     path("<int:pk>/", views.syllabus_detail, name="syllabus_detail"),
@@ -12,6 +16,7 @@ urlpatterns = [
     path("<int:pk>/send_ai/", views.send_to_ai_check, name="send_to_ai_check"),
     path("<int:pk>/status/<str:new_status>/", views.syllabus_change_status, name="syllabus_change_status"),
     path("<int:pk>/upload/", views.syllabus_upload_file, name="syllabus_upload_file"),
+    path("<int:pk>/rollover/", views.syllabus_rollover, name="syllabus_rollover"),
     path("<int:pk>/share/", views.syllabus_toggle_share, name="syllabus_toggle_share"),
     path("<int:pk>/edit-details/", views.syllabus_edit_details, name="syllabus_edit_details"),
     path("<int:pk>/edit-topics/", views.syllabus_edit_topics, name="syllabus_edit_topics"),
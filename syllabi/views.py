@@ -1,32 +1,43 @@
 import re
 
-from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.core.exceptions import PermissionDenied
-from django.db import transaction
-from django.db.models import Q
+from django.http import JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
-from django.utils.http import url_has_allowed_host_and_scheme
+from django.utils.http import content_disposition_header, url_has_allowed_host_and_scheme
 from django.views.decorators.http import require_POST
 
 from accounts.decorators import teacher_like_required
-from ai_checker.services import _missing_extractor_feedback
+from ai_checker.extractors import _missing_extractor_feedback
 from catalog.models import Topic
 from catalog.services import ensure_default_courses
+from core.models import SearchEntry
+from core.pagination import keyset_paginate
+from core.search import search_object_ids
 from workflow.models import SyllabusAuditLog, SyllabusStatusLog
-from workflow.services import change_status
-from .forms import SyllabusDetailsForm, SyllabusForm, is_allowed_syllabus_file_name
-from .models import Syllabus, SyllabusRevision, SyllabusTopic
+from workflow.services import change_status, change_status_bulk
+from .export import export_progress, export_queryset, iter_zip
+from .facets import SCOPE_ALL, SCOPE_SHARED, creator_scope, syllabus_facets
+from .forms import (
+    SyllabusDetailsForm,
+    SyllabusForm,
+    SyllabusRolloverForm,
+    YearRolloverForm,
+    is_allowed_syllabus_file_name,
+)
+from .models import Syllabus, SyllabusRevision
 from .permissions import can_view_syllabus, shared_syllabi_queryset
-from .services import generate_syllabus_pdf, validate_syllabus_structure
+from .rollover import rollover_syllabi, year_rollover_queryset
+from .services import save_syllabus_topics, serve_syllabus_pdf, validate_syllabus_structure
 
 
 def _can_view_syllabus(user, syllabus: Syllabus) -> bool:
     return can_view_syllabus(user, syllabus)
 
 
+SYLLABUS_LIST_ORDERING = ("-updated_at", "-id")
 AI_CHECK_START_STATUSES = [Syllabus.Status.DRAFT, Syllabus.Status.CORRECTION, Syllabus.Status.AI_CHECK]
 
 
@@ -282,17 +293,7 @@ def syllabi_list(request):
 
     syllabi = base_qs
     if q:
-        syllabi = syllabi.filter(
-            Q(course__code__icontains=q)
-            | Q(course__title_ru__icontains=q)
-            | Q(course__title_kz__icontains=q)
-            | Q(course__title_en__icontains=q)
-            | Q(semester__icontains=q)
-            | Q(academic_year__icontains=q)
-            | Q(creator__first_name__icontains=q)
-            | Q(creator__last_name__icontains=q)
-            | Q(creator__username__icontains=q)
-        )
+        syllabi = syllabi.filter(pk__in=search_object_ids(SearchEntry.Kind.SYLLABUS, q))
     if status:
         syllabi = syllabi.filter(status=status)
     if year:
@@ -302,26 +303,23 @@ def syllabi_list(request):
     if allow_creator_filter and creator:
         syllabi = syllabi.filter(creator_id=creator)
 
-    year_options = base_qs.values_list("academic_year", flat=True).distinct().order_by("-academic_year")
-    course_options = base_qs.values("course_id", "course__code").distinct().order_by("course__code")
-    
-    creator_options = []
-    if allow_creator_filter:
-        creator_ids = base_qs.values_list("creator_id", flat=True).distinct()
-        User = get_user_model()
-        creator_options = list(User.objects.filter(id__in=creator_ids).order_by("last_name", "first_name", "username"))
+    facets = syllabus_facets(base_qs, SCOPE_ALL if allow_creator_filter else creator_scope(request.user))
 
+    page = keyset_paginate(request, syllabi, SYLLABUS_LIST_ORDERING)
     return render(
         request,
         "syllabi/syllabi_list.html",
         {
-            "syllabi": syllabi,
+            "syllabi": page.object_list,
+            "page": page,
             "filters": {"q": q, "status": status, "year": year, "course": course, "creator": creator},
             "status_options": Syllabus.Status.choices,
-            "year_options": year_options,
-            "course_options": course_options,
-            "creator_options": creator_options,
+            "year_options": facets["years"],
+            "course_options": facets["courses"],
+            "creator_options": facets["creators"] if allow_creator_filter else [],
             "allow_creator_filter": allow_creator_filter,
+            "can_rollover_year": _can_rollover_year(request.user),
+            "bulk_status_options": _bulk_status_options(request.user),
         },
     )
 
@@ -331,7 +329,7 @@ def shared_syllabi_list(request):
     if not request.user.can_view_shared_courses:
         raise PermissionDenied("Нет доступа к общим силлабусам.")
     """Общие силлабусы (только утвержденные)."""
-    base_qs = shared_syllabi_queryset(request.user).filter(status=Syllabus.Status.APPROVED).order_by("-updated_at")
+    base_qs = shared_syllabi_queryset(request.user).filter(status=Syllabus.Status.APPROVED)
 
     q = (request.GET.get("q") or "").strip()
     year = (request.GET.get("year") or "").strip()
@@ -340,17 +338,7 @@ def shared_syllabi_list(request):
 
     syllabi = base_qs
     if q:
-        syllabi = syllabi.filter(
-            Q(course__code__icontains=q)
-            | Q(course__title_ru__icontains=q)
-            | Q(course__title_kz__icontains=q)
-            | Q(course__title_en__icontains=q)
-            | Q(semester__icontains=q)
-            | Q(academic_year__icontains=q)
-            | Q(creator__first_name__icontains=q)
-            | Q(creator__last_name__icontains=q)
-            | Q(creator__username__icontains=q)
-        )
+        syllabi = syllabi.filter(pk__in=search_object_ids(SearchEntry.Kind.SYLLABUS, q))
     if year:
         syllabi = syllabi.filter(academic_year=year)
     if course:
@@ -358,22 +346,19 @@ def shared_syllabi_list(request):
     if creator:
         syllabi = syllabi.filter(creator_id=creator)
 
-    year_options = base_qs.values_list("academic_year", flat=True).distinct().order_by("-academic_year")
-    course_options = base_qs.values("course_id", "course__code").distinct().order_by("course__code")
-    
-    creator_ids = base_qs.values_list("creator_id", flat=True).distinct()
-    User = get_user_model()
-    creator_options = list(User.objects.filter(id__in=creator_ids).order_by("last_name", "first_name", "username"))
+    facets = syllabus_facets(base_qs, SCOPE_SHARED)
 
+    page = keyset_paginate(request, syllabi, SYLLABUS_LIST_ORDERING)
     return render(
         request,
         "syllabi/shared_syllabi_list.html",
         {
-            "syllabi": syllabi,
+            "syllabi": page.object_list,
+            "page": page,
             "filters": {"q": q, "year": year, "course": course, "creator": creator},
-            "year_options": year_options,
-            "course_options": course_options,
-            "creator_options": creator_options,
+            "year_options": facets["years"],
+            "course_options": facets["courses"],
+            "creator_options": facets["creators"],
         },
     )
 
@@ -490,6 +475,7 @@ def syllabus_detail(request, pk):
     )
     can_upload = (is_creator and not is_frozen and is_teacher_like) or (is_umu and is_frozen)
     can_share = is_creator and is_teacher_like
+    can_rollover = is_creator and is_teacher_like
     can_edit_constructor = (
         is_creator
         and is_teacher_like
@@ -523,6 +509,7 @@ def syllabus_detail(request, pk):
             "can_reject_umu": can_approve_umu,
             "can_upload": can_upload,
             "can_share": can_share,
+            "can_rollover": can_rollover,
             "can_edit_constructor": can_edit_constructor,
             "is_creator": is_creator,
             "learning_outcomes_list": _split_lines(syllabus.learning_outcomes),
@@ -554,11 +541,6 @@ def syllabus_edit_topics(request, pk):
     course_topics = list(
         Topic.objects.filter(course=syllabus.course, is_active=True).order_by("order_index", "id")
     )
-    existing_topics = {
-        st.topic_id: st
-        for st in syllabus.syllabus_topics.select_related("topic").filter(topic__is_active=True)
-    }
-
     if request.method == "POST":
         included_topic_ids = []
         explicit_weeks = {}
@@ -584,34 +566,18 @@ def syllabus_edit_topics(request, pk):
         used_weeks = {week for week in explicit_weeks.values() if week is not None}
         next_week = 1
 
-        with transaction.atomic():
-            syllabus.syllabus_topics.exclude(topic_id__in=included_topic_ids).delete()
-
-            for topic_id in included_topic_ids:
-                week_number = explicit_weeks.get(topic_id)
-                if week_number is None:
-                    while next_week in used_weeks:
-                        next_week += 1
-                    week_number = next_week
-                    used_weeks.add(week_number)
+        rows = {}
+        for topic_id in included_topic_ids:
+            week_number = explicit_weeks.get(topic_id)
+            if week_number is None:
+                while next_week in used_weeks:
                     next_week += 1
+                week_number = next_week
+                used_weeks.add(week_number)
+                next_week += 1
+            rows[topic_id] = {"week_number": week_number, "is_included": True, **payload_by_topic_id[topic_id]}
 
-                syllabus_topic = existing_topics.get(topic_id)
-                if syllabus_topic is None:
-                    syllabus_topic = SyllabusTopic(syllabus=syllabus, topic_id=topic_id)
-
-                payload = payload_by_topic_id[topic_id]
-                syllabus_topic.week_number = week_number
-                syllabus_topic.is_included = True
-                syllabus_topic.week_label = payload["week_label"]
-                syllabus_topic.custom_title = payload["custom_title"]
-                syllabus_topic.custom_hours = payload["custom_hours"]
-                syllabus_topic.tasks = payload["tasks"]
-                syllabus_topic.learning_outcomes = payload["learning_outcomes"]
-                syllabus_topic.literature_notes = payload["literature_notes"]
-                syllabus_topic.assessment = payload["assessment"]
-                syllabus_topic.save()
-
+        save_syllabus_topics(syllabus, rows, actor=request.user)
         SyllabusRevision.objects.create(
             syllabus=syllabus,
             changed_by=request.user,
@@ -621,6 +587,10 @@ def syllabus_edit_topics(request, pk):
         messages.success(request, "Темы силлабуса сохранены.")
         return redirect("syllabus_edit_details", pk=pk)
 
+    existing_topics = {
+        st.topic_id: st
+        for st in syllabus.syllabus_topics.select_related("topic").filter(topic__is_active=True)
+    }
     topic_rows = []
     for topic in course_topics:
         existing = existing_topics.get(topic.id)
@@ -682,6 +652,96 @@ def syllabus_edit_details(request, pk):
     )
 
 
+def _can_export_syllabi(user) -> bool:
+    return bool(user.is_superuser or user.role in ["dean", "umu", "admin"])
+
+
+def _export_filters(request) -> dict:
+    return {
+        key: (request.GET.get(key) or "").strip()
+        for key in ("year", "semester", "faculty", "status")
+    }
+
+
+@login_required
+def syllabi_export(request):
+    """ZIP with every syllabus file matching the filters, streamed as it is built."""
+    if not _can_export_syllabi(request.user):
+        raise PermissionDenied("Нет доступа к экспорту силлабусов.")
+    filters = _export_filters(request)
+    syllabi = export_queryset(filters)
+    name_parts = [filters[key].replace(" ", "_") for key in ("year", "semester", "faculty") if filters[key]]
+    file_name = "-".join(["syllabi", *name_parts]) + ".zip"
+    response = StreamingHttpResponse(iter_zip(syllabi), content_type="application/zip")
+    response["Content-Disposition"] = content_disposition_header(as_attachment=True, filename=file_name)
+    return response
+
+
+@login_required
+def syllabi_export_status(request):
+    """How many files of an export are ready; missing PDFs are rendered by the worker."""
+    if not _can_export_syllabi(request.user):
+        raise PermissionDenied("Нет доступа к экспорту силлабусов.")
+    return JsonResponse(export_progress(export_queryset(_export_filters(request))))
+
+
+def _can_rollover_year(user) -> bool:
+    return bool(user.is_superuser or user.role in ["umu", "admin"])
+
+
+@login_required
+@teacher_like_required
+def syllabus_rollover(request, pk):
+    """Copy a syllabus with its topics into a new semester as a draft."""
+    syllabus = get_object_or_404(Syllabus.objects.select_related("course"), pk=pk)
+    if request.user != syllabus.creator:
+        raise PermissionDenied("Недостаточно прав.")
+
+    if request.method == "POST":
+        form = SyllabusRolloverForm(request.POST)
+        if form.is_valid():
+            result = rollover_syllabi(
+                [syllabus],
+                form.cleaned_data["academic_year"],
+                form.cleaned_data["semester"],
+                actor=request.user,
+            )
+            if result["created"]:
+                messages.success(request, "Силлабус перенесен в новый семестр как черновик.")
+                return redirect("syllabus_detail", pk=result["created"][0].pk)
+            form.add_error(None, "Силлабус по этой дисциплине на выбранный семестр уже существует.")
+    else:
+        form = SyllabusRolloverForm()
+    return render(request, "syllabi/rollover.html", {"form": form, "syllabus": syllabus})
+
+
+@login_required
+def syllabi_rollover_year(request):
+    """UMU: roll every approved syllabus of an academic year forward."""
+    if not _can_rollover_year(request.user):
+        raise PermissionDenied("Нет доступа к переносу силлабусов.")
+
+    if request.method == "POST":
+        form = YearRolloverForm(request.POST)
+        if form.is_valid():
+            data = form.cleaned_data
+            result = rollover_syllabi(
+                year_rollover_queryset(data["source_academic_year"], data["source_semester"]),
+                data["academic_year"],
+                data["semester"],
+                actor=request.user,
+            )
+            messages.success(
+                request,
+                f"Перенесено силлабусов: {len(result['created'])}. "
+                f"Пропущено (копия уже существует): {result['skipped']}.",
+            )
+            return redirect("syllabi_list")
+    else:
+        form = YearRolloverForm()
+    return render(request, "syllabi/rollover.html", {"form": form})
+
+
 @login_required
 def syllabus_pdf(request, pk):
     syllabus = get_object_or_404(Syllabus, pk=pk)
@@ -689,7 +749,7 @@ def syllabus_pdf(request, pk):
         raise PermissionDenied("Нет доступа к этому силлабусу.")
     if syllabus.pdf_file:
         return redirect(syllabus.pdf_file.url)
-    return generate_syllabus_pdf(syllabus)
+    return serve_syllabus_pdf(syllabus, request)
 
 
 @login_required
@@ -730,6 +790,10 @@ def syllabus_change_status(request, pk, new_status):
             messages.success(request, "Статус силлабуса обновлен.")
         except (PermissionDenied, ValueError) as exc:
             messages.error(request, str(exc) or "Недостаточно прав.")
+    return _redirect_back(request, reverse("syllabus_detail", args=[syllabus.pk]))
+
+
+def _redirect_back(request, fallback: str):
     redirect_candidates = [
         request.POST.get("next", "").strip(),
         request.GET.get("next", "").strip(),
@@ -743,7 +807,51 @@ def syllabus_change_status(request, pk, new_status):
         ):
             return redirect(candidate)
 
-    return redirect(reverse("syllabus_detail", args=[syllabus.pk]))
+    return redirect(fallback)
+
+
+def _bulk_status_options(user) -> list[tuple[str, str]]:
+    """Batch transitions offered to a reviewer; the service re-checks each item."""
+    is_admin = user.is_superuser or user.is_admin_like
+    options = []
+    if is_admin or user.role == "dean":
+        options.append((Syllabus.Status.REVIEW_UMU, "Согласовать и передать в УМУ"))
+    if is_admin or user.role == "umu":
+        options.append((Syllabus.Status.APPROVED, "Утвердить"))
+    if options:
+        options += [
+            (Syllabus.Status.CORRECTION, "Вернуть на доработку"),
+            (Syllabus.Status.REJECTED, "Отклонить"),
+        ]
+    return options
+
+
+@login_required
+@require_POST
+def syllabi_bulk_status(request):
+    """Apply one review decision to the selected syllabi and report per item."""
+    if not _bulk_status_options(request.user):
+        raise PermissionDenied("Недостаточно прав.")
+    ids = [int(value) for value in request.POST.getlist("syllabus_ids") if value.isdigit()]
+    results = change_status_bulk(
+        request.user,
+        ids,
+        request.POST.get("new_status", ""),
+        request.POST.get("comment", ""),
+    )
+
+    if "application/json" in request.headers.get("Accept", ""):
+        return JsonResponse({"results": results})
+
+    succeeded = sum(1 for item in results if item["ok"])
+    if succeeded:
+        messages.success(request, f"Статус обновлен у силлабусов: {succeeded}.")
+    for item in results:
+        if not item["ok"]:
+            messages.error(request, f"{item['label'] or item['id']}: {item['error']}")
+    if not results:
+        messages.warning(request, "Не выбрано ни одного силлабуса.")
+    return _redirect_back(request, reverse("syllabi_list"))
 
 
 @login_required
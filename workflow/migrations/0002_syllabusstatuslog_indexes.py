@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workflow", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="syllabusstatuslog",
+            index=models.Index(
+                fields=["syllabus", "to_status", "-changed_at"],
+                name="statuslog_syllabus_to_idx",
+            ),
+        ),
+    ]
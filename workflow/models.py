@@ -23,6 +23,12 @@ class SyllabusStatusLog(models.Model):
 
     class Meta:
         ordering = ["-changed_at"]
+        indexes = [
+            models.Index(
+                fields=["syllabus", "to_status", "-changed_at"],
+                name="statuslog_syllabus_to_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.syllabus_id}, {self.from_status} -> {self.to_status}"
@@ -3,11 +3,15 @@ import logging
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import PermissionDenied
-from django.core.mail import send_mail
+from django.core.mail import send_mail, send_mass_mail
 from django.db import transaction
 
-from core.notifications import create_notifications_for_status_log
+from core.dashboard import invalidate_dashboard
+from core.notifications import create_notifications_for_status_log, create_notifications_for_status_logs
+from syllabi.facets import invalidate_facets
 from syllabi.models import Syllabus
+from syllabi.pdf_cache import invalidate_syllabus_pdf
+from syllabi.pdf_jobs import PRERENDER_STATUSES, enqueue_pdf_render, enqueue_pdf_renders
 
 from .models import SyllabusAuditLog, SyllabusStatusLog
 
@@ -15,6 +19,20 @@ logger = logging.getLogger(__name__)
 User = get_user_model()
 _ALLOWED_STATUSES = {choice[0] for choice in Syllabus.Status.choices}
 _REVIEW_STATUSES = {Syllabus.Status.REVIEW_DEAN, Syllabus.Status.REVIEW_UMU}
+# Subject and opening line of the one email per recipient sent after a batch transition.
+_BATCH_EMAIL_TEXT = {
+    Syllabus.Status.REVIEW_DEAN: ("Требуется согласование декана", "Силлабусы отправлены на ваше согласование:"),
+    Syllabus.Status.REVIEW_UMU: (
+        "Требуется финальная проверка УМУ",
+        "Декан согласовал силлабусы. Требуется финальная проверка УМУ:",
+    ),
+    Syllabus.Status.APPROVED: ("Силлабусы утверждены", "Ваши силлабусы официально утверждены:"),
+    Syllabus.Status.CORRECTION: ("Силлабусы возвращены на доработку", "Ваши силлабусы возвращены на доработку:"),
+    Syllabus.Status.REJECTED: (
+        "Силлабусы отклонены",
+        "Ваши силлабусы отклонены и переведены в архивный статус:",
+    ),
+}
 
 
 def _reviewer_label(user) -> str:
@@ -122,17 +140,22 @@ def _notify_on_status_change(syllabus: Syllabus, new_status: str, comment: str =
         logger.error("Notification block error: %s", exc)
 
 
-def change_status(user, syllabus: Syllabus, new_status: str, comment: str = ""):
+def _enqueue_prerender(syllabus: Syllabus, new_status: str) -> None:
+    """Render the PDF in the worker before anyone downloads it (uploaded files are served as-is)."""
+    if new_status not in PRERENDER_STATUSES or syllabus.pdf_file:
+        return
+    try:
+        enqueue_pdf_render(syllabus)
+    except Exception as exc:
+        logger.error("PDF prerender enqueue error: %s", exc)
+
+
+def _validate_transition(user, syllabus: Syllabus, new_status: str, comment: str) -> str:
     """
-    Main status transition function.
-    1. Validates permissions.
-    2. Updates status.
-    3. Writes status/audit logs.
-    4. Sends notifications.
+    Check that ``user`` may move ``syllabus`` to ``new_status``.
+    Returns the (normalized) current status; raises PermissionDenied or ValueError.
     """
     old_status = Syllabus.normalize_status(syllabus.status)
-    new_status = Syllabus.normalize_status(str(new_status))
-    comment = (comment or "").strip()
 
     if new_status not in _ALLOWED_STATUSES:
         raise ValueError("Недопустимый целевой статус.")
@@ -153,7 +176,7 @@ def change_status(user, syllabus: Syllabus, new_status: str, comment: str = ""):
     is_creator = user == syllabus.creator
 
     if new_status == old_status:
-        return syllabus
+        return old_status
 
     if new_status == Syllabus.Status.REVIEW_DEAN:
         if not (is_creator or is_admin):
@@ -202,6 +225,30 @@ def change_status(user, syllabus: Syllabus, new_status: str, comment: str = ""):
     else:
         raise PermissionDenied("Ручной переход в этот статус запрещен.")
 
+    return old_status
+
+
+def _status_audit_message(user, old_status: str, new_status: str) -> str:
+    if new_status == Syllabus.Status.CORRECTION:
+        return f"Returned for correction by {_reviewer_label(user)}"
+    return f"Status changed: {_status_label(old_status)} -> {_status_label(new_status)}"
+
+
+def change_status(user, syllabus: Syllabus, new_status: str, comment: str = ""):
+    """
+    Main status transition function.
+    1. Validates permissions.
+    2. Updates status.
+    3. Writes status/audit logs.
+    4. Sends notifications.
+    """
+    new_status = Syllabus.normalize_status(str(new_status))
+    comment = (comment or "").strip()
+    old_status = _validate_transition(user, syllabus, new_status, comment)
+
+    if new_status == old_status:
+        return syllabus
+
     with transaction.atomic():
         syllabus.status = new_status
         syllabus.save(update_fields=["status"])
@@ -219,13 +266,12 @@ def change_status(user, syllabus: Syllabus, new_status: str, comment: str = ""):
             actor=user,
             action=SyllabusAuditLog.Action.STATUS_CHANGED,
             metadata={"from": old_status, "to": new_status},
-            message=(
-                f"Status changed: {_status_label(old_status)} -> {_status_label(new_status)}"
-                if new_status != Syllabus.Status.CORRECTION
-                else f"Returned for correction by {_reviewer_label(user)}"
-            ),
+            message=_status_audit_message(user, old_status, new_status),
         )
 
+    invalidate_dashboard()
+    _enqueue_prerender(syllabus, new_status)
+
     try:
         create_notifications_for_status_log(status_log)
     except Exception as exc:
@@ -290,6 +336,9 @@ def change_status_system(
             ),
         )
 
+    invalidate_dashboard()
+    _enqueue_prerender(syllabus, new_status)
+
     try:
         create_notifications_for_status_log(status_log)
     except Exception as exc:
@@ -297,3 +346,126 @@ def change_status_system(
 
     _notify_on_status_change(syllabus, new_status, comment)
     return syllabus
+
+
+def _grouped_status_emails(syllabi: list[Syllabus], new_status: str, comment: str) -> list[tuple]:
+    """One (subject, message, from, [recipient]) per recipient, listing all of their syllabi."""
+    text = _BATCH_EMAIL_TEXT.get(new_status)
+    if text is None:
+        return []
+    subject, intro = text
+
+    lines_by_email: dict[str, list[str]] = {}
+    if new_status in (Syllabus.Status.REVIEW_DEAN, Syllabus.Status.REVIEW_UMU):
+        role_emails = _collect_role_emails("dean" if new_status == Syllabus.Status.REVIEW_DEAN else "umu")
+        for syllabus in syllabi:
+            author = syllabus.creator.get_full_name() or syllabus.creator.username
+            line = f"- {syllabus.course.code} {syllabus.course.display_title} ({author})"
+            for email in role_emails:
+                lines_by_email.setdefault(email, []).append(line)
+    else:
+        for syllabus in syllabi:
+            if syllabus.creator.email:
+                line = f"- {syllabus.course.code} {syllabus.course.display_title} ({syllabus.semester})"
+                lines_by_email.setdefault(syllabus.creator.email, []).append(line)
+
+    from_email = getattr(settings, "DEFAULT_FROM_EMAIL", "noreply@almau.edu.kz")
+    footer = f"\n\nКомментарий:\n{comment}" if comment else ""
+    return [
+        (
+            f"{subject} ({len(lines)})",
+            intro + "\n" + "\n".join(lines) + footer + "\n\n--\nAlmaU Syllabus System",
+            from_email,
+            [email],
+        )
+        for email, lines in lines_by_email.items()
+    ]
+
+
+def _send_grouped_emails(messages: list[tuple]) -> None:
+    try:
+        send_mass_mail(messages, fail_silently=True)
+        logger.info("Batch notification sent to %d recipient(s).", len(messages))
+    except Exception as exc:
+        logger.error("Email notification error: %s", exc)
+
+
+def change_status_bulk(user, syllabus_ids, new_status: str, comment: str = "") -> list[dict]:
+    """
+    Apply one transition to many syllabi.
+
+    Every item is checked with the same rules as ``change_status``; items that
+    fail are reported and skipped. The rest are updated with one UPDATE, their
+    status/audit logs and notifications are bulk-inserted, and each recipient
+    gets one email (sent after commit) listing all of their syllabi.
+    Returns ``[{"id", "label", "ok", "status", "error"}]`` in input order.
+    """
+    new_status = Syllabus.normalize_status(str(new_status))
+    comment = (comment or "").strip()
+    ids = list(dict.fromkeys(syllabus_ids))
+    syllabi = Syllabus.objects.select_related("course", "creator").in_bulk(ids)
+
+    results: dict[int, dict] = {}
+    changed: list[tuple[Syllabus, str]] = []
+    for pk in ids:
+        syllabus = syllabi.get(pk)
+        if syllabus is None:
+            results[pk] = {"id": pk, "label": "", "ok": False, "status": "", "error": "Силлабус не найден."}
+            continue
+        result = {"id": pk, "label": f"{syllabus.course.code} ({syllabus.semester})"}
+        try:
+            old_status = _validate_transition(user, syllabus, new_status, comment)
+        except (PermissionDenied, ValueError) as exc:
+            results[pk] = {**result, "ok": False, "status": syllabus.status, "error": str(exc) or "Недостаточно прав."}
+            continue
+        results[pk] = {**result, "ok": True, "status": new_status, "error": ""}
+        if old_status != new_status:
+            changed.append((syllabus, old_status))
+
+    if not changed:
+        return [results[pk] for pk in ids]
+
+    with transaction.atomic():
+        Syllabus.objects.filter(pk__in=[syllabus.pk for syllabus, _old in changed]).update(status=new_status)
+        status_logs = SyllabusStatusLog.objects.bulk_create(
+            SyllabusStatusLog(
+                syllabus=syllabus,
+                from_status=old_status,
+                to_status=new_status,
+                changed_by=user,
+                comment=comment,
+            )
+            for syllabus, old_status in changed
+        )
+        SyllabusAuditLog.objects.bulk_create(
+            SyllabusAuditLog(
+                syllabus=syllabus,
+                actor=user,
+                action=SyllabusAuditLog.Action.STATUS_CHANGED,
+                metadata={"from": old_status, "to": new_status, "batch": True},
+                message=_status_audit_message(user, old_status, new_status),
+            )
+            for syllabus, old_status in changed
+        )
+        emails = _grouped_status_emails([syllabus for syllabus, _old in changed], new_status, comment)
+        if emails:
+            transaction.on_commit(lambda: _send_grouped_emails(emails))
+
+    # QuerySet.update() sends no post_save: do what the syllabus signals would have.
+    invalidate_facets()
+    invalidate_dashboard()
+    for syllabus, _old in changed:
+        syllabus.status = new_status
+        invalidate_syllabus_pdf(syllabus.pk)
+    if new_status in PRERENDER_STATUSES:
+        try:
+            enqueue_pdf_renders(syllabus for syllabus, _old in changed if not syllabus.pdf_file)
+        except Exception as exc:
+            logger.error("PDF prerender enqueue error: %s", exc)
+
+    try:
+        create_notifications_for_status_logs(status_logs)
+    except Exception as exc:
+        logger.error("Notification record error: %s", exc)
+
+    return [results[pk] for pk in ids]
@@ -1,11 +1,14 @@
 from django.contrib.auth import get_user_model
+from django.core import mail
 from django.core.exceptions import PermissionDenied
 from django.test import TestCase
+from django.urls import reverse
 
 from catalog.models import Course
-from syllabi.models import Syllabus
+from core.models import Notification
+from syllabi.models import PdfRenderJob, Syllabus
 from workflow.models import SyllabusAuditLog, SyllabusStatusLog
-from workflow.services import change_status, change_status_system
+from workflow.services import change_status, change_status_bulk, change_status_system
 
 User = get_user_model()
 
@@ -205,3 +208,110 @@ class WorkflowRoleTests(TestCase):
         syllabus.refresh_from_db()
         self.assertEqual(syllabus.status, Syllabus.Status.CORRECTION)
         self.assertEqual(syllabus.ai_feedback, "<p>AI baseline feedback</p>")
+
+    def test_approval_queues_pdf_prerender(self):
+        teacher = self._create_user("teacher_prerender", "teacher")
+        umu = self._create_user("umu_prerender", "umu")
+        course = self._create_course(teacher, code="CS407")
+        syllabus = Syllabus.objects.create(
+            course=course,
+            creator=teacher,
+            semester="Fall 2025",
+            academic_year="2025-2026",
+            status=Syllabus.Status.REVIEW_UMU,
+        )
+
+        change_status(umu, syllabus, Syllabus.Status.APPROVED, "ok")
+
+        job = PdfRenderJob.objects.get(syllabus=syllabus)
+        self.assertEqual(job.status, PdfRenderJob.Status.PENDING)
+        self.assertEqual(job.version_number, syllabus.version_number)
+
+
+class BulkStatusTests(TestCase):
+    def setUp(self):
+        self.umu = User.objects.create_user(username="bulk_umu", password="pass1234", role="umu")
+        self.dean = User.objects.create_user(
+            username="bulk_dean", password="pass1234", role="dean", email="dean@example.com"
+        )
+        self.teacher = User.objects.create_user(
+            username="bulk_teacher", password="pass1234", role="teacher", email="teacher@example.com"
+        )
+        course = Course.objects.create(owner=self.teacher, code="BLK101", available_languages="ru")
+        self.in_review = [
+            Syllabus.objects.create(
+                course=course,
+                creator=self.teacher,
+                semester=f"Term {index}",
+                academic_year="2025-2026",
+                status=Syllabus.Status.REVIEW_UMU,
+            )
+            for index in range(5)
+        ]
+        self.draft = Syllabus.objects.create(
+            course=course,
+            creator=self.teacher,
+            semester="Draft term",
+            academic_year="2025-2026",
+            status=Syllabus.Status.DRAFT,
+        )
+
+    def test_bulk_approval_reports_per_item_and_groups_email(self):
+        ids = [syllabus.pk for syllabus in self.in_review] + [self.draft.pk, 999999]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            results = change_status_bulk(self.umu, ids, Syllabus.Status.APPROVED)
+
+        self.assertEqual([item["ok"] for item in results], [True] * 5 + [False, False])
+        self.assertEqual(results[5]["error"], "Силлабус должен быть в статусе согласования УМУ.")
+        self.assertEqual(results[6]["error"], "Силлабус не найден.")
+        self.assertEqual(Syllabus.objects.filter(status=Syllabus.Status.APPROVED).count(), 5)
+        self.assertEqual(SyllabusStatusLog.objects.filter(to_status=Syllabus.Status.APPROVED).count(), 5)
+        self.assertEqual(SyllabusAuditLog.objects.filter(metadata__batch=True).count(), 5)
+        self.assertEqual(Notification.objects.filter(recipient=self.teacher).count(), 5)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["teacher@example.com"])
+        self.assertIn("(5)", mail.outbox[0].subject)
+        self.assertEqual(PdfRenderJob.objects.count(), 5)
+
+    def test_bulk_correction_requires_comment_like_single_transition(self):
+        results = change_status_bulk(self.umu, [self.in_review[0].pk], Syllabus.Status.CORRECTION)
+
+        self.assertFalse(results[0]["ok"])
+        self.assertEqual(results[0]["error"], "При возврате на доработку нужен комментарий.")
+
+    def test_bulk_writes_do_not_scale_with_item_count(self):
+        ids = [syllabus.pk for syllabus in self.in_review]
+
+        with self.assertNumQueries(9):
+            change_status_bulk(self.umu, ids, Syllabus.Status.APPROVED)
+
+    def test_bulk_view_returns_json_results(self):
+        self.client.force_login(self.umu)
+        response = self.client.post(
+            reverse("syllabi_bulk_status"),
+            {"syllabus_ids": [self.in_review[0].pk, self.draft.pk], "new_status": Syllabus.Status.APPROVED},
+            HTTP_ACCEPT="application/json",
+        )
+
+        results = response.json()["results"]
+        self.assertEqual([item["ok"] for item in results], [True, False])
+
+    def test_bulk_view_redirects_with_messages(self):
+        self.client.force_login(self.umu)
+        response = self.client.post(
+            reverse("syllabi_bulk_status"),
+            {"syllabus_ids": [self.in_review[0].pk], "new_status": Syllabus.Status.APPROVED},
+            follow=True,
+        )
+
+        self.assertContains(response, "Статус обновлен у силлабусов: 1.")
+
+    def test_teacher_cannot_use_bulk_view(self):
+        self.client.force_login(self.teacher)
+        response = self.client.post(
+            reverse("syllabi_bulk_status"),
+            {"syllabus_ids": [self.in_review[0].pk], "new_status": Syllabus.Status.APPROVED},
+        )
+
+        self.assertEqual(response.status_code, 403)